@@ -0,0 +1,147 @@
+"""
+Picks the fastest training layout for this host and writes it for train_ai.py.
+
+Two short measurements:
+  1. collection  env steps/s of every candidate VecEnv layout (DummyVecEnv,
+                 SubprocVecEnv, BatchedSubprocVecEnv with k envs per worker)
+                 for each env count, including policy inference per step
+  2. update      wall time of one PPO update (model.train() on a full
+                 ROLLOUT_STEPS buffer) for each torch thread count
+
+The layout with the lowest estimated time per PPO iteration
+(rollout / collection rate + update) is saved to train_layout.json.
+
+    python autotune.py
+    python autotune.py --env-counts 4 8 16 --threads 1 2 4 --min-time 5
+    python autotune.py --rollout 4096 --dry-run
+"""
+import os
+import time
+import argparse
+import platform
+import numpy as np
+import torch
+from config import *
+from core.vec_env import make_layout_vec_env, save_layout
+
+def candidate_layouts(env_counts, cpus):
+    """Every (vec_env, num_envs, envs_per_worker) worth measuring."""
+    layouts = []
+    for n in env_counts:
+        layouts.append({"vec_env": "dummy", "num_envs": n, "envs_per_worker": n})
+        if n > 1:
+            layouts.append({"vec_env": "subproc", "num_envs": n, "envs_per_worker": 1})
+        # Batched: 2+ workers, no more workers than cores, k > 1 envs each
+        for workers in range(2, min(cpus, n // 2) + 1):
+            if n % workers == 0:
+                layouts.append({"vec_env": "batched", "num_envs": n, "envs_per_worker": n // workers})
+    return layouts
+
+def measure_collection(layout, rollout, min_time, seed):
+    """Env steps/s of a layout, stepping with the (untrained) policy's actions."""
+    from stable_baselines3 import PPO
+    from train_ai import make_env, PPO_KWARGS
+
+    venv = make_layout_vec_env(make_env, layout, seed=seed)
+    try:
+        model = PPO("MlpPolicy", venv, n_steps=max(rollout // layout["num_envs"], 1), **PPO_KWARGS)
+        obs = venv.reset()
+        for _ in range(3):      # warm up workers and torch
+            obs = venv.step(model.policy.predict(obs)[0])[0]
+        steps = 0
+        t0 = time.perf_counter()
+        while time.perf_counter() - t0 < min_time:
+            obs = venv.step(model.policy.predict(obs)[0])[0]
+            steps += 1
+        return steps * layout["num_envs"] / (time.perf_counter() - t0)
+    finally:
+        venv.close()
+
+def measure_updates(thread_counts, rollout, seed, repeats):
+    """{threads: seconds per PPO update} on one filled rollout buffer."""
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.vec_env import DummyVecEnv
+    from train_ai import make_env, PPO_KWARGS
+
+    venv = DummyVecEnv([make_env])
+    venv.seed(seed)
+    model = PPO("MlpPolicy", venv, n_steps=rollout, **PPO_KWARGS)
+    # One learn() call fills the buffer and sets up the logger; train() then
+    # reruns the same update (same epochs and minibatches) for timing
+    model.learn(total_timesteps=rollout)
+    venv.close()
+
+    saved = torch.get_num_threads()
+    times = {}
+    for threads in thread_counts:
+        torch.set_num_threads(threads)
+        samples = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            model.train()
+            samples.append(time.perf_counter() - t0)
+        times[threads] = float(np.median(samples))
+    torch.set_num_threads(saved)
+    return times
+
+def powers_of_two(limit):
+    out, n = [], 1
+    while n <= limit:
+        out.append(n)
+        n *= 2
+    return out
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--env-counts", type=int, nargs="+", default=powers_of_two(max(2 * cpus, 4)))
+    parser.add_argument("--threads", type=int, nargs="+", default=powers_of_two(cpus))
+    parser.add_argument("--rollout", type=int, default=ROLLOUT_STEPS, help="env steps per PPO update")
+    parser.add_argument("--min-time", type=float, default=3.0, help="seconds per layout")
+    parser.add_argument("--update-repeats", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=TRAIN_LAYOUT_FILE)
+    parser.add_argument("--dry-run", action="store_true", help="print the choice, don't write it")
+    args = parser.parse_args()
+
+    # Single-threaded torch while collecting, as the env processes need the cores
+    torch.set_num_threads(1)
+    layouts = [l for l in candidate_layouts(args.env_counts, cpus) if args.rollout // l["num_envs"] >= 1]
+    print(f"AUTOTUNE: {len(layouts)} layouts, {cpus} CPUs, rollout {args.rollout}")
+
+    print(f"\n{'vec_env':<10s}{'envs':>6s}{'per worker':>12s}{'steps/s':>10s}")
+    for layout in layouts:
+        layout["steps_per_s"] = measure_collection(layout, args.rollout, args.min_time, args.seed)
+        print(f"{layout['vec_env']:<10s}{layout['num_envs']:>6d}{layout['envs_per_worker']:>12d}{layout['steps_per_s']:>10.1f}")
+    best = max(layouts, key=lambda l: l["steps_per_s"])
+
+    updates = measure_updates(args.threads, args.rollout, args.seed, args.update_repeats)
+    print(f"\n{'threads':<10s}{'update s':>10s}")
+    for threads, s in updates.items():
+        print(f"{threads:<10d}{s:>10.2f}")
+    threads = min(updates, key=updates.get)
+
+    collect_s = args.rollout / best["steps_per_s"]
+    chosen = {
+        "vec_env": best["vec_env"],
+        "num_envs": best["num_envs"],
+        "envs_per_worker": best["envs_per_worker"],
+        "torch_threads": threads,
+        "rollout": args.rollout,
+        "n_steps": max(args.rollout // best["num_envs"], 1),
+        "measured": {
+            "steps_per_s": best["steps_per_s"],
+            "collect_s": collect_s,
+            "update_s": updates[threads],
+            "iteration_s": collect_s + updates[threads],
+        },
+        "host": platform.node(),
+        "cpus": cpus,
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    print(f"\nCHOSEN: {chosen['vec_env']} {chosen['num_envs']} envs x{chosen['envs_per_worker']}/worker, "
+          f"{threads} torch threads, n_steps {chosen['n_steps']} "
+          f"(~{chosen['measured']['iteration_s']:.1f} s per {args.rollout}-step iteration)")
+    if args.dry_run: raise SystemExit
+    save_layout(chosen, args.out)
+    print(f"--- SAVED: {args.out} ---")
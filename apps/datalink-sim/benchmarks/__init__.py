@@ -0,0 +1 @@
+# Init
\ No newline at end of file
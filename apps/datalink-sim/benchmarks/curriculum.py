@@ -0,0 +1,115 @@
+"""
+Adaptive difficulty curriculum vs fixed difficulty: wall-clock time to a
+target success rate.
+
+Both arms train the same PPO setup (train_ai.PPO_KWARGS, DummyVecEnv, one
+torch thread) from the same seed, one after the other on this machine:
+  fixed      every episode on --target-difficulty (train_ai.py's default)
+  adaptive   EASY -> MEDIUM -> HARD through CurriculumBlock/CurriculumManager
+Every --eval-every timesteps the policy is evaluated on a fixed, held-out
+set of --target-difficulty worlds; evaluation time is not counted. An arm
+stops at the target success rate or after --budget seconds of training.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.curriculum --budget 3600 --target 0.5
+    python -m benchmarks.curriculum --budget 120 --eval-every 2048 --eval-episodes 5
+"""
+import argparse
+import json
+import os
+import random
+import time
+from functools import partial
+import numpy as np
+from config import *
+from core.world_bank import WorldBank, build_world_bank
+
+DIFFICULTIES = {"EASY": DIFF_EASY, "MEDIUM": DIFF_MEDIUM, "HARD": DIFF_HARD}
+
+
+def make_env(difficulty=None, curriculum=None):
+    from stable_baselines3.common.monitor import Monitor
+    from core.environment import RoverEnv
+    env = RoverEnv(curriculum=curriculum)
+    if difficulty is not None: env.current_difficulty = difficulty
+    return Monitor(env)
+
+
+def run_arm(name, args, eval_bank):
+    import torch
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.vec_env import DummyVecEnv
+    from core.curriculum import CurriculumBlock, CurriculumManager
+    from core.callbacks import CurriculumCallback
+    from train_ai import PPO_KWARGS
+    from sweep import evaluate_success
+    torch.set_num_threads(1)
+
+    block = callback = None
+    if name == "adaptive":
+        block = CurriculumBlock()
+        callback = CurriculumCallback(CurriculumManager(block, min_episodes=args.min_episodes))
+        env_fn = partial(make_env, curriculum=block)
+    else:
+        env_fn = partial(make_env, difficulty=DIFFICULTIES[args.target_difficulty])
+
+    random.seed(args.seed)
+    venv = DummyVecEnv([env_fn] * args.n_envs)
+    venv.seed(args.seed)
+    model = PPO("MlpPolicy", venv, n_steps=max(ROLLOUT_STEPS // args.n_envs, 1), seed=args.seed, **PPO_KWARGS)
+
+    train_s = 0.0
+    curve = []
+    reached = None
+    while train_s < args.budget:
+        t0 = time.perf_counter()
+        model.learn(args.eval_every, reset_num_timesteps=False, callback=callback)
+        train_s += time.perf_counter() - t0
+        success = evaluate_success(model.policy, eval_bank, len(eval_bank), args.seed)
+        level = callback.manager.level if callback else None
+        curve.append({"train_s": train_s, "timesteps": model.num_timesteps, "success": success, "level": level})
+        print(f"[{name}] {train_s:7.0f} s  {model.num_timesteps:>8d} steps  success {success:.0%}"
+              + (f"  level {level}" if level is not None else ""), flush=True)
+        if success >= args.target:
+            reached = train_s
+            break
+
+    venv.close()
+    if block is not None: block.close(unlink=True)
+    return {"arm": name, "time_to_target_s": reached, "final_success": curve[-1]["success"],
+            "timesteps": model.num_timesteps, "curve": curve}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--arms", nargs="+", choices=["fixed", "adaptive"], default=["fixed", "adaptive"])
+    parser.add_argument("--target", type=float, default=0.5, help="eval success rate to reach")
+    parser.add_argument("--target-difficulty", choices=list(DIFFICULTIES), default="MEDIUM")
+    parser.add_argument("--budget", type=float, default=3600.0, help="training seconds per arm")
+    parser.add_argument("--n-envs", type=int, default=4)
+    parser.add_argument("--eval-every", type=int, default=20480, help="timesteps between evaluations")
+    parser.add_argument("--eval-episodes", type=int, default=20)
+    parser.add_argument("--min-episodes", type=int, default=50, help="episodes before the curriculum may move")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="curriculum_results.json")
+    args = parser.parse_args()
+
+    diff = DIFFICULTIES[args.target_difficulty]
+    bank_path = os.path.join(WORLD_BANK_DIR, f"{args.target_difficulty.lower()}_eval_s{args.seed}_n{args.eval_episodes}.npy")
+    if not os.path.exists(bank_path):
+        build_world_bank(bank_path, args.eval_episodes, diff, seed=10**6 + args.seed)
+    eval_bank = WorldBank(bank_path)
+
+    results = [run_arm(arm, args, eval_bank) for arm in args.arms]
+
+    print(f"\n{'arm':<10s}{'time to ' + format(args.target, '.0%'):>14s}{'final':>8s}{'steps':>10s}")
+    for r in results:
+        t = f">{args.budget:.0f} s" if r["time_to_target_s"] is None else f"{r['time_to_target_s']:.0f} s"
+        print(f"{r['arm']:<10s}{t:>14s}{r['final_success']:>8.0%}{r['timesteps']:>10d}")
+    with open(args.out, "w") as f:
+        json.dump({"args": vars(args), "results": results}, f, indent=2)
+    print(f"--- SAVED: {args.out} ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Clone-and-rollout throughput for RoverEnv.get_state() / set_state().
+
+Run from apps/datalink-sim:
+    python -m benchmarks.env_state --clones 200 --horizon 10
+"""
+import argparse
+import random
+import time
+import numpy as np
+from core.environment import RoverEnv
+
+
+def run(clones, horizon, seed):
+    random.seed(seed)
+    env = RoverEnv()
+    env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+
+    # Raw snapshot / restore cost
+    n = 5000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        root = env.get_state()
+    t_get = (time.perf_counter() - t0) / n
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        env.set_state(root)
+    t_set = (time.perf_counter() - t0) / n
+
+    # Lookahead: restore root, roll out a random action sequence, repeat
+    steps = 0
+    t0 = time.perf_counter()
+    for _ in range(clones):
+        env.set_state(root)
+        for _ in range(horizon):
+            action = rng.uniform(-1.0, 1.0, size=2)
+            _, _, done, _, _ = env.step(action)
+            steps += 1
+            if done: break
+    t_roll = time.perf_counter() - t0
+
+    # Determinism: same root + same actions must give the same observation
+    actions = rng.uniform(-1.0, 1.0, size=(horizon, 2))
+    results = []
+    for _ in range(2):
+        env.set_state(root)
+        for a in actions: obs, _, done, _, _ = env.step(a)
+        results.append(obs)
+    deterministic = bool(np.array_equal(results[0], results[1]))
+
+    return {
+        "get_state_per_sec": 1.0 / t_get,
+        "set_state_per_sec": 1.0 / t_set,
+        "rollouts_per_sec": clones / t_roll,
+        "rollout_steps_per_sec": steps / t_roll,
+        "deterministic": deterministic,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clones", type=int, default=200)
+    parser.add_argument("--horizon", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    res = run(args.clones, args.horizon, args.seed)
+    print(f"get_state        : {res['get_state_per_sec']:12.0f} /s")
+    print(f"set_state        : {res['set_state_per_sec']:12.0f} /s")
+    print(f"rollouts (h={args.horizon:<3}) : {res['rollouts_per_sec']:12.1f} /s")
+    print(f"rollout steps    : {res['rollout_steps_per_sec']:12.1f} /s")
+    print(f"deterministic    : {res['deterministic']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Batched inference server vs one predict() per caller.
+
+Each client thread drives its own RoverEnv (or, with --synthetic, submits
+random observations back to back, i.e. an env with zero step cost) and asks
+for an action every step. Compares per-caller predict() against the shared
+InferenceServer and prints batch-size / latency histograms. All clients
+are threads of this process: the server has no cross-process transport.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.inference_server --clients 1 8 32 --steps 200
+"""
+import argparse
+import threading
+import time
+import numpy as np
+from core.inference_server import InferenceServer
+
+
+def load_policy(kind, checkpoint):
+    if kind == "numpy":
+        import os, tempfile
+        from core.numpy_policy import NumpyPolicy, export_policy
+        path = os.path.join(tempfile.mkdtemp(), "policy.npz")
+        export_policy(checkpoint, path)
+        return NumpyPolicy(path)
+    from stable_baselines3 import PPO
+    return PPO.load(checkpoint, device="cpu")
+
+
+def drive(predict, clients, steps, synthetic, seed=0):
+    """Runs `clients` threads for `steps` each; returns total actions/s."""
+    def client(i):
+        rng = np.random.default_rng(seed + i)
+        if synthetic:
+            obs = rng.uniform(-1.0, 2.0, size=(steps, 56)).astype(np.float32)
+            for k in range(steps): predict(obs[k])
+            return
+        from core.environment import RoverEnv
+        env = RoverEnv()
+        o, _ = env.reset(seed=seed + i)
+        for _ in range(steps):
+            a, _ = predict(o)
+            o, _, done, _, _ = env.step(a)
+            if done: o, _ = env.reset()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    t0 = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return clients * steps / (time.perf_counter() - t0)
+
+
+def print_hist(title, hist, width=40):
+    print(f"  {title}")
+    top = max(hist.values())
+    for k, c in hist.items():
+        print(f"    {k:>8} {c:>8d} {'#' * max(1, int(width * c / top))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkpoint", default="models/PPO/ppo_rover_800000.zip")
+    parser.add_argument("--policy", choices=["sb3", "numpy"], default="sb3")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--steps", type=int, default=200, help="actions per client")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--synthetic", action="store_true", help="no env stepping, inference only")
+    parser.add_argument("--hist", action="store_true", help="print full histograms")
+    args = parser.parse_args()
+
+    policy = load_policy(args.policy, args.checkpoint)
+    lock = threading.Lock()     # direct predict() from many threads, serialised like one device
+
+    def direct(obs):
+        with lock: return policy.predict(obs, deterministic=True)
+
+    print(f"{'clients':>8s}{'direct':>14s}{'server':>14s}{'mean batch':>12s}{'p50':>10s}{'p95':>10s}{'p99':>10s}")
+    for n in args.clients:
+        d_rate = drive(direct, n, args.steps, args.synthetic)
+        # Thread clients only (InferenceServer is in-process)
+        server = InferenceServer(policy, max_batch=n, max_wait_ms=args.max_wait_ms).start()
+        s_rate = drive(server.predict, n, args.steps, args.synthetic)
+        server.stop()
+        st = server.stats()
+        print(f"{n:>8d}{d_rate:>10.0f} a/s{s_rate:>10.0f} a/s{st['mean_batch']:>12.1f}"
+              f"{st['latency_p50_us']:>8.0f}us{st['latency_p95_us']:>8.0f}us{st['latency_p99_us']:>8.0f}us")
+        if args.hist:
+            print_hist("batch size", st["batch_hist"])
+            print_hist("latency (us, bucket upper edge)", st["latency_hist_us"])
+
+
+if __name__ == "__main__":
+    main()
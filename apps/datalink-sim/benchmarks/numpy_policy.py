@@ -0,0 +1,70 @@
+"""
+Per-call latency and batch throughput: SB3 predict() vs the NumPy policy.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.numpy_policy --checkpoint models/PPO/ppo_rover_800000.zip
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from core.numpy_policy import WEIGHT_DTYPES, NumpyPolicy, export_policy
+
+
+def time_calls(fn, obs, min_time=0.5):
+    """Median seconds per fn(obs) call over ~min_time of repeats."""
+    fn(obs)
+    samples = []
+    t_end = time.perf_counter() + min_time
+    while time.perf_counter() < t_end or len(samples) < 20:
+        t0 = time.perf_counter()
+        fn(obs)
+        samples.append(time.perf_counter() - t0)
+    return float(np.median(samples))
+
+
+def run(checkpoint, batches, seed=0):
+    from stable_baselines3 import PPO
+    model = PPO.load(checkpoint, device="cpu")
+    rng = np.random.default_rng(seed)
+    space = model.observation_space
+
+    runners = {"sb3": lambda o: model.predict(o, deterministic=True)}
+    with tempfile.TemporaryDirectory() as tmp:
+        sizes = {}
+        for dtype in WEIGHT_DTYPES:
+            path = os.path.join(tmp, f"policy_{dtype}.npz")
+            export_policy(checkpoint, path, dtype)
+            sizes[dtype] = os.path.getsize(path)
+            runners[f"numpy-{dtype}"] = NumpyPolicy(path).predict
+
+    results = {}
+    for name, fn in runners.items():
+        single = rng.uniform(space.low, space.high).astype(np.float32)
+        row = {"latency_us": time_calls(fn, single) * 1e6}
+        for n in batches:
+            obs = rng.uniform(space.low, space.high, size=(n, space.shape[0])).astype(np.float32)
+            row[f"batch_{n}_obs_per_sec"] = n / time_calls(fn, obs)
+        results[name] = row
+    return results, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkpoint", default="models/PPO/ppo_rover_800000.zip")
+    parser.add_argument("--batches", type=int, nargs="+", default=[8, 64, 512])
+    args = parser.parse_args()
+
+    results, sizes = run(args.checkpoint, args.batches)
+    header = f"{'policy':<16s}{'1-obs call':>14s}" + "".join(f"{f'batch {n}':>16s}" for n in args.batches)
+    print(header)
+    for name, row in results.items():
+        line = f"{name:<16s}{row['latency_us']:>11.1f} us"
+        line += "".join(f"{row[f'batch_{n}_obs_per_sec']:>12.0f} o/s" for n in args.batches)
+        print(line)
+    print("export sizes    : " + ", ".join(f"{d} {s / 1024:.1f} KiB" for d, s in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
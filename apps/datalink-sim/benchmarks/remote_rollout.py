@@ -0,0 +1,81 @@
+"""
+RemoteVecEnv on localhost: starts a learner-side RemoteVecEnv plus N
+rollout_worker.py processes, steps them with random actions and prints
+per-worker throughput, network bytes per env step and round-trip time.
+
+With --churn one worker is killed halfway through and a new one started,
+to exercise leave/join (its envs end their episodes as truncated).
+
+Run from apps/datalink-sim:
+    python -m benchmarks.remote_rollout --workers 2 --envs-per-worker 4 --seconds 20
+    python -m benchmarks.remote_rollout --workers 3 --envs-per-worker 2 --churn
+"""
+import argparse
+import subprocess
+import sys
+import time
+import numpy as np
+from core.environment import RoverEnv
+from core.remote_vec_env import RemoteVecEnv
+
+
+def start_worker(port, envs, name):
+    return subprocess.Popen([sys.executable, "rollout_worker.py", "--learner", f"127.0.0.1:{port}",
+                             "--envs", str(envs), "--name", name, "--once", "--retry", "0.5"])
+
+
+def print_workers(rows, title):
+    print(f"\n{title}")
+    print(f"  {'worker':<12s}{'envs':>6s}{'steps':>8s}{'steps/s':>10s}{'bytes/step':>12s}{'rtt ms':>9s}")
+    for w in rows:
+        bps = "-" if w["bytes_per_step"] is None else f"{w['bytes_per_step']:.0f}"
+        rtt = "-" if w["round_trip_ms"] is None else f"{w['round_trip_ms']:.1f}"
+        print(f"  {w['name']:<12s}{w['envs']:>6d}{w['steps']:>8d}{w['steps_per_s']:>10.1f}{bps:>12s}{rtt:>9s}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--envs-per-worker", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--churn", action="store_true", help="replace one worker halfway through")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    n = args.workers * args.envs_per_worker
+    probe = RoverEnv()
+    venv = RemoteVecEnv(n, probe.observation_space, probe.action_space, port=0, join_timeout=120.0)
+    port = venv.address[1]
+    procs = {f"w{i}": start_worker(port, args.envs_per_worker, f"w{i}") for i in range(args.workers)}
+
+    rng = np.random.default_rng(args.seed)
+    try:
+        venv.seed(args.seed)
+        venv.reset()
+        steps = truncated = 0
+        churned = not args.churn
+        t0 = time.perf_counter()
+        while time.perf_counter() - t0 < args.seconds:
+            _, _, dones, infos = venv.step(rng.uniform(-1.0, 1.0, size=(n, 2)).astype(np.float32))
+            steps += n
+            truncated += sum(1 for d, info in zip(dones, infos) if d and info.get("TimeLimit.truncated"))
+            if not churned and time.perf_counter() - t0 > args.seconds / 2:
+                churned = True
+                print_workers(venv.worker_stats(), "BEFORE CHURN")
+                procs.pop("w0").kill()
+                procs["w0b"] = start_worker(port, args.envs_per_worker, "w0b")
+        dt = time.perf_counter() - t0
+        print_workers(venv.departed, "LEFT")
+        print_workers(venv.worker_stats(), "ACTIVE")
+        print(f"\nTOTAL: {steps / dt:.1f} env steps/s over {n} envs, {truncated} episodes truncated by churn")
+    finally:
+        venv.close()
+        for p in procs.values():
+            try:
+                p.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                p.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Rover draw cost: per-frame pygame.transform.rotate vs the pre-rotated atlas.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.rover_sprite --frames 5000 --step 2
+"""
+import argparse
+import time
+import pygame
+from config import *
+from entities.rover import Rover
+
+
+def run(frames, step):
+    surface = pygame.Surface((VIEWPORT_WIDTH, VIEWPORT_HEIGHT))
+    rover = Rover(VIEWPORT_WIDTH / 2, VIEWPORT_HEIGHT / 2, 0.0)
+    headings = [(i * 7.3) % 360 for i in range(frames)]
+
+    # Old path: rotate the base sprite every frame
+    base = Rover._create_rover_surface()
+    t0 = time.perf_counter()
+    for a in headings:
+        img = pygame.transform.rotate(base, -a)
+        surface.blit(img, img.get_rect(center=(rover.x, rover.y)))
+    t_rotate = (time.perf_counter() - t0) / frames
+
+    t0 = time.perf_counter()
+    Rover.build_atlas(step)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for a in headings:
+        rover.angle = a
+        rover.draw(surface)
+    t_atlas = (time.perf_counter() - t0) / frames
+
+    return {
+        "rotate_us_per_frame": t_rotate * 1e6,
+        "atlas_us_per_frame": t_atlas * 1e6,
+        "atlas_build_ms": t_build * 1e3,
+        "atlas_frames": len(Rover._atlas),
+        "speedup": t_rotate / t_atlas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--step", type=float, default=ROVER_SPRITE_STEP_DEG, help="atlas resolution in degrees")
+    args = parser.parse_args()
+
+    res = run(args.frames, args.step)
+    print(f"transform.rotate : {res['rotate_us_per_frame']:8.1f} us/frame")
+    print(f"atlas blit       : {res['atlas_us_per_frame']:8.1f} us/frame  ({res['speedup']:.1f}x)")
+    print(f"atlas build      : {res['atlas_build_ms']:8.1f} ms  ({res['atlas_frames']} frames)")
+
+
+if __name__ == "__main__":
+    main()
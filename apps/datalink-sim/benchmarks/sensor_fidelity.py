@@ -0,0 +1,98 @@
+"""
+RoverEnv step rate and sensor cost per sensor fidelity level
+(config.SENSOR_FIDELITY_LEVELS), plus how far each level's lidar and
+proximity readings are from the standard model's.
+
+Every level replays the same seeded worlds and random actions. The error
+columns compare each level's noise-free readings against a standard,
+noise-free SensorSuite on the same rover, in pixels:
+  lidar_err   mean |beam - reference beam|
+  prox_err    mean |zone - reference zone|
+
+Run from apps/datalink-sim:
+    python -m benchmarks.sensor_fidelity --steps 1000
+    python -m benchmarks.sensor_fidelity --levels coarse standard --out fidelity.json
+"""
+import argparse
+import json
+import random
+import time
+import numpy as np
+from config import *
+from core.environment import RoverEnv
+from sensors.sensor_suite import SensorSuite
+
+
+def run_steps(env, steps, seed, on_step=None):
+    random.seed(seed)
+    env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        _, _, done, _, _ = env.step(rng.uniform(-1.0, 1.0, size=2))
+        if on_step: on_step()
+        if done: env.reset()
+    return steps / (time.perf_counter() - t0)
+
+
+def measure_error(level, steps, seed):
+    env = RoverEnv(fidelity=level)
+    errors = {"lidar": [], "prox": []}
+
+    def compare():
+        s = env.sensors
+        ref = SensorSuite(env.rover)
+        ref.lidar.noise = ref.uwb.noise = ref.rear.noise = False
+        ref.update(env.obstacles + [env.dock.rect], env.dock)
+        # The level's own noise-free readings at the same pose
+        noise = s.lidar.noise
+        s.lidar.noise = False
+        s.lidar.update(env.obstacles + [env.dock.rect])
+        s.lidar.noise = noise
+        errors["lidar"].append(np.abs(s.lidar.get_data() - ref.lidar.get_data()).mean() * LIDAR_MAX_RANGE_PX)
+        errors["prox"].append(np.abs(s.prox.get_data() - ref.prox.get_data()).mean() * PROX_MAX_RANGE_PX)
+
+    run_steps(env, steps, seed, compare)
+    return {k: float(np.mean(v)) for k, v in errors.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", nargs="+", choices=list(SENSOR_FIDELITY_LEVELS), default=list(SENSOR_FIDELITY_LEVELS))
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--error-steps", type=int, default=200, help="steps for the error columns (untimed)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for level in args.levels:
+        env = RoverEnv(fidelity=level)
+        steps_per_s = run_steps(env, args.steps, args.seed)
+        env.enable_profiling(True)
+        run_steps(env, args.steps, args.seed)
+        stats = env.profile_stats()
+        results[level] = {
+            "steps_per_s": steps_per_s,
+            "sensors_us": stats["sensors"]["mean_us"],
+            "sensor_us": {k.split(".", 1)[1]: v["mean_us"] for k, v in stats.items() if k.startswith("sensor.")},
+            "error_px": measure_error(level, args.error_steps, args.seed),
+        }
+        print(f"{level}: {steps_per_s:.0f} steps/s", flush=True)
+
+    ref = results.get("standard")
+    print(f"\n{'level':<10s}{'steps/s':>10s}{'vs std':>8s}{'sensors':>11s}{'lidar':>10s}{'prox':>10s}{'ir':>10s}"
+          f"{'lidar_err':>11s}{'prox_err':>10s}")
+    for level, r in results.items():
+        rel = f"{r['steps_per_s'] / ref['steps_per_s']:.2f}x" if ref else ""
+        s = r["sensor_us"]
+        print(f"{level:<10s}{r['steps_per_s']:>10.0f}{rel:>8s}{r['sensors_us']:>9.0f}us{s['lidar']:>8.0f}us"
+              f"{s['prox']:>8.0f}us{s['ir']:>8.0f}us{r['error_px']['lidar']:>9.2f}px{r['error_px']['prox']:>8.2f}px")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"--- SAVED: {args.out} ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Average sensor cost per RoverEnv step with the multi-rate sensor scheduler
+(config.SENSOR_RATES_HZ, SENSOR_LATENCY_S) against updating every sensor on
+every physics step.
+
+  every-step   today's default
+  multi-rate   per-sensor update rates, readings held in between
+  latency      multi-rate plus the latency model
+
+All modes replay the same seeded worlds and random actions.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.sensor_rates --steps 1000
+"""
+import argparse
+import json
+from config import *
+from core.environment import RoverEnv
+from benchmarks.sensor_fidelity import run_steps
+
+MODES = {
+    "every-step": {},
+    "multi-rate": {"sensor_rates": True},
+    "latency": {"sensor_rates": True, "sensor_latency": True},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--fidelity", choices=list(SENSOR_FIDELITY_LEVELS), default=SENSOR_FIDELITY)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes:
+        env = RoverEnv(fidelity=args.fidelity, **MODES[mode])
+        steps_per_s = run_steps(env, args.steps, args.seed)
+        env.enable_profiling(True)
+        run_steps(env, args.steps, args.seed)
+        stats = env.profile_stats()
+        results[mode] = {
+            "steps_per_s": steps_per_s,
+            "sensors_us": stats["sensors"]["mean_us"],
+            "sensor_us": {k.split(".", 1)[1]: v["mean_us"] for k, v in stats.items() if k.startswith("sensor.")},
+        }
+        print(f"{mode}: {steps_per_s:.0f} steps/s", flush=True)
+
+    ref = results.get("every-step")
+    names = ("lidar", "prox", "uwb", "ir", "rear")
+    print(f"\n{'mode':<12s}{'steps/s':>10s}{'sensors':>11s}{'vs every':>10s}" + "".join(f"{n:>10s}" for n in names))
+    for mode, r in results.items():
+        rel = f"{ref['sensors_us'] / r['sensors_us']:.1f}x" if ref else ""
+        print(f"{mode:<12s}{r['steps_per_s']:>10.0f}{r['sensors_us']:>9.0f}us{rel:>10s}"
+              + "".join(f"{r['sensor_us'][n]:>8.0f}us" for n in names))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"--- SAVED: {args.out} ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Startup-time budget for the datalink-sim entry points.
+
+  - import profile of main.py (python -X importtime), slowest top-level modules
+  - time to first frame of main.py (fresh interpreter, dummy video driver)
+  - spawn time of a training worker (fresh process -> RoverEnv().reset())
+
+Fails (exit 1) when a budget is exceeded or when manual driving / env
+workers import modules they should only load lazily.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.startup --first-frame-budget 3.0 --worker-budget 1.5
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+import multiprocessing as mp
+
+# Loaded on demand only: AI use / model loading
+LAZY_MODULES = ("torch", "stable_baselines3")
+# Loaded on demand only: rendering (env workers never draw)
+RENDER_MODULES = ("ui.world_view", "ui.parkpilot", "ui.overlays", "ui.hud")
+
+FIRST_FRAME_SNIPPET = """
+import os, sys
+import pygame
+def _first_frame(*args, **kwargs):
+    print("FIRST_FRAME", ",".join(m for m in %r if m in sys.modules), flush=True)
+    os._exit(0)
+pygame.display.flip = _first_frame
+pygame.display.update = _first_frame
+import main
+main.main()
+"""
+
+
+def import_profile(module="main"):
+    """
+    Returns (total_s, [(cumulative_s, name)] for the modules `module` imports
+    directly, every module name loaded).
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy")
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         capture_output=True, text=True, env=env).stderr
+    total = 0.0
+    rows = []
+    pending = []
+    loaded = set()
+    for line in out.splitlines():
+        m = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if not m: continue
+        loaded.add(m.group(4))
+        depth = len(m.group(3)) // 2    # importtime indents children by two spaces
+        # Children are listed before their parent
+        if depth == 1: pending.append((int(m.group(2)) / 1e6, m.group(4)))
+        elif depth == 0:
+            if m.group(4) == module: total, rows = int(m.group(2)) / 1e6, pending
+            pending = []
+    rows.sort(reverse=True)
+    return total, rows, loaded
+
+
+def first_frame_time():
+    """Wall time from interpreter launch to main.py's first display update."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", FIRST_FRAME_SNIPPET % (LAZY_MODULES,)],
+                         capture_output=True, text=True, env=env, timeout=120).stdout
+    dt = time.perf_counter() - t0
+    m = re.search(r"^FIRST_FRAME (.*)$", out, re.M)
+    if m is None:
+        raise RuntimeError("main.py exited before drawing a frame")
+    return dt, [s for s in m.group(1).split(",") if s]
+
+
+def _worker(q):
+    from core.environment import RoverEnv
+    env = RoverEnv()
+    env.reset(seed=0)
+    q.put([m for m in LAZY_MODULES + RENDER_MODULES if m in sys.modules])
+
+
+def worker_spawn_time():
+    """Fresh (spawned) process until its first RoverEnv.reset() has returned."""
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    t0 = time.perf_counter()
+    p = ctx.Process(target=_worker, args=(q,))
+    p.start()
+    loaded = q.get(timeout=120)
+    dt = time.perf_counter() - t0
+    p.join()
+    return dt, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--first-frame-budget", type=float, default=3.0, help="seconds")
+    parser.add_argument("--worker-budget", type=float, default=1.5, help="seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (median is used)")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    total, rows, loaded = import_profile("main")
+    print(f"import main      : {total:8.3f} s")
+    for t, name in rows[:args.top]:
+        print(f"  {name:<24s} {t * 1000:8.1f} ms")
+
+    frames = [first_frame_time() for _ in range(args.repeat)]
+    workers = [worker_spawn_time() for _ in range(args.repeat)]
+    ff = sorted(t for t, _ in frames)[len(frames) // 2]
+    wk = sorted(t for t, _ in workers)[len(workers) // 2]
+    print(f"first frame      : {ff:8.3f} s  (budget {args.first_frame_budget:.1f} s)")
+    print(f"worker spawn     : {wk:8.3f} s  (budget {args.worker_budget:.1f} s)")
+
+    problems = []
+    if ff > args.first_frame_budget: problems.append("first frame over budget")
+    if wk > args.worker_budget: problems.append("worker spawn over budget")
+    eager = sorted(set(m for _, mods in frames for m in mods) | (loaded & set(LAZY_MODULES)))
+    if eager: problems.append(f"manual UI imported {', '.join(eager)}")
+    eager = sorted(set(m for _, mods in workers for m in mods))
+    if eager: problems.append(f"env worker imported {', '.join(eager)}")
+
+    for p in problems: print(f"FAIL: {p}")
+    if not problems: print("OK")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
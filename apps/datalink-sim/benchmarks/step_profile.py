@@ -0,0 +1,44 @@
+"""
+Where RoverEnv.step() spends its time, per component (core.profiler), and
+what the profiler costs when it is on and off.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.step_profile --steps 500
+"""
+import argparse
+import random
+import time
+import numpy as np
+from core.environment import RoverEnv
+from core.profiler import format_stats
+
+
+def run_steps(env, steps, seed):
+    random.seed(seed)
+    env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        _, _, done, _, _ = env.step(rng.uniform(-1.0, 1.0, size=2))
+        if done: env.reset()
+    return (time.perf_counter() - t0) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    env = RoverEnv()
+    t_off = run_steps(env, args.steps, args.seed)
+    env.enable_profiling(True)
+    t_on = run_steps(env, args.steps, args.seed)
+
+    print(format_stats(env.profile_stats()))
+    print(f"\nstep, profiler off : {t_off * 1e6:10.1f} us")
+    print(f"step, profiler on  : {t_on * 1e6:10.1f} us  ({(t_on / t_off - 1.0):+.1%})")
+
+
+if __name__ == "__main__":
+    main()
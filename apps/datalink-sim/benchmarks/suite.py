@@ -0,0 +1,283 @@
+"""
+Simulation benchmark suite with a stored baseline.
+
+  raycast      rays/s through core.raycast.get_ray_intersection_dist
+  world_gen    generate_world() calls/s per difficulty preset
+  env          RoverEnv.reset() and .step() rates on fixed seeded worlds, and
+               step + render("rgb_array") with float32 actions (as from a policy)
+  vec_env      VecEnv steps/s (DummyVecEnv for 1 env, SubprocVecEnv above).
+               1 and 8 envs by default; the 32-env point is left out (it
+               takes minutes on small hosts), add it with --vec-envs 1 8 32
+  ui           main.py frame time with sensors off / on (dummy video driver)
+
+Results go to JSON, and every metric is compared against a stored
+baseline; a metric that is worse by more than --tolerance is flagged and the
+run exits 1. Numbers are only comparable on the same hardware, so there is
+one baseline per host, picked automatically:
+
+    benchmarks/baselines/<host>-<machine>-<cpus>cpu.json
+
+(platform.node(), platform.machine(), os.cpu_count(); e.g.
+vm-x86_64-1cpu.json). On a host without one the run passes with a note:
+record it with --update-baseline and commit the file. A --baseline from
+other hardware is compared for reference only, with no gate.
+
+Run from apps/datalink-sim:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --only raycast env --out results.json
+    python -m benchmarks.suite --update-baseline          # new host, or after a deliberate change
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import numpy as np
+from config import *
+
+GROUPS = ("raycast", "world_gen", "env", "vec_env", "ui")
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+HOST_KEYS = ("host", "machine", "cpus")     # baseline meta that must match for the gate
+
+UI_SNIPPET = """
+import os, sys, time
+import pygame
+FRAMES, WARMUP, SENSORS = %d, %d, %r
+n = [0]
+t0 = [0.0]
+real_get = pygame.event.get
+def get(*args, **kwargs):
+    real_get()
+    n[0] += 1
+    if n[0] == 2 and SENSORS:
+        # TOGGLE SENSORS button
+        pos = (VIEWPORT_WIDTH + 100, SCREEN_HEIGHT - 30)
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)]
+    if n[0] == WARMUP: t0[0] = time.perf_counter()
+    if n[0] == WARMUP + FRAMES:
+        print("FRAME_MS", (time.perf_counter() - t0[0]) * 1000.0 / FRAMES, flush=True)
+        os._exit(0)
+    return []
+pygame.event.get = get
+from config import *
+import main
+main.FPS = 100000    # effectively uncapped clock.tick()
+main.main()
+"""
+
+
+def rate(fn, min_time):
+    """Calls/s of fn() over at least min_time seconds."""
+    fn()
+    n = 0
+    t0 = time.perf_counter()
+    while True:
+        fn()
+        n += 1
+        dt = time.perf_counter() - t0
+        if dt >= min_time: return n / dt
+
+
+def metric(value, unit, higher_is_better=True):
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+# ===================================================================
+# GROUPS
+# ===================================================================
+def bench_raycast(args):
+    from core.raycast import get_ray_intersection_dist
+    from core.world_gen import generate_world
+    random.seed(args.seed)
+    obstacles, dock_rect, _, start, _ = generate_world(False, DIFF_MEDIUM)
+    obstacles = obstacles + [dock_rect]
+    angles = iter(np.tile(np.linspace(0.0, 360.0, LIDAR_NUM_RAYS, endpoint=False), 10**6))
+    r = rate(lambda: get_ray_intersection_dist(start, next(angles), obstacles, LIDAR_MAX_RANGE_PX), args.min_time)
+    return {"raycast.rays_per_s": metric(r, "rays/s")}
+
+
+def bench_world_gen(args):
+    from core.world_gen import generate_world
+    out = {}
+    for diff in (DIFF_EASY, DIFF_MEDIUM, DIFF_HARD, DIFF_DOCKING):
+        random.seed(args.seed)
+        r = rate(lambda: generate_world(False, diff), args.min_time)
+        out[f"world_gen.{diff['name'].split()[0].lower()}_per_s"] = metric(r, "calls/s")
+    return out
+
+
+def bench_env(args):
+    from core.environment import RoverEnv
+    env = RoverEnv()
+    seeds = iter(range(args.seed, args.seed + 10**6))
+
+    def reset():
+        s = next(seeds)
+        random.seed(s)
+        env.reset(seed=s)
+    r_reset = rate(reset, args.min_time)
+
+    rng = np.random.default_rng(args.seed)
+    random.seed(args.seed)
+    env.reset(seed=args.seed)
+
+    def step():
+        _, _, done, _, _ = env.step(rng.uniform(-1.0, 1.0, size=2))
+        if done: env.reset()
+    r_step = rate(step, args.min_time)
+
+    # Offscreen frames the way eval videos are recorded: float32 actions
+    # from the action space, then render()
+    renv = RoverEnv(render_mode="rgb_array")
+    renv.action_space.seed(args.seed)
+    random.seed(args.seed)
+    renv.reset(seed=args.seed)
+
+    def step_render():
+        _, _, done, _, _ = renv.step(renv.action_space.sample())
+        renv.render()
+        if done: renv.reset()
+    r_render = rate(step_render, args.min_time)
+    renv.close()
+    return {"env.reset_per_s": metric(r_reset, "calls/s"), "env.step_per_s": metric(r_step, "steps/s"),
+            "env.step_render_per_s": metric(r_render, "steps/s")}
+
+
+def bench_vec_env(args):
+    from core.environment import RoverEnv
+    from stable_baselines3.common.env_util import make_vec_env
+    from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+    out = {}
+    for n in args.vec_envs:
+        venv = make_vec_env(RoverEnv, n_envs=n, seed=args.seed,
+                            vec_env_cls=DummyVecEnv if n == 1 else SubprocVecEnv)
+        venv.reset()
+        rng = np.random.default_rng(args.seed)
+        r = rate(lambda: venv.step(rng.uniform(-1.0, 1.0, size=(n, 2)).astype(np.float32)), args.min_time)
+        venv.close()
+        out[f"vec_env.{n}_envs_steps_per_s"] = metric(r * n, "steps/s")
+    return out
+
+
+def bench_ui(args):
+    out = {}
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    for sensors in (False, True):
+        res = subprocess.run([sys.executable, "-c", UI_SNIPPET % (args.ui_frames, 10, sensors)],
+                             capture_output=True, text=True, env=env, timeout=600)
+        m = re.search(r"^FRAME_MS (\S+)$", res.stdout, re.M)
+        if m is None:
+            raise RuntimeError(f"main.py frame benchmark failed:\n{res.stderr[-2000:]}")
+        out[f"ui.frame_ms_sensors_{'on' if sensors else 'off'}"] = metric(float(m.group(1)), "ms", False)
+    return out
+
+BENCHES = {
+    "raycast": bench_raycast, "world_gen": bench_world_gen, "env": bench_env,
+    "vec_env": bench_vec_env, "ui": bench_ui,
+}
+
+# ===================================================================
+# BASELINE
+# ===================================================================
+def compare(results, baseline, tolerance):
+    """Rows of (name, value, base, change, regressed) for metrics in both."""
+    rows = []
+    for name, m in results.items():
+        b = baseline.get(name)
+        if b is None:
+            rows.append((name, m["value"], None, None, False))
+            continue
+        change = m["value"] / b["value"] - 1.0 if b["value"] else 0.0
+        worse = -change if m["higher_is_better"] else change
+        rows.append((name, m["value"], b["value"], change, worse > tolerance))
+    return rows
+
+
+def baseline_path(meta):
+    """This host's baseline file under BASELINE_DIR."""
+    host = re.sub(r"[^A-Za-z0-9_.-]+", "_", meta["host"]) or "unknown"
+    return os.path.join(BASELINE_DIR, f"{host}-{meta['machine']}-{meta['cpus']}cpu.json")
+
+
+def host_mismatch(meta, base_meta):
+    """[(key, baseline value, this value)] for the hardware fields that differ."""
+    return [(k, base_meta.get(k), meta[k]) for k in HOST_KEYS if base_meta.get(k) != meta[k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--min-time", type=float, default=2.0, help="seconds per measurement")
+    parser.add_argument("--vec-envs", type=int, nargs="+", default=[1, 8], help="env counts (SubprocVecEnv above 1)")
+    parser.add_argument("--ui-frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None, help="default: this host's file under benchmarks/baselines/")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown (fraction)")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    args = parser.parse_args()
+
+    results = {}
+    for group in args.only:
+        t0 = time.perf_counter()
+        results.update(BENCHES[group](args))
+        print(f"[{group}] done in {time.perf_counter() - t0:.1f} s")
+
+    meta = {
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "host": platform.node(), "machine": platform.machine(), "cpus": os.cpu_count(),
+        "python": platform.python_version(), "numpy": np.__version__,
+    }
+    with open(args.out, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    if args.baseline is None: args.baseline = baseline_path(meta)
+    baseline, base_meta = {}, {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        baseline, base_meta = stored["results"], stored.get("meta", {})
+    mismatch = host_mismatch(meta, base_meta) if baseline else []
+
+    rows = compare(results, baseline, args.tolerance)
+    print(f"\n{'metric':<34s}{'value':>14s}{'baseline':>14s}{'change':>9s}")
+    for name, value, base, change, regressed in rows:
+        b = "-" if base is None else f"{base:.1f}"
+        c = "" if change is None else f"{change:+.1%}"
+        print(f"{name:<34s}{value:>14.1f}{b:>14s}{c:>9s}{'  REGRESSION' if regressed else ''}")
+
+    if args.update_baseline:
+        # Merge, so a partial run (--only) keeps the other groups' numbers
+        if mismatch:
+            sys.exit(f"{args.baseline} is another host's baseline; drop --baseline to update "
+                     f"this host's ({baseline_path(meta)})")
+        baseline.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"meta": meta, "results": baseline}, f, indent=2)
+        print(f"--- BASELINE UPDATED: {args.baseline} ---")
+        return
+
+    if mismatch:
+        diff = ", ".join(f"{k} {b!r} -> {v!r}" for k, b, v in mismatch)
+        print(f"\nWARNING: baseline is from other hardware ({diff}); comparison for reference only, "
+              f"no regression gate. This host's baseline is {baseline_path(meta)}.")
+        return
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; nothing to gate against. "
+              f"Record one for this host with --update-baseline.")
+        return
+
+    regressions = [r[0] for r in rows if r[4]]
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+    print(f"\nOK ({args.out})")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,95 @@ VIEWPORT_HEIGHT = 700
 UI_PANEL_WIDTH = SCREEN_WIDTH - VIEWPORT_WIDTH
 
 FPS = 60
+# AI-mode fast-forward multipliers cycled with T (0 = as fast as possible)
+SIM_SPEEDS = (1, 4, 16, 0)
 TITLE = "DataLink Rover Sim - v15.0 (Unrestricted Physics)"
 
+# Push only changed regions to the display (F2 toggles at runtime).
+# Useful over remote desktop, where every full flip is sent over the wire.
+RENDER_DIRTY_RECTS = False
+
+# Max rendered text surfaces kept by ui.text_cache (LRU)
+TEXT_CACHE_SIZE = 256
+
+# --- AI Model Hot-Reload ---
+MODELS_DIR = "models/PPO"
+MODEL_WATCH_INTERVAL = 2.0      # s between checkpoint directory scans
+
+# --- Step Profiler (RoverEnv(profile=True)) ---
+PROFILE_WINDOW = 4096           # samples kept per component
+
+# --- Checkpoint Retention (train_ai.py) ---
+CHECKPOINT_KEEP_LAST = 3        # newest checkpoints always kept
+CHECKPOINT_KEEP_BEST = 2        # plus the best by eval success rate
+CHECKPOINT_EVAL_DIFFICULTY = "MEDIUM"   # evaluate.py scenario set each checkpoint is scored on
+CHECKPOINT_EVAL_EPISODES = 10   # 0: no scoring (and so no pruning)
+
+# --- Training Layout (autotune.py -> train_ai.py) ---
+TRAIN_LAYOUT_FILE = "train_layout.json"
+ROLLOUT_STEPS = 2048            # env steps per PPO update, across all envs
+
+# --- Docking Stages (RoverEnv.current_stage) ---
+STAGE_SEARCH = 0
+STAGE_APPROACH = 1
+STAGE_ROTATE = 2
+STAGE_DOCKING = 3
+STAGE_NAMES = {STAGE_SEARCH: "search", STAGE_APPROACH: "approach", STAGE_ROTATE: "rotate", STAGE_DOCKING: "docking"}
+
+# --- Stage Rewards (RoverEnv.step milestone bonuses/penalties; sweep.py tunes these) ---
+REWARD_WEIGHTS = {
+    "collision": -50.0,
+    "found_beam": 10.0,
+    "lost_beam": -2.0,
+    "reached_turn": 20.0,
+    "aligned": 20.0,
+    "docked": 100.0,
+    "bad_dock": -50.0,
+}
+
+# --- Reverse Curriculum (RoverEnv(stage_starts=...), core/stage_starts.py) ---
+STAGE_STARTS = False            # train_ai.py: start some episodes in APPROACH/ROTATE/DOCKING
+STAGE_START_SEARCH_FRACTION = 0.5   # episodes that still start normally
+STAGE_START_CACHE_SIZE = 256    # reached states kept per stage
+
+# --- Adaptive Difficulty (core/curriculum.py) ---
+CURRICULUM = False              # train_ai.py: EASY -> MEDIUM -> HARD by rolling success
+CURRICULUM_WINDOW = 200         # episodes per level in the rolling success rate
+CURRICULUM_PROMOTE = 0.7        # success rate that moves the frontier up
+CURRICULUM_DEMOTE = 0.2         # ... and back down
+
+# --- Sensor Fidelity (SensorSuite.set_fidelity, RoverEnv(fidelity=...)) ---
+# lidar_rays: rays cast across LIDAR_FOV, resampled to the LIDAR_NUM_RAYS
+#             observation beams (fewer: interpolated, more: min over each beam)
+# prox_rays:  rays per proximity arc
+# noise:      Gaussian lidar/UWB/ToF noise
+# los_px:     front IR line of sight re-checked only after the rover moved this far (0: every step)
+SENSOR_FIDELITY_LEVELS = {
+    "coarse":   {"lidar_rays": 12, "prox_rays": 2, "noise": False, "los_px": 10.0},
+    "standard": {"lidar_rays": 36, "prox_rays": 5, "noise": True, "los_px": 0.0},
+    "high":     {"lidar_rays": 108, "prox_rays": 9, "noise": True, "los_px": 0.0},
+}
+SENSOR_FIDELITY = "standard"
+SENSOR_FIDELITY_SCHEDULE = []   # train_ai.py: [(timestep, level), ...], e.g. [(0, "coarse"), (2_000_000, "standard")]
+
+# --- Sensor Scheduling (SensorSuite(rates=..., latency=...), RoverEnv(sensor_rates=..., sensor_latency=...)) ---
+# Hardware update rates; between updates a sensor holds its last reading
+SENSOR_RATES_HZ = {"lidar": 10.0, "prox": 20.0, "uwb": 20.0, "ir": 60.0, "rear": 60.0}
+# Measurement -> reading available
+SENSOR_LATENCY_S = {"lidar": 0.05, "prox": 0.03, "uwb": 0.05, "ir": 0.0, "rear": 0.0}
+SENSOR_MULTI_RATE = False       # RoverEnv default: every sensor on every physics step
+SENSOR_LATENCY = False          # ... with no latency
+
+# --- Remote Rollout Workers (core/remote_vec_env.py) ---
+REMOTE_HOST = "127.0.0.1"        # learner bind address; the protocol has no authentication, so
+                                # other hosts only via an explicit layout "bind" (e.g. "0.0.0.0")
+REMOTE_PORT = 5555
+REMOTE_STEP_TIMEOUT = 30.0      # s a worker may take per step before it is dropped
+
+# --- Hyperparameter Sweeps (sweep.py) ---
+WORLD_BANK_DIR = "worlds"
+SWEEP_DIR = "sweeps"
+
 # --- Colors ---
 COLOR_BG = (10, 12, 16)
 COLOR_GRID = (30, 35, 45)
@@ -39,6 +126,7 @@ COLOR_WARNING = (255, 50, 50)
 # 800 px / 10 m = 80 px/m
 METERS_TO_PIXELS = 80 
 ROVER_RADIUS = 20 # 20px radius = 40px width = 0.5m wide (Large RC Car)
+ROVER_SPRITE_STEP_DEG = 2 # Heading resolution of the pre-rotated sprite atlas
 
 # Physics
 DT = 1.0 / FPS
@@ -0,0 +1,54 @@
+"""
+Training-side SB3 callbacks for RoverEnv features whose env-side parts
+(core.stage_starts, core.curriculum) must stay importable without
+stable_baselines3, since env workers and main.py load them.
+"""
+import numpy as np
+from stable_baselines3.common.callbacks import BaseCallback
+from config import *
+from core.curriculum import LEVELS
+
+class StageStartCallback(BaseCallback):
+    """
+    Logs the stage-start mix once per rollout, averaged over the envs:
+      curriculum/start_<stage>_weight, curriculum/start_<stage>_success
+    """
+    def _on_step(self):
+        return True
+
+    def _on_rollout_end(self):
+        per_env = [s for s in self.training_env.env_method("stage_start_stats") if s]
+        if not per_env: return
+        for name in per_env[0]:
+            self.logger.record(f"curriculum/start_{name}_weight", float(np.mean([s[name]["weight"] for s in per_env])))
+            rates = [s[name]["success"] for s in per_env if s[name]["success"] is not None]
+            if rates: self.logger.record(f"curriculum/start_{name}_success", float(np.mean(rates)))
+
+class CurriculumCallback(BaseCallback):
+    """
+    Feeds episode outcomes (info["difficulty"], info["is_success"]) to a
+    CurriculumManager and updates the shared mix once per rollout. Logs
+    curriculum/level, curriculum/<level>_weight and curriculum/<level>_success.
+    """
+    def __init__(self, manager, verbose=0):
+        super().__init__(verbose)
+        self.manager = manager
+        self._index = {d["name"]: i for i, d in enumerate(LEVELS)}
+
+    def _on_step(self):
+        for done, info in zip(self.locals["dones"], self.locals["infos"]):
+            # Reverse-curriculum starts (stage_starts) would inflate the rate
+            if done and info.get("difficulty") in self._index and not info.get("start_stage"):
+                self.manager.record(self._index[info["difficulty"]], info.get("is_success", False))
+        return True
+
+    def _on_rollout_end(self):
+        if self.manager.update():
+            print(f"--- CURRICULUM: now at {LEVELS[self.manager.level]['name']} ---")
+        log = self.logger.record
+        log("curriculum/level", self.manager.level)
+        weights, success = self.manager.weights(), self.manager.success()
+        for i, d in enumerate(LEVELS):
+            name = d["name"].lower()
+            log(f"curriculum/{name}_weight", float(weights[i]))
+            if not np.isnan(success[i]): log(f"curriculum/{name}_success", float(success[i]))
@@ -0,0 +1,203 @@
+import os
+import re
+import copy
+import glob
+import json
+import time
+import queue
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from config import *
+
+# Scores of saved checkpoints, so retention survives restarts
+MANIFEST = "checkpoints.json"
+
+def checkpoint_files(models_dir):
+    """{step: path} for every complete ppo_rover_<step>.zip."""
+    files = {}
+    for f in glob.glob(os.path.join(models_dir, "ppo_rover_*.zip")):
+        m = re.search(r"ppo_rover_(\d+)\.zip$", f)
+        if m: files[int(m.group(1))] = f
+    return files
+
+def state_path(path):
+    """Sidecar JSON with the training state saved alongside a checkpoint zip."""
+    return path[:-len(".zip")] + ".state.json"
+
+def checkpoint_state(path):
+    """State passed to AsyncCheckpointer.save(state=...) for this checkpoint, {} if none."""
+    try:
+        with open(state_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# --- SCORING (evaluator process) ---
+def _init_scorer(difficulty, episodes, seed):
+    import evaluate
+    evaluate._init_worker(evaluate.build_scenarios([difficulty], episodes, seed))
+
+def _score(path, difficulty):
+    """Success rate of the checkpoint on evaluate.py's seeded scenario set."""
+    import evaluate
+    return evaluate.evaluate(path, difficulty)["success_rate"]
+
+class AsyncCheckpointer:
+    """
+    Writes SB3 checkpoints from a background thread while training goes on.
+    save() snapshots the parameters and save data on the calling thread (a
+    deep copy of a few hundred KB), then a writer thread serialises the zip to
+    '<name>.zip.tmp' and renames it into place, so readers (main.py's watcher,
+    resume) only ever see complete files. Training state outside the model
+    (e.g. the curriculum) can go along as JSON: save(state=...) writes it to
+    '<name>.state.json' before the zip appears; read it with checkpoint_state().
+    
+    Every written checkpoint is then scored in a separate evaluator process:
+    its success rate on evaluate.py's fixed, seeded scenarios for
+    eval_difficulty. Once a score is in, old checkpoints are pruned: the last
+    keep_last by step plus the keep_best best-scoring ones stay. A checkpoint
+    without a recorded score (still being evaluated, or saved before scoring
+    existed) is never deleted.
+    """
+    def __init__(self, models_dir=MODELS_DIR, keep_last=CHECKPOINT_KEEP_LAST, keep_best=CHECKPOINT_KEEP_BEST,
+                 eval_difficulty=CHECKPOINT_EVAL_DIFFICULTY, eval_episodes=CHECKPOINT_EVAL_EPISODES, eval_seed=0):
+        self.models_dir = models_dir
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.eval_difficulty = eval_difficulty
+        self.metric = f"{eval_difficulty.lower()}_success_rate"
+        self.scores = self._load_manifest()
+        self.last_snapshot_ms = 0.0     # time save() blocked the caller
+        self.last_write_ms = 0.0        # time the writer thread took
+        self._lock = threading.Lock()   # scores/manifest: writer thread and evaluator callbacks
+        
+        self._scorer = None
+        if eval_episodes > 0:
+            self._scorer = ProcessPoolExecutor(1, mp_context=mp.get_context("spawn"), initializer=_init_scorer,
+                                               initargs=(eval_difficulty, eval_episodes, eval_seed))
+
+        # Half-written files from a crash are never resumed from
+        for f in glob.glob(os.path.join(models_dir, "*.zip.tmp")): os.remove(f)
+
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, model, step, state=None):
+        """Queues a checkpoint of `model` (and JSON-able `state`) at `step`; returns the final path."""
+        if self._error is not None:
+            raise self._error
+        t0 = time.perf_counter()
+        snapshot = self._snapshot(model)
+        self.last_snapshot_ms = (time.perf_counter() - t0) * 1000.0
+        path = os.path.join(self.models_dir, f"ppo_rover_{step}.zip")
+        self._queue.put((path, step, snapshot, copy.deepcopy(state)))
+        return path
+
+    def close(self):
+        """Waits for queued writes and their evaluations to finish."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._scorer is not None:
+            print("--- WAITING FOR CHECKPOINT EVALUATIONS ---")
+            self._scorer.shutdown(wait=True)
+        if self._error is not None:
+            raise self._error
+
+    # --- SNAPSHOT (caller thread) ---
+    @staticmethod
+    def _snapshot(model):
+        # Same selection as BaseAlgorithm.save(), deep-copied so training can
+        # keep mutating the live tensors and buffers
+        from stable_baselines3.common.save_util import recursive_getattr
+
+        data = model.__dict__.copy()
+        exclude = set(model._excluded_save_params())
+        state_dicts_names, torch_variable_names = model._get_torch_save_params()
+        for name in state_dicts_names + torch_variable_names:
+            exclude.add(name.split(".")[0])
+        for name in exclude:
+            data.pop(name, None)
+        pytorch_variables = {name: recursive_getattr(model, name) for name in torch_variable_names}
+        return copy.deepcopy((data, model.get_parameters(), pytorch_variables))
+
+    # --- WRITER THREAD ---
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None: return
+            try:
+                self._write(*job)
+            except Exception as e:
+                print(f"CHECKPOINT FAILED: {job[0]}: {e}")
+                self._error = e
+
+    def _write(self, path, step, snapshot, state):
+        from stable_baselines3.common.save_util import save_to_zip_file
+
+        t0 = time.perf_counter()
+        if state is not None:
+            # Before the zip: a complete checkpoint always has its state
+            with open(state_path(path) + ".tmp", "w") as f:
+                json.dump(state, f)
+            os.replace(state_path(path) + ".tmp", state_path(path))
+        data, params, pytorch_variables = snapshot
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            save_to_zip_file(f, data=data, params=params, pytorch_variables=pytorch_variables)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self.last_write_ms = (time.perf_counter() - t0) * 1000.0
+        print(f"--- SAVED: {path} ({self.last_write_ms:.0f} ms in background) ---")
+        
+        if self._scorer is not None:
+            future = self._scorer.submit(_score, path, self.eval_difficulty)
+            future.add_done_callback(partial(self._scored, step))
+
+    def _scored(self, step, future):
+        try:
+            score = future.result()
+        except Exception as e:
+            print(f"CHECKPOINT EVAL FAILED: step {step}: {e}")
+            return
+        with self._lock:
+            self.scores[str(step)] = score
+            self._prune()
+            self._save_manifest()
+        print(f"--- SCORED: step {step}: {self.eval_difficulty} success {score:.0%} ---")
+
+    def _prune(self):
+        files = checkpoint_files(self.models_dir)
+        steps = sorted(files)
+        keep = set(steps[-self.keep_last:]) if self.keep_last > 0 else set()
+        scored = [s for s in steps if self.scores.get(str(s)) is not None]
+        scored.sort(key=lambda s: self.scores[str(s)], reverse=True)
+        keep.update(scored[:self.keep_best])
+        # Only scored checkpoints are candidates: nothing unranked is thrown away
+        for s in scored:
+            if s not in keep:
+                os.remove(files[s])
+                if os.path.exists(state_path(files[s])): os.remove(state_path(files[s]))
+                self.scores.pop(str(s), None)
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.models_dir, MANIFEST)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Scores in another unit (older manifests, another eval set) can't be
+        # ranked against these: those checkpoints count as unscored
+        if not isinstance(manifest, dict) or manifest.get("metric") != self.metric:
+            return {}
+        return manifest.get("scores", {})
+
+    def _save_manifest(self):
+        path = os.path.join(self.models_dir, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"metric": self.metric, "scores": self.scores}, f, indent=2)
+        os.replace(path + ".tmp", path)
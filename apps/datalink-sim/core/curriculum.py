@@ -0,0 +1,125 @@
+from collections import deque
+from multiprocessing import shared_memory
+import numpy as np
+from config import *
+
+LEVELS = [DIFF_EASY, DIFF_MEDIUM, DIFF_HARD]
+
+class CurriculumBlock:
+    """
+    Shared-memory control block for the difficulty mix. The learner is the
+    only writer; every env (in any local vec-env worker) attaches by name and
+    reads the weights at reset. Layout (float64):
+      [version, level, weight_0..n-1, success_0..n-1]
+    A reader that sees the version change mid-read just retries.
+    """
+    def __init__(self, name=None, n=len(LEVELS)):
+        self.n = n
+        create = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=(2 + 2 * n) * 8)
+        self.name = self.shm.name
+        self.buf = np.ndarray((2 + 2 * n,), dtype=np.float64, buffer=self.shm.buf)
+        if create:
+            self.buf[:] = 0.0
+            self.buf[2] = 1.0       # all on the first level until told otherwise
+            self.buf[2 + n:] = np.nan
+
+    def write(self, level, weights, success):
+        n = self.n
+        self.buf[0] += 1.0          # odd: write in progress
+        self.buf[1] = level
+        self.buf[2:2 + n] = weights
+        self.buf[2 + n:] = success
+        self.buf[0] += 1.0
+
+    def weights(self):
+        for _ in range(8):
+            v = self.buf[0]
+            if v % 2: continue
+            w = self.buf[2:2 + self.n].copy()
+            if self.buf[0] == v: break
+        else:
+            w = self.buf[2:2 + self.n].copy()   # writer stuck mid-update; close enough
+        return w / w.sum()
+
+    def sample(self, rng):
+        """A difficulty dict drawn from the current mix."""
+        return LEVELS[rng.choice(self.n, p=self.weights())]
+
+    def close(self, unlink=False):
+        self.buf = None
+        self.shm.close()
+        if unlink: self.shm.unlink()
+
+    def __getstate__(self):
+        # Envs are pickled into vec-env workers with the name; each attaches itself
+        return {"name": self.name, "n": self.n}
+
+    def __setstate__(self, state):
+        self.__init__(state["name"], state["n"])
+
+class CurriculumManager:
+    """
+    Learner-side difficulty scheduler. Tracks rolling success per level and
+    keeps a "frontier" level: most episodes are played there, some review the
+    easier levels and a few preview the next one. The frontier moves up once
+    its success rate reaches `promote` (over at least `min_episodes`) and back
+    down if it falls below `demote`.
+    """
+    def __init__(self, block, window=CURRICULUM_WINDOW, promote=CURRICULUM_PROMOTE, demote=CURRICULUM_DEMOTE,
+                 min_episodes=50, mix=(0.25, 0.6, 0.15)):
+        self.block = block
+        self.n = block.n
+        self.promote = promote
+        self.demote = demote
+        self.min_episodes = min_episodes
+        self.review, self.focus, self.preview = mix
+        self.results = [deque(maxlen=window) for _ in range(self.n)]
+        self.level = 0
+        self.publish()
+
+    def record(self, level, success):
+        self.results[level].append(bool(success))
+
+    def success(self):
+        return np.array([np.mean(r) if r else np.nan for r in self.results])
+
+    def weights(self):
+        w = np.zeros(self.n)
+        w[self.level] = self.focus
+        if self.level > 0: w[:self.level] = self.review / self.level
+        if self.level + 1 < self.n: w[self.level + 1] = self.preview
+        return w / w.sum()
+
+    def update(self):
+        """Moves the frontier if warranted and publishes the mix; True if it moved."""
+        r = self.results[self.level]
+        moved = False
+        if len(r) >= self.min_episodes:
+            rate = np.mean(r)
+            if rate >= self.promote and self.level + 1 < self.n:
+                self.level += 1
+                moved = True
+            elif rate < self.demote and self.level > 0:
+                self.level -= 1
+                moved = True
+        if moved:
+            # Fresh window for the new frontier, so one lucky/unlucky streak
+            # doesn't bounce it straight back
+            self.results[self.level].clear()
+        self.publish()
+        return moved
+
+    def state(self):
+        """Frontier level and rolling windows, for saving with a checkpoint."""
+        return {"level": self.level, "results": [list(r) for r in self.results]}
+
+    def load_state(self, state):
+        self.level = int(state["level"])
+        for r, saved in zip(self.results, state["results"]):
+            r.clear()
+            r.extend(bool(x) for x in saved)
+        self.publish()
+
+    def publish(self):
+        self.block.write(self.level, self.weights(), self.success())
@@ -1,5 +1,7 @@
 import numpy as np
 import math
+import random
+from collections import namedtuple
 import gymnasium as gym
 from gymnasium import spaces
 from core.world_gen import generate_world
@@ -7,17 +9,27 @@ from core.physics import circle_rect_collision
 from entities.rover import Rover
 from entities.dock import DockingStation
 from sensors.sensor_suite import SensorSuite
+from core.profiler import StepProfiler
 from config import *
 
-# --- STAGE DEFINITIONS ---
-STAGE_SEARCH = 0    
-STAGE_APPROACH = 1  
-STAGE_ROTATE = 2    
-STAGE_DOCKING = 3   
+# --- SNAPSHOT ---
+# Everything step() reads or mutates. The world (obstacles, dock, difficulty)
+# is never modified during an episode, so it is kept by reference, not copied.
+EnvState = namedtuple("EnvState", [
+    "x", "y", "angle", "vx", "omega", "pwm_l", "pwm_r",
+    "step_count", "stage", "milestones", "approach_start_dist", "approach_record",
+    "last_dist", "success", "collided",
+    "sensors", "rng_state", "world",
+])
 
 class RoverEnv(gym.Env):
-    def __init__(self):
+    metadata = {"render_modes": ["rgb_array"], "render_fps": FPS}
+
+    def __init__(self, render_mode=None, profile=False, profile_info=False, world_bank=None, rewards=None,
+                 stage_starts=None, curriculum=None, fidelity=SENSOR_FIDELITY,
+                 sensor_rates=SENSOR_MULTI_RATE, sensor_latency=SENSOR_LATENCY):
         super(RoverEnv, self).__init__()
+        self.render_mode = render_mode
         
         self.obstacles = []
         self.dock = None
@@ -43,9 +55,60 @@ class RoverEnv(gym.Env):
         self.milestones = set()
         self.approach_start_dist = None 
         self.approach_record = None     
+        
+        # Milestone rewards (config.REWARD_WEIGHTS, optionally overridden)
+        self.rewards = dict(REWARD_WEIGHTS, **(rewards or {}))
+        # Pre-generated worlds (core.world_bank.WorldBank) instead of generate_world()
+        self.world_bank = world_bank
+        
+        # Reverse curriculum: episodes may start in later stages
+        # (core.stage_starts.StageStartSampler; True for the defaults)
+        self.stage_milestones = None
+        if stage_starts:
+            from core.stage_starts import StageStartSampler, STAGE_MILESTONES
+            if stage_starts is True: stage_starts = StageStartSampler()
+            self.stage_milestones = STAGE_MILESTONES
+        self.stage_starts = stage_starts or None
+        self.start_stage = STAGE_SEARCH
+        
+        # Adaptive difficulty: the mix is read from the learner's shared
+        # control block (core.curriculum.CurriculumBlock) at every reset
+        self.curriculum = curriculum
+        
+        # Sensor fidelity level (config.SENSOR_FIDELITY_LEVELS), kept across
+        # resets; switched during training by core.fidelity.FidelityCallback
+        self.set_fidelity(fidelity)
+        # Per-sensor update rates / latencies ({sensor: Hz} / {sensor: s};
+        # True for config.SENSOR_RATES_HZ / SENSOR_LATENCY_S, falsy: off)
+        self.sensor_rates = SENSOR_RATES_HZ if sensor_rates is True else sensor_rates or None
+        self.sensor_latency = SENSOR_LATENCY_S if sensor_latency is True else sensor_latency or None
+        
+        # --- OFFSCREEN RENDERING (rgb_array) ---
+        self._frame = None          # (H, W, 3) uint8, shared with the canvas surface
+        self._frame_view = None     # read-only view handed to callers
+        self._canvas = None
+        self._static_layer = None   # walls, grid, obstacles, dock (built by render())
+
+        # --- STEP PROFILER (off: None, costs one truth test per component) ---
+        self.profiler = None
+        self.profile_info = False
+        if profile: self.enable_profiling(True, profile_info)
 
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
+        
+        start = STAGE_SEARCH
+        if self.stage_starts is not None:
+            start = self.stage_starts.pick(self.np_random)
+            state = self.stage_starts.cached(start, self.np_random) if start != STAGE_SEARCH else None
+            if state is not None:
+                # Replay a situation an earlier episode reached, with a fresh
+                # step budget and the current noise sequence
+                self.start_stage = start
+                obs = self.set_state(state._replace(step_count=0, rng_state=random.getstate()))
+                self.sensors.profiler = self.profiler
+                return obs, {"start_stage": start}
+        
         self.step_count = 0
         self.success = False
         self.collided = False
@@ -56,25 +119,79 @@ class RoverEnv(gym.Env):
         self.approach_record = None
         
         should_spawn_dock = self.spawn_on_dock_setting 
-            
-        obs_rects, dock_rect, dock_side, start_pos, start_angle = generate_world(
-            should_spawn_dock, 
-            self.current_difficulty
-        )
+        
+        if self.curriculum is not None and self.world_bank is None:
+            self.current_difficulty = self.curriculum.sample(self.np_random)
+        
+        if self.world_bank is not None:
+            # options={"world": i} picks a specific world (evaluation)
+            i = options["world"] if options and "world" in options else self.world_bank.sample(self.np_random)
+            obs_rects, dock_rect, dock_side, start_pos, start_angle = self.world_bank.world(i)
+            self.current_difficulty = self.world_bank.difficulty
+        else:
+            obs_rects, dock_rect, dock_side, start_pos, start_angle = generate_world(
+                should_spawn_dock, 
+                self.current_difficulty
+            )
         
         self.obstacles = obs_rects 
         self.dock = DockingStation(dock_rect, dock_side)
+        
+        if start != STAGE_SEARCH:
+            # Pose from the dock geometry; falls back to a normal start if
+            # nothing clear of obstacles was found
+            pose = self.stage_starts.pose(start, self.dock, self.obstacles, self.np_random,
+                                          self.current_difficulty["dist"])
+            if pose is None:
+                start = STAGE_SEARCH
+            else:
+                start_pos, start_angle = pose[:2], pose[2]
+                self.current_stage = start
+                self.milestones = set(self.stage_milestones[start])
+        self.start_stage = start
         self.rover = Rover(start_pos[0], start_pos[1], start_angle)
         
-        self.sensors = SensorSuite(self.rover)
+        self.sensors = self._make_sensors()
         self.sensors.update(self.obstacles + [self.dock.rect], self.dock)
+        self.sensors.profiler = self.profiler   # step() timings only
+        
+        if start in (STAGE_APPROACH, STAGE_ROTATE) and not self.sensors.ir.get_data()[:2].any():
+            # Beam not visible from the sampled pose (e.g. the line of sight
+            # grazes the dock face): plain SEARCH episode from here instead
+            start = self.start_stage = self.current_stage = STAGE_SEARCH
+            self.milestones = set()
         
         obs = self._get_observation()
         
         self.last_dist = self.sensors.uwb.get_ground_truth_dist(self.dock)
-        return obs, {}
+        return obs, {"start_stage": start} if self.stage_starts is not None else {}
+
+    def enable_profiling(self, flag=True, info=False):
+        """
+        Turns the per-component step profiler on/off. With info=True the
+        aggregates are also put in info["profile"] when an episode ends.
+        """
+        self.profiler = StepProfiler() if flag else None
+        self.profile_info = flag and info
+        if self.sensors is not None: self.sensors.profiler = self.profiler
+
+    def _make_sensors(self, profiler=None):
+        return SensorSuite(self.rover, profiler, self.fidelity, self.sensor_rates, self.sensor_latency)
+
+    def set_fidelity(self, level):
+        """Sensor fidelity for this and later episodes ("coarse", "standard", "high")."""
+        if level not in SENSOR_FIDELITY_LEVELS:
+            raise ValueError(f"fidelity must be one of {list(SENSOR_FIDELITY_LEVELS)}")
+        self.fidelity = level
+        if self.sensors is not None: self.sensors.set_fidelity(level)
+
+    def profile_stats(self):
+        """p50/p95/p99 per component (see core.profiler), {} when profiling is off."""
+        return self.profiler.stats() if self.profiler else {}
 
     def step(self, action):
+        prof = self.profiler
+        if prof: t = prof.begin()
         self.step_count += 1
         
         # Convert -1..1 action to PWM
@@ -83,6 +200,7 @@ class RoverEnv(gym.Env):
         
         prev_pos = (self.rover.x, self.rover.y)
         self.rover.update([pwm_l, pwm_r])
+        if prof: t = prof.lap("rover", t)
         
         # --- COLLISION CHECKS ---
         collision = False
@@ -98,21 +216,24 @@ class RoverEnv(gym.Env):
             self.collided = True
             self.rover.x, self.rover.y = prev_pos
             self.rover.vx = 0.0; self.rover.omega = 0.0
+        if prof: t = prof.lap("collision", t)
 
         # --- SENSOR UPDATES ---
         self.sensors.update(self.obstacles + [self.dock.rect], self.dock)
         curr_dist = self.sensors.uwb.get_ground_truth_dist(self.dock)
+        if prof: t = prof.lap("sensors", t)
         
         reward = 0.0
         done = False
         info = { "stage": self.current_stage, "is_success": False }
+        w = self.rewards
         
         # Base Time Penalty (encourage speed, but small enough to allow patience)
         reward -= 0.005 
         
         if self.collided:
             # Big penalty for crashing
-            return self._get_observation(), -50.0, True, False, info
+            return self._observe(t if prof else None, info, True), w["collision"], True, False, info
 
         # ===================================================================
         # STAGE 0: SEARCH (The "Compass & Orbit" Phase)
@@ -150,7 +271,7 @@ class RoverEnv(gym.Env):
             # 3. Transition to Approach
             if seeing_ils:
                 if "found_beam" not in self.milestones:
-                    reward += 10.0
+                    reward += w["found_beam"]
                     self.milestones.add("found_beam")
                 self.current_stage = STAGE_APPROACH
 
@@ -162,7 +283,7 @@ class RoverEnv(gym.Env):
             
             # Check if we lost the beam
             if ir_data[0] == 0 and ir_data[1] == 0:
-                reward -= 2.0
+                reward += w["lost_beam"]
                 self.current_stage = STAGE_SEARCH # Fallback to search
             
             else:
@@ -194,7 +315,7 @@ class RoverEnv(gym.Env):
                 # Transition to Rotate
                 if ir_data[5] > 0: # Assuming index 5 is the "Close Range" or "Docked" sensor
                     if "reached_turn" not in self.milestones:
-                        reward += 20.0 
+                        reward += w["reached_turn"]
                         self.milestones.add("reached_turn")
                     self.current_stage = STAGE_ROTATE
                     self.rover.vx = 0 
@@ -214,7 +335,7 @@ class RoverEnv(gym.Env):
             
             if abs(angle_diff) < 10: # Strict alignment
                 if "aligned" not in self.milestones:
-                    reward += 20.0
+                    reward += w["aligned"]
                     self.milestones.add("aligned")
                 self.current_stage = STAGE_DOCKING
 
@@ -239,19 +360,124 @@ class RoverEnv(gym.Env):
             
             if is_touching:
                 if is_parallel and speed_ok:
-                    reward += 100.0 
+                    reward += w["docked"]
                     self.success = True
                     info["is_success"] = True
                     done = True
                 else:
-                    reward -= 50.0 # Crashing into dock or bad angle
+                    reward += w["bad_dock"] # Crashing into dock or bad angle
                     done = True 
 
         self.last_dist = curr_dist
         if self.step_count >= self.max_steps: 
             done = True
         
-        return self._get_observation(), reward, done, False, info
+        return self._observe(t if prof else None, info, done), reward, done, False, info
+
+    def _observe(self, t, info, done):
+        # _get_observation() plus end-of-step bookkeeping (curriculum, stage starts, profiler)
+        if done and self.curriculum is not None: info["difficulty"] = self.current_difficulty["name"]
+        if self.stage_starts is not None: self._track_stage_start(info, done)
+        prof = self.profiler
+        if not prof: return self._get_observation()
+        t = prof.lap("reward", t)
+        obs = self._get_observation()
+        prof.lap("observation", t)
+        prof.end()
+        if done and self.profile_info: info["profile"] = prof.stats()
+        return obs
+
+    def _track_stage_start(self, info, done):
+        if done:
+            self.stage_starts.record(self.start_stage, self.success)
+            info["start_stage"] = self.start_stage
+        elif self.current_stage != info["stage"]:
+            # Just entered a stage: keep the situation as a future start state
+            self.stage_starts.remember(self.current_stage, self.get_state())
+
+    def stage_start_stats(self):
+        """StageStartSampler.stats() of this env ({} without stage starts)."""
+        return self.stage_starts.stats() if self.stage_starts is not None else {}
+
+    def get_state(self):
+        """
+        Cheap snapshot for lookahead rollouts / re-testing a situation.
+        No pygame objects are copied; restore with set_state().
+        """
+        r = self.rover
+        return EnvState(
+            r.x, r.y, r.angle, r.vx, r.omega, r.pwm_l, r.pwm_r,
+            self.step_count, self.current_stage, frozenset(self.milestones),
+            self.approach_start_dist, self.approach_record,
+            self.last_dist, self.success, self.collided,
+            self.sensors.get_state(),
+            random.getstate(),
+            (self.obstacles, self.dock, self.current_difficulty),
+        )
+
+    def set_state(self, state):
+        """
+        Restores a snapshot taken by get_state() (possibly from another env).
+        Returns the observation for the restored state.
+        """
+        self.obstacles, self.dock, self.current_difficulty = state.world
+        
+        # Reuse the existing rover: the sensors hold a reference to it
+        if self.rover is None:
+            self.rover = Rover(state.x, state.y, state.angle)
+            self.sensors = self._make_sensors(self.profiler)
+        r = self.rover
+        r.x, r.y, r.angle = state.x, state.y, state.angle
+        r.vx, r.omega = state.vx, state.omega
+        r.pwm_l, r.pwm_r = state.pwm_l, state.pwm_r
+        
+        self.step_count = state.step_count
+        self.current_stage = state.stage
+        self.milestones = set(state.milestones)
+        self.approach_start_dist = state.approach_start_dist
+        self.approach_record = state.approach_record
+        self.last_dist = state.last_dist
+        self.success = state.success
+        self.collided = state.collided
+        
+        self.sensors.set_state(state.sensors)
+        random.setstate(state.rng_state)
+        return self._get_observation()
+
+    def render(self):
+        """
+        Draws the viewport offscreen and returns it as an (H, W, 3) uint8 array.
+        The array is a read-only view of the render buffer and is overwritten by
+        the next call, so .copy() it if frames are kept (e.g. for a video list).
+        """
+        if self.render_mode != "rgb_array":
+            return None
+        # Drawing code is only imported by envs that actually render
+        import pygame
+        from ui.parkpilot import draw_park_pilot
+        from ui.world_view import StaticWorldLayer, draw_lidar_rays
+        
+        if self._canvas is None:
+            self._frame = np.zeros((VIEWPORT_HEIGHT, VIEWPORT_WIDTH, 3), dtype=np.uint8)
+            # The surface draws straight into the NumPy buffer (no copy on return)
+            self._canvas = pygame.image.frombuffer(self._frame, (VIEWPORT_WIDTH, VIEWPORT_HEIGHT), "RGB")
+            self._frame_view = self._frame.view()
+            self._frame_view.flags.writeable = False
+            self._static_layer = StaticWorldLayer()
+        
+        # Static layer only changes with the world (reset or set_state)
+        self._canvas.blit(self._static_layer.get(self.obstacles, self.dock, self._canvas), (0, 0))
+        if math.isfinite(self.rover.x) and math.isfinite(self.rover.y):
+            draw_lidar_rays(self._canvas, self.rover, self.sensors.lidar)
+            draw_park_pilot(self._canvas, self.rover, self.sensors.prox, False)
+        self.rover.draw(self._canvas)
+        return self._frame_view
+
+    def close(self):
+        self._canvas = None
+        self._frame = None
+        self._frame_view = None
+        self._static_layer = None
 
     def _get_observation(self):
         sensor_data = self.sensors.get_normalized_array()
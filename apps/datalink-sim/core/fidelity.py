@@ -0,0 +1,38 @@
+from stable_baselines3.common.callbacks import BaseCallback
+from config import *
+
+class FidelityCallback(BaseCallback):
+    """
+    Switches the envs' sensor fidelity (RoverEnv.set_fidelity) on a timestep
+    schedule, e.g. [(0, "coarse"), (2_000_000, "standard")]: cheap sensors
+    while the policy is still learning to drive, full fidelity for the
+    fine-tuning. A switch takes effect at the next rollout. Logs
+    sensors/fidelity (index into SENSOR_FIDELITY_LEVELS).
+    """
+    def __init__(self, schedule=SENSOR_FIDELITY_SCHEDULE, verbose=0):
+        super().__init__(verbose)
+        for _, level in schedule:
+            if level not in SENSOR_FIDELITY_LEVELS:
+                raise ValueError(f"fidelity must be one of {list(SENSOR_FIDELITY_LEVELS)}")
+        self.schedule = sorted(schedule)
+        self.level = None
+
+    def level_at(self, timestep):
+        level = SENSOR_FIDELITY
+        for start, name in self.schedule:
+            if timestep >= start: level = name
+        return level
+
+    def _on_rollout_start(self):
+        level = self.level_at(self.num_timesteps)
+        if level != self.level:
+            # Env-wide and returns nothing, so RemoteVecEnv replays it on joiners
+            self.training_env.env_method("set_fidelity", level)
+            print(f"--- SENSOR FIDELITY: {level} ---")
+            self.level = level
+
+    def _on_step(self):
+        return True
+
+    def _on_rollout_end(self):
+        self.logger.record("sensors/fidelity", list(SENSOR_FIDELITY_LEVELS).index(self.level))
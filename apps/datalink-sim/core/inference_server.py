@@ -0,0 +1,142 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future
+import numpy as np
+
+# Latency histogram bucket upper edges (us), log-spaced 10us .. ~1s
+LATENCY_EDGES_US = np.round(np.logspace(1, 6, 26)).astype(np.int64)
+
+class InferenceServer:
+    """
+    Batches predict() calls from many concurrent callers (env threads, rovers)
+    into one forward pass per tick. A tick closes when max_batch requests are
+    queued or when the oldest one has waited max_wait_ms, whichever is first.
+    Works with anything that has the SB3 predict() signature (PPO, its policy,
+    core.numpy_policy.NumpyPolicy).
+
+    In-process only: requests travel over a thread queue, so callers must be
+    threads of the process that runs the server. Envs in SubprocVecEnv /
+    BatchedSubprocVecEnv workers or evaluate.py pool processes can't reach
+    it. (Training doesn't need it: SB3 already runs one batched forward pass
+    per VecEnv step in the learner for every worker's env.)
+    """
+    def __init__(self, policy, max_batch=64, max_wait_ms=2.0):
+        self.policy = policy
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()   # running flag + queue puts vs the stop sentinel
+        self.reset_stats()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="inference-server", daemon=True)
+                self._thread.start()
+                self._running = True
+        return self
+
+    def stop(self):
+        """Serves what was queued before the call, then fails anything left over."""
+        with self._lock:
+            if self._thread is None: return
+            self._running = False
+            self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._fail_pending()
+
+    # --- CLIENT SIDE ---
+    def submit(self, obs):
+        """Queues one observation; the Future resolves to its action."""
+        fut = Future()
+        item = (np.asarray(obs, dtype=np.float32), time.perf_counter(), fut)
+        with self._lock:
+            # Never queue where no server thread will look: result() would block forever
+            if not self._running:
+                raise RuntimeError("InferenceServer is not running (start() it first)")
+            self._queue.put(item)
+        return fut
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=True):
+        """Blocking, SB3-style: returns (action, None) for one observation."""
+        return self.submit(observation).result(), None
+
+    # --- SERVER THREAD ---
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._fail_pending()
+                return
+            batch = [first]
+            deadline = first[1] + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._serve(batch)
+            if stop:
+                self._fail_pending()
+                return
+
+    def _fail_pending(self):
+        # Requests behind the stop sentinel never get served
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                item[2].set_exception(RuntimeError("InferenceServer stopped"))
+
+    def _serve(self, batch):
+        obs = np.stack([b[0] for b in batch])
+        try:
+            actions, _ = self.policy.predict(obs, deterministic=True)
+        except Exception as e:
+            for _, _, fut in batch: fut.set_exception(e)
+            return
+        now = time.perf_counter()
+        for i, (_, t0, fut) in enumerate(batch):
+            fut.set_result(actions[i])
+            self.latency_hist[np.searchsorted(LATENCY_EDGES_US, (now - t0) * 1e6)] += 1
+        self.batch_hist[len(batch)] += 1
+
+    # --- STATS ---
+    def reset_stats(self):
+        self.batch_hist = np.zeros(self.max_batch + 1, dtype=np.int64)
+        self.latency_hist = np.zeros(len(LATENCY_EDGES_US) + 1, dtype=np.int64)
+
+    def latency_percentile(self, q):
+        """Upper bucket edge (us) below which q% of request latencies fall."""
+        total = self.latency_hist.sum()
+        if total == 0: return 0.0
+        i = int(np.searchsorted(np.cumsum(self.latency_hist), total * q / 100.0))
+        return float(LATENCY_EDGES_US[i]) if i < len(LATENCY_EDGES_US) else float("inf")
+
+    def stats(self):
+        batches = int(self.batch_hist.sum())
+        requests = int((self.batch_hist * np.arange(len(self.batch_hist))).sum())
+        latency_hist = {int(e): int(c) for e, c in zip(LATENCY_EDGES_US, self.latency_hist) if c}
+        if self.latency_hist[-1]: latency_hist["inf"] = int(self.latency_hist[-1])
+        return {
+            "requests": requests,
+            "batches": batches,
+            "mean_batch": requests / batches if batches else 0.0,
+            "latency_p50_us": self.latency_percentile(50),
+            "latency_p95_us": self.latency_percentile(95),
+            "latency_p99_us": self.latency_percentile(99),
+            "batch_hist": {n: int(c) for n, c in enumerate(self.batch_hist) if c},
+            "latency_hist_us": latency_hist,
+        }
@@ -0,0 +1,133 @@
+import os
+import re
+import copy
+import glob
+import time
+import threading
+from config import *
+
+def checkpoint_step(path):
+    """Training step encoded in a train_ai.py checkpoint name (0 if none)."""
+    m = re.search(r"ppo_rover_(\d+)\.zip$", path)
+    return int(m.group(1)) if m else 0
+
+class ModelWatcher:
+    """
+    Watches the checkpoint directory from a background thread and loads new
+    policies without blocking the caller. The newest checkpoint (by training
+    step, then mtime) is loaded once it has stopped changing; after the first
+    full PPO.load only the policy weights are read from the zip and put into a
+    copy of the current policy. The main loop picks the result up with poll()
+    between frames, so the swap is a single reference assignment.
+    """
+    def __init__(self, models_dir=MODELS_DIR, interval=MODEL_WATCH_INTERVAL):
+        self.models_dir = models_dir
+        self.interval = interval
+
+        self.policy = None          # owned by the polling thread
+        self.step = None            # checkpoint step of self.policy
+        self.path = None
+        self.load_ms = 0.0          # wall time of the last load
+        self.loading = False
+
+        self._lock = threading.Lock()
+        self._ready = None          # (policy, path, step, load_ms) waiting for poll()
+        self._template = None       # latest loaded policy, deep-copied for weight-only loads
+        self._seen = {}             # path -> (size, mtime) at the previous scan
+        self._tried = None          # (path, size, mtime) of the last load attempt
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+            self._thread.start()
+
+    def rescan(self):
+        """Scan now instead of waiting for the next interval."""
+        self.start()
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+
+    def poll(self):
+        """Swaps in a freshly loaded policy. Returns True if the policy changed."""
+        if self._ready is None:
+            return False
+        with self._lock:
+            policy, path, step, load_ms = self._ready
+            self._ready = None
+        self.policy = policy
+        self.path = path
+        self.step = step
+        self.load_ms = load_ms
+        return True
+
+    # --- BACKGROUND THREAD ---
+    def _run(self):
+        while not self._stop.is_set():
+            self._scan()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _scan(self):
+        files = glob.glob(os.path.join(self.models_dir, "*.zip"))
+        seen = {}
+        for f in files:
+            try:
+                st = os.stat(f)
+            except OSError:
+                continue    # removed between glob and stat
+            seen[f] = (st.st_size, st.st_mtime)
+        prev, self._seen = self._seen, seen
+        if not seen:
+            return
+
+        latest = max(seen, key=lambda f: (checkpoint_step(f), seen[f][1]))
+        size, mtime = seen[latest]
+        attempt = (latest, size, mtime)
+        if attempt == self._tried:
+            return
+        # Still being written: wait until it is unchanged across two scans
+        # (or old enough that nothing is touching it any more)
+        if prev.get(latest) != (size, mtime) and time.time() - mtime < self.interval:
+            return
+
+        self._tried = attempt
+        self.loading = True
+        t0 = time.perf_counter()
+        try:
+            policy = self._load(latest)
+        except Exception as e:
+            print(f"Error loading model {latest}: {e}")
+            return
+        finally:
+            self.loading = False
+        load_ms = (time.perf_counter() - t0) * 1000.0
+
+        self._template = policy
+        with self._lock:
+            self._ready = (policy, latest, checkpoint_step(latest), load_ms)
+        print(f"LOADED AI MODEL: {latest} ({load_ms:.0f} ms)")
+
+    def _load(self, path):
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.save_util import load_from_zip_file
+
+        if self._template is not None:
+            # Weights only: same architecture as the policy we already have
+            _, params, _ = load_from_zip_file(path, device="cpu", load_data=False)
+            policy = copy.deepcopy(self._template)
+            try:
+                policy.load_state_dict(params["policy"])
+                policy.set_training_mode(False)
+                return policy
+            except (KeyError, RuntimeError):
+                pass    # architecture changed: fall back to a full load
+        return PPO.load(path, device="cpu").policy
@@ -0,0 +1,96 @@
+import numpy as np
+
+# Weight storage formats for export_policy(); inference always runs in float32
+WEIGHT_DTYPES = ("float32", "float16", "int8")
+ACTIVATIONS = {
+    "tanh": np.tanh,
+    "relu": lambda x: np.maximum(x, 0.0, out=x),
+}
+
+def _quantize_int8(w):
+    # Symmetric, one scale per output row
+    scale = np.abs(w).max(axis=1, keepdims=True) / 127.0
+    scale[scale == 0.0] = 1.0
+    q = np.clip(np.round(w / scale), -127, 127).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+def export_policy(zip_path, out_path, dtype="float32"):
+    """
+    Writes the actor of an SB3 MlpPolicy checkpoint (models/PPO/*.zip) to a
+    small .npz that NumpyPolicy runs without torch. Only the deterministic
+    path is kept: policy_net layers + action_net, plus the action bounds.
+    """
+    if dtype not in WEIGHT_DTYPES:
+        raise ValueError(f"dtype must be one of {WEIGHT_DTYPES}")
+    import torch.nn as nn
+    from stable_baselines3 import PPO
+
+    policy = PPO.load(zip_path, device="cpu").policy
+    linears = [m for m in policy.mlp_extractor.policy_net if isinstance(m, nn.Linear)]
+    linears.append(policy.action_net)
+    acts = [m for m in policy.mlp_extractor.policy_net if not isinstance(m, nn.Linear)]
+    act = type(acts[0]).__name__.lower() if acts else "tanh"
+    if act not in ACTIVATIONS:
+        raise ValueError(f"Unsupported activation: {act}")
+
+    arrays = {
+        "dtype": np.array(dtype),
+        "activation": np.array(act),
+        "n_layers": np.array(len(linears)),
+        "obs_dim": np.array(policy.observation_space.shape[0]),
+        "action_low": policy.action_space.low.astype(np.float32),
+        "action_high": policy.action_space.high.astype(np.float32),
+        "squash_output": np.array(bool(policy.squash_output)),
+    }
+    for i, layer in enumerate(linears):
+        w = layer.weight.detach().cpu().numpy().astype(np.float32)
+        b = layer.bias.detach().cpu().numpy().astype(np.float32)
+        if dtype == "int8":
+            arrays[f"w{i}"], arrays[f"s{i}"] = _quantize_int8(w)
+        else:
+            arrays[f"w{i}"] = w.astype(dtype)
+        arrays[f"b{i}"] = b
+    np.savez_compressed(out_path, **arrays)
+
+class NumpyPolicy:
+    """
+    Torch-free deterministic actor loaded from export_policy() output.
+    predict() follows the SB3 signature, so it can stand in for
+    PPO.predict / policy.predict (single observation or a batch).
+    """
+    def __init__(self, path):
+        with np.load(path) as f:
+            self.dtype = str(f["dtype"])
+            self.obs_dim = int(f["obs_dim"])
+            self.low = f["action_low"]
+            self.high = f["action_high"]
+            self.squash = bool(f["squash_output"])
+            self.act = ACTIVATIONS[str(f["activation"])]
+            self.layers = []
+            for i in range(int(f["n_layers"])):
+                w = f[f"w{i}"].astype(np.float32)
+                if self.dtype == "int8": w *= f[f"s{i}"]
+                # Stored (out, in) like torch; kept as (in, out) for x @ W
+                self.layers.append((np.ascontiguousarray(w.T), f[f"b{i}"].astype(np.float32)))
+
+    def forward(self, obs):
+        """(N, obs_dim) float32 -> (N, action_dim) action means."""
+        x = obs
+        last = len(self.layers) - 1
+        for i, (w, b) in enumerate(self.layers):
+            x = x @ w
+            x += b
+            if i < last: x = self.act(x)
+        return x
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=True):
+        obs = np.asarray(observation, dtype=np.float32)
+        single = obs.ndim == 1
+        if single: obs = obs[None, :]
+        actions = self.forward(obs)
+        if self.squash:
+            # tanh-squashed policies: rescale [-1, 1] to the action bounds
+            actions = self.low + (0.5 * (np.tanh(actions) + 1.0) * (self.high - self.low))
+        else:
+            np.clip(actions, self.low, self.high, out=actions)
+        return (actions[0] if single else actions), None
@@ -0,0 +1,80 @@
+from time import perf_counter_ns
+import numpy as np
+from config import *
+
+class StepProfiler:
+    """
+    Per-component timings for RoverEnv.step(). Each component keeps its last
+    `window` samples (ns) in a fixed-size ring buffer; stats() aggregates them.
+    Call sites hold `None` instead of a profiler when profiling is off, so the
+    disabled cost is one truth test per component.
+
+        t = prof.begin()
+        ...work...
+        t = prof.lap("rover", t)
+        ...
+        prof.end()
+    """
+    def __init__(self, window=PROFILE_WINDOW):
+        self.window = window
+        self._buffers = {}
+        self._counts = {}
+        self._t_step = 0
+
+    def begin(self):
+        self._t_step = t = perf_counter_ns()
+        return t
+
+    def lap(self, name, t0):
+        """Records the time since t0 under `name` and returns now (the next t0)."""
+        now = perf_counter_ns()
+        self.record(name, now - t0)
+        return now
+
+    def end(self):
+        self.record("step", perf_counter_ns() - self._t_step)
+
+    def record(self, name, ns):
+        buf = self._buffers.get(name)
+        if buf is None:
+            buf = self._buffers[name] = np.zeros(self.window, dtype=np.int64)
+            self._counts[name] = 0
+        n = self._counts[name]
+        buf[n % self.window] = ns
+        self._counts[name] = n + 1
+
+    def reset(self):
+        self._buffers.clear()
+        self._counts.clear()
+
+    def stats(self):
+        """{component: {count, mean_us, p50_us, p95_us, p99_us, share}} over the window."""
+        out = {}
+        step_mean = None
+        if "step" in self._buffers:
+            step_mean = self._samples("step").mean()
+        for name in self._buffers:
+            data = self._samples(name)
+            p50, p95, p99 = np.percentile(data, (50, 95, 99)) / 1000.0
+            mean = data.mean()
+            out[name] = {
+                "count": self._counts[name],
+                "mean_us": mean / 1000.0,
+                "p50_us": p50, "p95_us": p95, "p99_us": p99,
+                # Fraction of the mean step time (components overlap: sensors
+                # contains the sensor.* entries)
+                "share": mean / step_mean if step_mean else None,
+            }
+        return out
+
+    def _samples(self, name):
+        return self._buffers[name][:min(self._counts[name], self.window)]
+
+def format_stats(stats):
+    """Text table of StepProfiler.stats(), slowest first."""
+    lines = [f"{'component':<18s}{'count':>8s}{'mean':>12s}{'p50':>12s}{'p95':>12s}{'p99':>12s}{'share':>8s}"]
+    for name, s in sorted(stats.items(), key=lambda kv: -kv[1]["mean_us"]):
+        share = "" if s["share"] is None else f"{s['share']:.1%}"
+        lines.append(f"{name:<18s}{s['count']:>8d}{s['mean_us']:>10.1f}us{s['p50_us']:>10.1f}us"
+                     f"{s['p95_us']:>10.1f}us{s['p99_us']:>10.1f}us{share:>8s}")
+    return "\n".join(lines)
@@ -0,0 +1,459 @@
+import os
+import json
+import time
+import queue
+import socket
+import struct
+import threading
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv, DummyVecEnv
+from config import *
+
+# --- WIRE PROTOCOL ---
+# Every message is [kind u8][length u32][payload]. Steps are raw little-endian
+# arrays; control messages are JSON. Nothing is unpickled, so a bad peer can
+# at worst send garbage, not code.
+HELLO, ASSIGN, RESET, OBS, STEP, RESULT, CALL, REPLY, CLOSE = range(1, 10)
+HEADER = struct.Struct("<BI")
+COUNT = struct.Struct("<I")
+
+def send_msg(sock, kind, payload=b""):
+    sock.sendall(HEADER.pack(kind, len(payload)) + payload)
+    return HEADER.size + len(payload)
+
+def recv_exact(sock, n):
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:])
+        if k == 0: raise ConnectionError("peer closed the connection")
+        got += k
+    return buf
+
+def recv_msg(sock):
+    kind, size = HEADER.unpack(recv_exact(sock, HEADER.size))
+    return kind, recv_exact(sock, size) if size else b""
+
+def _json(obj):
+    return json.dumps(obj, separators=(",", ":"), default=_to_builtin).encode()
+
+def _to_builtin(x):
+    if isinstance(x, np.generic): return x.item()
+    if isinstance(x, np.ndarray): return x.tolist()
+    if isinstance(x, (set, tuple)): return list(x)
+    raise TypeError(f"{type(x).__name__} is not JSON serialisable")
+
+def pack_result(obs, rews, dones, infos):
+    """RESULT payload: obs, rewards, dones, terminal obs of the done envs, then
+    the remaining info dicts as JSON."""
+    terminal = [info.pop("terminal_observation") for info in infos if "terminal_observation" in info]
+    extra = _json(infos)
+    parts = [COUNT.pack(len(extra)), obs.tobytes(), rews.astype(np.float32).tobytes(),
+             dones.astype(np.uint8).tobytes()]
+    parts += [t.tobytes() for t in terminal]
+    parts.append(extra)
+    return b"".join(parts)
+
+def unpack_result(buf, n, obs_shape, obs_dtype):
+    (extra_len,) = COUNT.unpack_from(buf)
+    obs_size = int(np.prod(obs_shape)) * np.dtype(obs_dtype).itemsize
+    pos = COUNT.size
+    obs = np.frombuffer(buf, obs_dtype, n * int(np.prod(obs_shape)), pos).reshape((n,) + obs_shape)
+    pos += n * obs_size
+    rews = np.frombuffer(buf, np.float32, n, pos)
+    pos += 4 * n
+    dones = np.frombuffer(buf, np.uint8, n, pos).astype(bool)
+    pos += n
+    infos = json.loads(bytes(buf[len(buf) - extra_len:]))
+    for i in np.flatnonzero(dones):
+        infos[i]["terminal_observation"] = np.frombuffer(buf, obs_dtype, int(np.prod(obs_shape)), pos).reshape(obs_shape)
+        pos += obs_size
+    return obs, rews, dones, infos
+
+# ===================================================================
+# LEARNER SIDE
+# ===================================================================
+class RemoteWorker:
+    """Learner-side handle of one connected rollout worker."""
+    def __init__(self, sock, address, hello):
+        self.sock = sock
+        self.address = address
+        self.name = hello.get("name") or f"{address[0]}:{address[1]}"
+        self.capacity = hello["capacity"]
+        self.slots = []
+        self.joined = time.perf_counter()
+        self.steps = 0              # env steps (slots x vec steps)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.wait_s = 0.0           # actions sent -> result received
+        self.sent_at = 0.0
+        self.vec_steps = 0
+
+    def send(self, kind, payload=b""):
+        self.bytes_out += send_msg(self.sock, kind, payload)
+
+    def recv(self, expect):
+        kind, payload = recv_msg(self.sock)
+        self.bytes_in += HEADER.size + len(payload)
+        if kind != expect: raise ConnectionError(f"expected message {expect}, got {kind}")
+        return payload
+
+    def call(self, request):
+        self.send(CALL, _json(request))
+        reply = json.loads(bytes(self.recv(REPLY)))
+        if "error" in reply: raise RuntimeError(f"{self.name}: {reply['error']}")
+        return reply["result"]
+
+    def close(self):
+        try:
+            send_msg(self.sock, CLOSE)
+        except OSError:
+            pass
+        self.sock.close()
+
+class RemoteVecEnv(VecEnv):
+    """
+    VecEnv whose envs live in rollout workers on other machines (or local
+    processes), connected over TCP. Start the learner, then any number of
+    `python rollout_worker.py --learner host:port` processes.
+
+    num_envs is fixed (PPO's rollout buffer is sized by it). Joining workers
+    fill free env slots up to their capacity; spare ones wait on standby.
+    When a worker drops out or misses step_timeout, its slots end their
+    episodes as truncated and are handed to the next standby or joining
+    worker; until one arrives, step() blocks (join_timeout=None) or raises.
+
+    Stepping is lockstep: a worker only gets new actions after its last
+    result has been read, so neither side can run ahead and queue up data
+    (backpressure), and a stalled learner simply stalls the workers.
+
+    The protocol has no authentication: any process that can reach host:port
+    can join and send trajectories. The default binds to loopback only; bind
+    to a LAN address or "0.0.0.0" only on a trusted network.
+    """
+    def __init__(self, num_envs, observation_space, action_space, host=REMOTE_HOST, port=REMOTE_PORT,
+                 step_timeout=REMOTE_STEP_TIMEOUT, join_timeout=None, verbose=1):
+        super().__init__(num_envs, observation_space, action_space)
+        self.step_timeout = step_timeout
+        self.join_timeout = join_timeout
+        self.verbose = verbose
+        self.obs_shape = tuple(observation_space.shape)
+        self.obs_dtype = np.dtype(observation_space.dtype)
+        self.act_dtype = np.dtype(action_space.dtype)
+        self.owner = [None] * num_envs
+        self.workers = []           # active
+        self.standby = []
+        self.departed = []          # stats of workers that left
+        self._sticky = {}           # env-wide setter calls, replayed on joining workers
+        self._last_obs = np.zeros((num_envs,) + self.obs_shape, dtype=self.obs_dtype)
+        self._actions = None
+
+        self._server = socket.create_server((host, port))
+        self.address = self._server.getsockname()
+        self._pending = queue.Queue()
+        self._closed = False
+        self._listener = threading.Thread(target=self._accept_loop, name="remote-vec-env", daemon=True)
+        self._listener.start()
+        self._log(f"LISTENING on {self.address[0]}:{self.address[1]} for {num_envs} envs")
+
+    def _log(self, msg):
+        if self.verbose: print(f"[remote] {msg}")
+
+    # --- JOIN / LEAVE ---
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                sock, address = self._server.accept()
+            except OSError:
+                return
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(self.step_timeout)
+                kind, payload = recv_msg(sock)
+                hello = json.loads(bytes(payload))
+                if kind != HELLO: raise ConnectionError("no HELLO")
+                if tuple(hello["obs_shape"]) != self.obs_shape or tuple(hello["act_shape"]) != self.action_space.shape:
+                    raise ConnectionError(f"space mismatch: {hello['obs_shape']} / {hello['act_shape']}")
+                if not isinstance(hello["capacity"], int) or hello["capacity"] < 1:
+                    raise ConnectionError(f"capacity must be >= 1, got {hello['capacity']!r}")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[remote] REJECTED {address}: {e}")
+                sock.close()
+                continue
+            self._pending.put(RemoteWorker(sock, address, hello))
+
+    def _next_worker(self, block):
+        """A standby worker, else a newly joined one (waiting for it if block)."""
+        if self.standby:
+            return self.standby.pop(0)
+        if not block:
+            try:
+                return self._pending.get_nowait()
+            except queue.Empty:
+                return None
+        deadline = None if self.join_timeout is None else time.perf_counter() + self.join_timeout
+        while True:
+            try:
+                return self._pending.get(timeout=10.0)
+            except queue.Empty:
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise RuntimeError(f"No rollout worker joined within {self.join_timeout} s")
+                free = self.owner.count(None)
+                self._log(f"WAITING for workers: {free}/{self.num_envs} envs unassigned")
+
+    def _fill(self, block):
+        """Assigns free slots to standby/joining workers and resets them; {slot: obs}."""
+        new_obs = {}
+        while None in self.owner:
+            worker = self._next_worker(block)
+            if worker is None: break
+            free = [i for i, w in enumerate(self.owner) if w is None]
+            slots = free[:worker.capacity]
+            try:
+                worker.send(ASSIGN, _json({"envs": len(slots)}))
+                for request in self._sticky.values(): worker.call(request)
+                worker.send(RESET, _json({"seeds": [self._seeds[i] for i in slots],
+                                          "options": [self._options[i] for i in slots]}))
+                obs, _ = self._unpack_obs(worker.recv(OBS), len(slots))
+            except (OSError, ConnectionError, RuntimeError) as e:
+                self._log(f"LOST {worker.name} while joining: {e}")
+                worker.close()
+                continue
+            worker.slots = slots
+            taken = {w.name for w in self.workers}
+            if worker.name in taken:
+                worker.name = next(f"{worker.name}#{k}" for k in range(2, len(taken) + 2) if f"{worker.name}#{k}" not in taken)
+            for k, i in enumerate(slots):
+                self.owner[i] = worker
+                new_obs[i] = obs[k]
+            self.workers.append(worker)
+            self._log(f"JOINED {worker.name}: envs {slots[0]}-{slots[-1]} ({len(self.workers)} workers)")
+        # Anyone else who joined waits on standby
+        while not self._pending.empty():
+            worker = self._pending.get_nowait()
+            try:
+                worker.send(ASSIGN, _json({"envs": 0}))
+            except OSError:
+                continue
+            self.standby.append(worker)
+            self._log(f"STANDBY {worker.name}")
+        return new_obs
+
+    def _drop(self, worker, reason):
+        self._log(f"LEFT {worker.name} ({reason}): envs {worker.slots[0]}-{worker.slots[-1]} freed")
+        for i in worker.slots: self.owner[i] = None
+        self.workers.remove(worker)
+        self.departed.append(self._worker_stats(worker))
+        worker.close()
+
+    def _unpack_obs(self, payload, n):
+        (extra_len,) = COUNT.unpack_from(payload)
+        size = n * int(np.prod(self.obs_shape))
+        obs = np.frombuffer(payload, self.obs_dtype, size, COUNT.size).reshape((n,) + self.obs_shape)
+        return obs, json.loads(bytes(payload[len(payload) - extra_len:]))
+
+    # --- VECENV API ---
+    def reset(self):
+        self.reset_infos = [{} for _ in range(self.num_envs)]
+        obs = self._last_obs
+        for worker in list(self.workers):
+            try:
+                worker.send(RESET, _json({"seeds": [self._seeds[i] for i in worker.slots],
+                                          "options": [self._options[i] for i in worker.slots]}))
+                o, infos = self._unpack_obs(worker.recv(OBS), len(worker.slots))
+            except (OSError, ConnectionError) as e:
+                self._drop(worker, e)
+                continue
+            obs[worker.slots] = o
+            for k, i in enumerate(worker.slots): self.reset_infos[i] = infos[k]
+        for i, o in self._fill(block=True).items(): obs[i] = o
+        self._reset_seeds()
+        self._reset_options()
+        return obs.copy()
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions, dtype=self.act_dtype)
+        for worker in list(self.workers):
+            try:
+                worker.send(STEP, np.ascontiguousarray(self._actions[worker.slots]).tobytes())
+                worker.sent_at = time.perf_counter()
+            except OSError as e:
+                self._drop(worker, e)
+
+    def step_wait(self):
+        n = self.num_envs
+        obs = np.empty((n,) + self.obs_shape, dtype=self.obs_dtype)
+        rews = np.zeros(n, dtype=np.float32)
+        dones = np.zeros(n, dtype=bool)
+        infos = [{} for _ in range(n)]
+        for worker in list(self.workers):
+            try:
+                payload = worker.recv(RESULT)
+            except (OSError, ConnectionError) as e:
+                self._drop(worker, "timeout" if isinstance(e, socket.timeout) else e)
+                continue
+            o, r, d, inf = unpack_result(payload, len(worker.slots), self.obs_shape, self.obs_dtype)
+            worker.wait_s += time.perf_counter() - worker.sent_at
+            worker.vec_steps += 1
+            worker.steps += len(worker.slots)
+            s = worker.slots
+            obs[s], rews[s], dones[s] = o, r, d
+            for k, i in enumerate(s): infos[i] = inf[k]
+
+        # Slots whose worker left: the episode ends (truncated) and a new
+        # worker's fresh episode continues in the slot
+        for i, o in self._fill(block=True).items():
+            infos[i] = {"terminal_observation": self._last_obs[i].copy(), "TimeLimit.truncated": True}
+            obs[i], rews[i], dones[i] = o, 0.0, True
+        self._last_obs = obs
+        return obs.copy(), rews, dones, infos
+
+    def close(self):
+        if self._closed: return
+        self._closed = True
+        for worker in self.workers + self.standby: worker.close()
+        self._server.close()
+
+    def get_images(self):
+        return [None] * self.num_envs
+
+    # --- PER-ENV CALLS (routed to the owning worker) ---
+    def _call(self, request, indices):
+        indices = list(self._get_indices(indices))
+        results = {}
+        for worker in list(self.workers):
+            local = [k for k, i in enumerate(worker.slots) if i in indices]
+            if not local: continue
+            try:
+                out = worker.call(dict(request, indices=local))
+            except (OSError, ConnectionError) as e:
+                self._drop(worker, e)
+                continue
+            for k, r in zip(local, out): results[worker.slots[k]] = r
+        # Env-wide calls that return nothing (set_attr, enable_profiling, ...)
+        # are configuration: the latest one per name is replayed on joiners
+        if len(indices) == self.num_envs and not any(r is not None for r in results.values()):
+            self._sticky[(request["kind"], request["name"])] = request
+        # Slots of a worker that dropped out meanwhile come back as None
+        return [results.get(i) for i in indices]
+
+    def get_attr(self, attr_name, indices=None):
+        return self._call({"kind": "get_attr", "name": attr_name}, indices)
+
+    def set_attr(self, attr_name, value, indices=None):
+        self._call({"kind": "set_attr", "name": attr_name, "value": value}, indices)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return self._call({"kind": "env_method", "name": method_name, "args": method_args, "kwargs": method_kwargs}, indices)
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return self._call({"kind": "is_wrapped", "name": wrapper_class.__name__}, indices)
+
+    # --- STATS ---
+    @staticmethod
+    def _worker_stats(worker):
+        elapsed = time.perf_counter() - worker.joined
+        return {
+            "name": worker.name,
+            "envs": len(worker.slots),
+            "steps": worker.steps,
+            "steps_per_s": worker.steps / elapsed if elapsed > 0 else 0.0,
+            "bytes_per_step": (worker.bytes_in + worker.bytes_out) / worker.steps if worker.steps else None,
+            "bytes_in": worker.bytes_in,
+            "bytes_out": worker.bytes_out,
+            "round_trip_ms": worker.wait_s / worker.vec_steps * 1000.0 if worker.vec_steps else None,
+        }
+
+    def worker_stats(self):
+        """Per active worker: env steps/s since joining, network bytes per env step, round trip."""
+        return [self._worker_stats(w) for w in self.workers]
+
+# ===================================================================
+# WORKER SIDE
+# ===================================================================
+def _is_wrapped(env, name):
+    while env is not None:
+        if type(env).__name__ == name: return True
+        env = getattr(env, "env", None)
+    return False
+
+def _handle_call(venv, envs, request):
+    local = request.get("indices")
+    kind, name = request["kind"], request["name"]
+    if kind == "env_method":
+        return venv.env_method(name, *request["args"], indices=local, **request["kwargs"])
+    if kind == "get_attr":
+        return venv.get_attr(name, indices=local)
+    if kind == "set_attr":
+        venv.set_attr(name, request["value"], indices=local)
+        return [None] * len(venv._get_indices(local))
+    if kind == "is_wrapped":
+        return [_is_wrapped(envs[i], name) for i in venv._get_indices(local)]
+    raise ValueError(f"Unknown call {kind}")
+
+def serve_learner(sock, envs, name, report_every=30.0):
+    """Serves one learner connection with up to len(envs) envs. Returns on CLOSE."""
+    venv = None
+    obs_space, act_space = envs[0].observation_space, envs[0].action_space
+    send_msg(sock, HELLO, _json({"name": name, "capacity": len(envs),
+                                 "obs_shape": obs_space.shape, "act_shape": act_space.shape}))
+    steps = nbytes = 0
+    t_report = time.perf_counter()
+    while True:
+        kind, payload = recv_msg(sock)
+        nbytes += HEADER.size + len(payload)
+        if kind == STEP:
+            actions = np.frombuffer(payload, act_space.dtype).reshape((venv.num_envs,) + act_space.shape)
+            venv.step_async(actions)
+            obs, rews, dones, infos = venv.step_wait()
+            nbytes += send_msg(sock, RESULT, pack_result(obs, rews, dones, list(infos)))
+            steps += venv.num_envs
+            if time.perf_counter() - t_report > report_every:
+                dt = time.perf_counter() - t_report
+                print(f"[{name}] {steps / dt:.1f} steps/s, {nbytes / max(steps, 1):.0f} bytes/step")
+                steps = nbytes = 0
+                t_report = time.perf_counter()
+        elif kind == RESET:
+            req = json.loads(bytes(payload))
+            venv._seeds, venv._options = req["seeds"], req["options"]
+            obs = venv.reset()
+            extra = _json(venv.reset_infos)
+            nbytes += send_msg(sock, OBS, COUNT.pack(len(extra)) + obs.tobytes() + extra)
+        elif kind == ASSIGN:
+            k = json.loads(bytes(payload))["envs"]
+            venv = DummyVecEnv([lambda e=e: e for e in envs[:k]]) if k else None
+            print(f"[{name}] {'RUNNING ' + str(k) + ' envs' if k else 'STANDBY'}")
+        elif kind == CALL:
+            try:
+                reply = {"result": _handle_call(venv, envs, json.loads(bytes(payload)))}
+            except Exception as e:
+                reply = {"error": f"{type(e).__name__}: {e}"}
+            nbytes += send_msg(sock, REPLY, _json(reply))
+        elif kind == CLOSE:
+            return
+
+def run_rollout_worker(host, port, env_fn, capacity, name=None, retry=5.0, once=False):
+    """Connects to a learner and serves it; reconnects when it goes away."""
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    envs = [env_fn() for _ in range(capacity)]
+    try:
+        while True:
+            try:
+                sock = socket.create_connection((host, port))
+            except OSError:
+                print(f"[{name}] no learner at {host}:{port}, retrying in {retry:.0f} s")
+                time.sleep(retry)
+                continue
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                serve_learner(sock, envs, name)
+                print(f"[{name}] learner closed the session")
+            except (OSError, ConnectionError) as e:
+                print(f"[{name}] connection lost: {e}")
+            finally:
+                sock.close()
+            if once: return
+            time.sleep(retry)
+    finally:
+        for env in envs: env.close()
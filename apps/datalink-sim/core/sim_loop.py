@@ -0,0 +1,174 @@
+import os
+import time
+import numpy as np
+from config import *
+from core.environment import RoverEnv
+from core.model_watcher import ModelWatcher
+
+class SimLoop:
+    """
+    Simulation side of the UI: env stepping, AI policy, manual input and
+    episode bookkeeping (collision / docked resets, turbo accumulator).
+    main.py drives it in-process, core.sim_process runs it in its own process.
+    """
+    def __init__(self, env=None):
+        self.env = env if env is not None else RoverEnv()
+        self.ai_model = None
+        self.ai_active = False
+        self.ai_pending = False     # AI requested before any model was loaded
+        self.models = ModelWatcher()
+        self.paused = False         # menus open: no stepping
+
+        self.dock_timer = 0
+        self.has_left_dock = False
+        self.world_id = 0           # bumped on every reset, lets the UI spot new worlds
+
+        # --- TURBO / FAST-FORWARD (AI mode) ---
+        self.speed_idx = 0
+        self.sim_acc = 0.0          # unsimulated real time (s) x speed
+        self.env_steps = 0
+        self.sim_rate = 0.0         # achieved env steps / s
+        self._rate_t0 = time.perf_counter()
+        self._rate_steps = 0
+
+        self.obs, _ = self.env.reset()
+
+    @property
+    def speed(self):
+        return SIM_SPEEDS[self.speed_idx]
+
+    # --- MODEL HOT-RELOAD ---
+    def watch_models(self):
+        """Starts loading checkpoints in the background (newest first, then every new one)."""
+        if not os.path.exists(self.models.models_dir):
+            print(f"Waiting for training... Directory {self.models.models_dir} not found yet.")
+        self.models.start()
+
+    @property
+    def model_step(self):
+        return self.models.step
+
+    @property
+    def model_load_ms(self):
+        return self.models.load_ms
+
+    @property
+    def model_loading(self):
+        return self.models.loading
+
+    def _swap_model(self):
+        # Between frames only: the next predict() uses the new policy
+        if self.models.poll():
+            self.ai_model = self.models.policy
+            if self.ai_pending:
+                self.ai_pending = False
+                self.ai_active = True
+
+    # --- COMMANDS ---
+    def reset(self):
+        self.obs, _ = self.env.reset()
+        self.has_left_dock = False
+        self.world_id += 1
+
+    def set_difficulty(self, diff_preset):
+        self.env.current_difficulty = diff_preset
+        self.reset()
+
+    def set_spawn_on_dock(self, flag):
+        self.env.spawn_on_dock_setting = flag
+
+    def toggle_ai(self):
+        if self.ai_model is None:
+            # Turns on as soon as the watcher has a policy
+            print("AI Button Pressed: Searching for new models...")
+            self.ai_pending = not self.ai_pending
+            if self.ai_pending: self.models.rescan()
+            return
+        self.ai_active = not self.ai_active
+
+    def cycle_speed(self):
+        self.speed_idx = (self.speed_idx + 1) % len(SIM_SPEEDS)
+        self.sim_acc = 0.0
+
+    def set_paused(self, flag):
+        self.paused = flag
+
+    # --- STEPPING ---
+    def tick(self, frame_dt, deadline, manual_action=None):
+        """
+        Advances the sim for one displayed frame (nothing while paused). In AI
+        mode the speed multiplier decides how many DT steps run; otherwise one
+        manual step.
+        manual_action: (action_l, action_r, brake)
+        """
+        self._swap_model()
+        running = not self.paused
+        if running and self.ai_active and self.ai_model is not None:
+            # Fixed-timestep accumulator: each step is DT of sim time
+            if self.speed == 0:
+                # Unlimited: fill the frame budget, keep at least one step
+                self.ai_step()
+                while time.perf_counter() < deadline: self.ai_step()
+            else:
+                self.sim_acc += min(frame_dt, 0.1) * self.speed
+                while self.sim_acc >= DT:
+                    self.ai_step()
+                    self.sim_acc -= DT
+                    # Can't keep up: drop the backlog instead of stalling the UI
+                    if time.perf_counter() >= deadline: self.sim_acc = 0.0
+        elif running and manual_action is not None:
+            self.manual_step(*manual_action)
+
+        # Achieved sim rate for the HUD
+        now = time.perf_counter()
+        if now - self._rate_t0 >= 0.5:
+            self.sim_rate = (self.env_steps - self._rate_steps) / (now - self._rate_t0)
+            self._rate_t0 = now
+            self._rate_steps = self.env_steps
+
+    def ai_step(self):
+        # Predict action
+        action, _states = self.ai_model.predict(self.obs, deterministic=True)
+
+        # Sanitize Output
+        if not np.isfinite(action).all():
+            print("WARNING: AI output NaN/Inf! Resetting env.")
+            action = np.zeros_like(action)
+            self.obs, _ = self.env.reset()
+            self.world_id += 1
+
+        # Step
+        self.obs, reward, terminated, truncated, info = self.env.step(action)
+
+        # Back-calculate PWM for UI text
+        self.env.rover.pwm_l = action[0] * 255
+        self.env.rover.pwm_r = action[1] * 255
+        self._after_step()
+
+    def manual_step(self, action_l, action_r, brake=False):
+        if brake: self.env.rover.vx = 0
+        self.obs, reward, terminated, truncated, info = self.env.step([action_l, action_r])
+        self._after_step()
+
+    def _after_step(self):
+        self.env_steps += 1
+
+        # Check collisions/Success
+        if self.env.collided:
+            self.reset()
+        elif self.ai_active and self.env.step_count >= self.env.max_steps:
+            # Episode timed out: start the next one
+            self.reset()
+
+        if not self.env.success: self.has_left_dock = True
+
+        # Counted in sim steps, so docking holds for 1s of sim time at any speed
+        if self.env.success and self.has_left_dock:
+            self.dock_timer += 1
+            if self.dock_timer > FPS * 1:
+                self.reset()
+                self.dock_timer = 0
+        else: self.dock_timer = 0
+
+    def close(self):
+        self.models.stop()
@@ -0,0 +1,298 @@
+import time
+import queue
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+from config import *
+from entities.rover import Rover
+from entities.dock import DockingStation
+from sensors.sensor_suite import SensorSuite
+
+# --- SHARED STATE LAYOUT (float64) ---
+# Scalars first, then the raw sensor arrays in SensorSuite.get_state() order.
+STATE_FIELDS = [
+    "world_id", "x", "y", "angle", "vx", "omega", "pwm_l", "pwm_r",
+    "stage", "step_count", "last_dist", "collided", "success",
+    "ai_active", "speed_idx", "sim_rate", "env_steps",
+    "model_step", "model_load_ms", "model_loading", "ai_pending",
+]
+F = {name: i for i, name in enumerate(STATE_FIELDS)}
+SENSOR_SIZES = [LIDAR_NUM_RAYS, 5, 3, 6, 4]    # lidar, prox, uwb, ir, rear
+STATE_SIZE = len(STATE_FIELDS) + sum(SENSOR_SIZES)
+
+DIFFICULTIES = [DIFF_EASY, DIFF_MEDIUM, DIFF_HARD, DIFF_DOCKING]
+
+class StateBuffer:
+    """
+    Single-writer double buffer in shared memory, guarded by per-slot sequence
+    numbers (odd while a write is in progress). The writer always fills the slot
+    the reader is not pointed at; a reader that gets lapped simply retries.
+    Layout: [latest_slot, seq0, seq1, slot0 (size), slot1 (size)]
+    """
+    def __init__(self, size=STATE_SIZE, name=None):
+        self.size = size
+        create = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=(3 + 2 * size) * 8)
+        self.name = self.shm.name
+        self.buf = np.ndarray((3 + 2 * size,), dtype=np.float64, buffer=self.shm.buf)
+        if create: self.buf[:] = 0.0
+        self._last = None
+
+    def write(self, vec):
+        slot = 1 - int(self.buf[0])
+        start = 3 + slot * self.size
+        self.buf[1 + slot] += 1.0
+        self.buf[start:start + self.size] = vec
+        self.buf[1 + slot] += 1.0
+        self.buf[0] = slot
+
+    def read(self, out):
+        """Copies the latest complete state into `out`. Returns False if nothing new."""
+        for _ in range(8):
+            slot = int(self.buf[0])
+            seq = self.buf[1 + slot]
+            if seq % 2: continue
+            start = 3 + slot * self.size
+            out[:] = self.buf[start:start + self.size]
+            if self.buf[1 + slot] == seq:
+                new = (slot, seq) != self._last
+                self._last = (slot, seq)
+                return new
+        return False
+
+    def close(self, unlink=False):
+        self.buf = None
+        self.shm.close()
+        if unlink: self.shm.unlink()
+
+def pack_state(sim, out):
+    env = sim.env
+    r = env.rover
+    out[F["world_id"]] = sim.world_id
+    out[F["x"]] = r.x; out[F["y"]] = r.y; out[F["angle"]] = r.angle
+    out[F["vx"]] = r.vx; out[F["omega"]] = r.omega
+    out[F["pwm_l"]] = r.pwm_l; out[F["pwm_r"]] = r.pwm_r
+    out[F["stage"]] = env.current_stage
+    out[F["step_count"]] = env.step_count
+    out[F["last_dist"]] = env.last_dist
+    out[F["collided"]] = env.collided
+    out[F["success"]] = env.success
+    out[F["ai_active"]] = sim.ai_active
+    out[F["speed_idx"]] = sim.speed_idx
+    out[F["sim_rate"]] = sim.sim_rate
+    out[F["env_steps"]] = sim.env_steps
+    out[F["model_step"]] = -1 if sim.model_step is None else sim.model_step
+    out[F["model_load_ms"]] = sim.model_load_ms
+    out[F["model_loading"]] = sim.model_loading
+    out[F["ai_pending"]] = sim.ai_pending
+
+    lidar, prox, uwb, ir, rear = env.sensors.get_state()[:5]     # readings only
+    i = len(STATE_FIELDS)
+    for arr in (lidar, prox, uwb, ir, rear):
+        out[i:i + len(arr)] = arr
+        i += len(arr)
+    return out
+
+def pack_world(sim):
+    env = sim.env
+    return (
+        sim.world_id,
+        [tuple(r) for r in env.obstacles],
+        tuple(env.dock.rect), env.dock.side_index,
+        DIFFICULTIES.index(env.current_difficulty),
+    )
+
+# ===================================================================
+# SIM PROCESS
+# ===================================================================
+def run_sim_process(shm_name, commands, worlds, preload_model=False):
+    # Imported here: the UI process never needs the env / SB3 stack
+    from core.sim_loop import SimLoop
+
+    sim = SimLoop()
+    buf = StateBuffer(name=shm_name)
+    vec = np.zeros(STATE_SIZE)
+    manual = (0.0, 0.0, False)
+    published_world = None
+
+    worlds.put(pack_world(sim))
+    published_world = sim.world_id
+    buf.write(pack_state(sim, vec))
+    if preload_model: sim.watch_models()
+
+    period = 1.0 / FPS
+    last = time.perf_counter()
+    next_tick = last
+    running = True
+    while running:
+        # --- INPUT ---
+        while True:
+            try: cmd = commands.get_nowait()
+            except queue.Empty: break
+            kind = cmd[0]
+            if kind == "manual": manual = cmd[1:]
+            elif kind == "reset": sim.reset()
+            elif kind == "difficulty": sim.set_difficulty(DIFFICULTIES[cmd[1]])
+            elif kind == "spawn_on_dock": sim.set_spawn_on_dock(cmd[1])
+            elif kind == "toggle_ai": sim.toggle_ai()
+            elif kind == "speed": sim.cycle_speed()
+            elif kind == "pause": sim.set_paused(cmd[1])
+            elif kind == "quit": running = False
+
+        now = time.perf_counter()
+        sim.tick(now - last, now + period, manual)
+        last = now
+
+        # World first, so the UI has it by the time it sees the new world_id
+        if sim.world_id != published_world:
+            worlds.put(pack_world(sim))
+            published_world = sim.world_id
+        buf.write(pack_state(sim, vec))
+
+        next_tick += period
+        delay = next_tick - time.perf_counter()
+        if delay > 0: time.sleep(delay)
+        else: next_tick = time.perf_counter()
+
+    sim.close()
+    buf.close()
+
+# ===================================================================
+# UI SIDE
+# ===================================================================
+class MirrorEnv:
+    """
+    Read-only stand-in for RoverEnv in the UI process. Holds exactly what the
+    drawing code reads, refreshed from the shared state buffer.
+    """
+    def __init__(self):
+        self.rover = Rover(0.0, 0.0, 0.0)
+        self.sensors = SensorSuite(self.rover)
+        self.obstacles = []
+        self.dock = None
+        self.current_difficulty = DIFF_MEDIUM
+        self.current_stage = 0
+        self.step_count = 0
+        self.max_steps = MAX_STEPS
+        self.last_dist = 0.0
+        self.collided = False
+        self.success = False
+
+    def set_world(self, world):
+        _, obstacles, dock_rect, dock_side, diff_idx = world
+        self.obstacles = [pygame.Rect(r) for r in obstacles]
+        self.dock = DockingStation(pygame.Rect(dock_rect), dock_side)
+        self.current_difficulty = DIFFICULTIES[diff_idx]
+
+    def set_state(self, vec):
+        r = self.rover
+        r.x, r.y, r.angle = float(vec[F["x"]]), float(vec[F["y"]]), float(vec[F["angle"]])
+        r.vx, r.omega = float(vec[F["vx"]]), float(vec[F["omega"]])
+        r.pwm_l, r.pwm_r = float(vec[F["pwm_l"]]), float(vec[F["pwm_r"]])
+        self.current_stage = int(vec[F["stage"]])
+        self.step_count = int(vec[F["step_count"]])
+        self.last_dist = float(vec[F["last_dist"]])
+        self.collided = bool(vec[F["collided"]])
+        self.success = bool(vec[F["success"]])
+
+        parts = []
+        i = len(STATE_FIELDS)
+        for n in SENSOR_SIZES:
+            parts.append(vec[i:i + n])
+            i += n
+        lidar, prox, uwb, ir, rear = parts
+        self.sensors.set_state((lidar, prox, tuple(uwb), ir, rear))
+
+class SimClient:
+    """
+    UI-side handle on a simulation running in its own process. Mirrors the
+    SimLoop interface main.py uses; commands go over a queue, state comes back
+    through a shared-memory double buffer, worlds (on reset only) over a queue.
+    """
+    def __init__(self, startup_timeout=60.0, preload_model=False):
+        ctx = mp.get_context("spawn")   # never fork a process holding a pygame display
+        self.buffer = StateBuffer()
+        self.commands = ctx.Queue()
+        self.worlds = ctx.Queue()
+        self.proc = ctx.Process(target=run_sim_process, args=(self.buffer.name, self.commands, self.worlds, preload_model), daemon=True)
+        self.proc.start()
+
+        self.env = MirrorEnv()
+        self._vec = np.zeros(STATE_SIZE)
+        self._pending = {}           # world_id -> world received ahead of its state
+        self.world_id = -1
+        self.ai_active = False
+        self.speed_idx = 0
+        self.sim_rate = 0.0
+        self.env_steps = 0
+        self.model_step = None
+        self.model_load_ms = 0.0
+        self.model_loading = False
+        self.ai_pending = False
+        self._last_manual = None
+        self._paused = False
+
+        first = self.worlds.get(timeout=startup_timeout)
+        self._pending[first[0]] = first
+        deadline = time.perf_counter() + startup_timeout
+        while self.world_id < 0 and time.perf_counter() < deadline:
+            self.tick(0.0, 0.0)
+            time.sleep(0.01)
+        if self.world_id < 0:
+            raise RuntimeError("Sim process did not publish a state")
+
+    @property
+    def speed(self):
+        return SIM_SPEEDS[self.speed_idx]
+
+    # --- COMMANDS ---
+    def reset(self): self.commands.put(("reset",))
+    def set_difficulty(self, diff_preset): self.commands.put(("difficulty", DIFFICULTIES.index(diff_preset)))
+    def set_spawn_on_dock(self, flag): self.commands.put(("spawn_on_dock", flag))
+    def toggle_ai(self): self.commands.put(("toggle_ai",))
+    def cycle_speed(self): self.commands.put(("speed",))
+
+    def set_paused(self, flag):
+        if flag != self._paused:
+            self.commands.put(("pause", flag))
+            self._paused = flag
+
+    def tick(self, frame_dt, deadline, manual_action=None):
+        # Input only goes over the queue when it changes
+        if manual_action is not None and manual_action != self._last_manual:
+            self.commands.put(("manual",) + tuple(manual_action))
+            self._last_manual = manual_action
+
+        while True:
+            try: world = self.worlds.get_nowait()
+            except queue.Empty: break
+            self._pending[world[0]] = world
+
+        if not self.buffer.read(self._vec):
+            return
+        world_id = int(self._vec[F["world_id"]])
+        if world_id != self.world_id:
+            world = self._pending.pop(world_id, None)
+            if world is None:
+                return      # state for a world we haven't received yet: keep the last frame
+            self._pending = {k: v for k, v in self._pending.items() if k > world_id}
+            self.env.set_world(world)
+            self.world_id = world_id
+
+        self.env.set_state(self._vec)
+        self.ai_active = bool(self._vec[F["ai_active"]])
+        self.speed_idx = int(self._vec[F["speed_idx"]])
+        self.sim_rate = float(self._vec[F["sim_rate"]])
+        self.env_steps = int(self._vec[F["env_steps"]])
+        step = int(self._vec[F["model_step"]])
+        self.model_step = None if step < 0 else step
+        self.model_load_ms = float(self._vec[F["model_load_ms"]])
+        self.model_loading = bool(self._vec[F["model_loading"]])
+        self.ai_pending = bool(self._vec[F["ai_pending"]])
+
+    def close(self):
+        self.commands.put(("quit",))
+        self.proc.join(timeout=2.0)
+        if self.proc.is_alive(): self.proc.terminate()
+        self.buffer.close(unlink=True)
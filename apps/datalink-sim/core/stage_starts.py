@@ -0,0 +1,120 @@
+import math
+from collections import deque
+from config import *
+from core.physics import circle_rect_collision
+
+LATE_STAGES = (STAGE_APPROACH, STAGE_ROTATE, STAGE_DOCKING)
+
+# Milestones already earned by an episode that starts in a stage, so their
+# bonuses aren't paid out again
+STAGE_MILESTONES = {
+    STAGE_APPROACH: {"found_beam"},
+    STAGE_ROTATE: {"found_beam", "reached_turn"},
+    STAGE_DOCKING: {"found_beam", "reached_turn", "aligned"},
+}
+
+class StageStartSampler:
+    """
+    Reverse-curriculum episode starts for RoverEnv(stage_starts=...).
+
+    A fraction `search_fraction` of episodes starts normally (SEARCH, random
+    spawn). The rest start directly in APPROACH, ROTATE or DOCKING, weighted
+    by how often episodes started there still fail (1 - rolling success,
+    floored at min_weight): stages the policy has mastered are shown less.
+
+    Start states come from either:
+      pose   sampled around the dock from its geometry (facing_angle,
+             emit_pos, base_pos), checked against the obstacles
+      cache  a snapshot (RoverEnv.get_state) taken when an earlier episode
+             entered that stage; used with probability cache_fraction
+    """
+    def __init__(self, search_fraction=STAGE_START_SEARCH_FRACTION, cache_fraction=0.5,
+                 cache_size=STAGE_START_CACHE_SIZE, window=100, min_weight=0.1):
+        self.search_fraction = search_fraction
+        self.cache_fraction = cache_fraction
+        self.min_weight = min_weight
+        self.cache = {s: deque(maxlen=cache_size) for s in LATE_STAGES}
+        self.outcomes = {s: deque(maxlen=window) for s in (STAGE_SEARCH,) + LATE_STAGES}
+
+    # --- MIX ---
+    def success_rate(self, stage):
+        o = self.outcomes[stage]
+        return sum(o) / len(o) if o else None
+
+    def weights(self):
+        """{stage: probability of starting an episode there}."""
+        w = {s: max(self.min_weight, 1.0 - (self.success_rate(s) or 0.0)) for s in LATE_STAGES}
+        total = sum(w.values())
+        out = {STAGE_SEARCH: self.search_fraction}
+        for s in LATE_STAGES: out[s] = (1.0 - self.search_fraction) * w[s] / total
+        return out
+
+    def pick(self, rng):
+        w = self.weights()
+        stages = list(w)
+        return stages[rng.choice(len(stages), p=[w[s] for s in stages])]
+
+    def record(self, start_stage, success):
+        self.outcomes[start_stage].append(bool(success))
+
+    # --- START STATES ---
+    def remember(self, stage, state):
+        if stage in self.cache: self.cache[stage].append(state)
+
+    def cached(self, stage, rng):
+        c = self.cache[stage]
+        if not c or rng.random() >= self.cache_fraction: return None
+        return c[rng.integers(len(c))]
+
+    def pose(self, stage, dock, obstacles, rng, tol_dist=DIFF_MEDIUM["dist"], tries=20):
+        """
+        (x, y, angle) for a start in `stage` in front of `dock`, or None.
+        tol_dist is the episode's docking distance tolerance (difficulty "dist").
+        """
+        facing = dock.facing_angle
+        for _ in range(tries):
+            if stage == STAGE_DOCKING:
+                # Lined up in front of the dock, rear towards it and within the
+                # angle tolerance, with the charging port still 10-45 px beyond
+                # the distance tolerance: the rover has to back in to dock
+                d = ROVER_RADIUS + tol_dist + rng.uniform(10.0, 45.0)
+                lateral = rng.uniform(-8.0, 8.0)
+                f = math.radians(facing)
+                x = dock.base_pos[0] + d * math.cos(f) - lateral * math.sin(f)
+                y = dock.base_pos[1] + d * math.sin(f) + lateral * math.cos(f)
+                angle = facing + rng.uniform(-8.0, 8.0)
+            else:
+                if stage == STAGE_ROTATE:
+                    # At the turn point: on the beam centre line, IR_TURN_DIST out
+                    d = IR_TURN_DIST + rng.uniform(-0.6, 0.6) * IR_TURN_TOLERANCE
+                    rel = rng.uniform(-0.8, 0.8) * IR_CONE_INNER
+                    heading_noise = 20.0
+                else:
+                    # In the beam, between the turn point and the end of the runway
+                    d = rng.uniform(IR_TURN_DIST + IR_TURN_TOLERANCE + ROVER_RADIUS, 240.0)
+                    rel = rng.uniform(-20.0, 20.0)
+                    heading_noise = 25.0
+                a = math.radians(facing + rel)
+                x = dock.emit_pos[0] + d * math.cos(a)
+                y = dock.emit_pos[1] + d * math.sin(a)
+                to_dock = math.degrees(math.atan2(dock.emit_pos[1] - y, dock.emit_pos[0] - x))
+                angle = to_dock + rng.uniform(-heading_noise, heading_noise)
+            if self._clear(x, y, dock, obstacles): return x, y, angle % 360
+        return None
+
+    @staticmethod
+    def _clear(x, y, dock, obstacles):
+        if not (ROVER_RADIUS < x < VIEWPORT_WIDTH - ROVER_RADIUS and ROVER_RADIUS < y < VIEWPORT_HEIGHT - ROVER_RADIUS):
+            return False
+        if circle_rect_collision((x, y), ROVER_RADIUS, dock.rect): return False
+        return not any(circle_rect_collision((x, y), ROVER_RADIUS, r) for r in obstacles)
+
+    def stats(self):
+        """{stage name: {weight, success, episodes, cached}}"""
+        w = self.weights()
+        return {STAGE_NAMES[s]: {
+            "weight": w[s],
+            "success": self.success_rate(s),
+            "episodes": len(self.outcomes[s]),
+            "cached": len(self.cache.get(s, ())),
+        } for s in w}
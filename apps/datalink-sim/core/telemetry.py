@@ -0,0 +1,147 @@
+import time
+from time import perf_counter_ns
+import numpy as np
+import gymnasium as gym
+from stable_baselines3.common.callbacks import BaseCallback
+
+class TelemetryWrapper(gym.Wrapper):
+    """
+    Worker-side timing for TelemetryCallback. Every step's info carries
+    info["telemetry"] = (step_ns, resets, reset_ns_total); the reset figures
+    are cumulative because SB3 workers auto-reset after the info is built.
+    """
+    def __init__(self, env):
+        super().__init__(env)
+        self.resets = 0
+        self.reset_ns = 0
+
+    def reset(self, **kwargs):
+        t = perf_counter_ns()
+        out = self.env.reset(**kwargs)
+        self.reset_ns += perf_counter_ns() - t
+        self.resets += 1
+        return out
+
+    def step(self, action):
+        t = perf_counter_ns()
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        info["telemetry"] = (perf_counter_ns() - t, self.resets, self.reset_ns)
+        return obs, reward, terminated, truncated, info
+
+class TelemetryCallback(BaseCallback):
+    """
+    Logs training throughput to TensorBoard (via the SB3 logger) once per
+    rollout, so a run shows whether it is bound by simulation, IPC or the PPO
+    update:
+      telemetry/env_steps_per_s    env steps / rollout wall time
+      telemetry/rollout_s, update_s, rollout_fraction
+      telemetry/vec_step_ms        wall time per VecEnv step, incl. inference
+      telemetry/worker_step_ms     RoverEnv.step inside the workers (mean, max)
+      telemetry/overhead_ms        vec step - slowest worker step (IPC + inference)
+      telemetry/worker_<i>_step_ms, resets, reset_ms
+      profile/<component>_mean_us, _p95_us   RoverEnv profiler, averaged over workers
+      remote/<worker>_steps_per_s, _bytes_per_step, _round_trip_ms   (RemoteVecEnv only)
+    Envs must be wrapped in TelemetryWrapper for the worker figures.
+    """
+    def __init__(self, profile=True, per_worker=True, verbose=0):
+        super().__init__(verbose)
+        self.profile = profile
+        self.per_worker = per_worker
+        self._rollout_end = None
+        self._update_s = None
+
+    def _on_training_start(self):
+        n = self.training_env.num_envs
+        self._resets = np.zeros(n, dtype=np.int64)
+        self._reset_ns = np.zeros(n, dtype=np.int64)
+        if self.profile:
+            self.training_env.env_method("enable_profiling", True)
+
+    def _on_rollout_start(self):
+        now = time.perf_counter()
+        if self._rollout_end is not None:
+            # PPO trains between the end of one rollout and the start of the next
+            self._update_s = now - self._rollout_end
+        n = self.training_env.num_envs
+        self._t0 = self._last = now
+        self._vec_steps = 0
+        self._vec_s = 0.0
+        self._worker_ns = np.zeros(n, dtype=np.int64)
+        self._worker_n = np.zeros(n, dtype=np.int64)
+        self._slowest_ns = 0
+        self._start_resets = self._resets.copy()
+        self._start_reset_ns = self._reset_ns.copy()
+
+    def _on_step(self):
+        now = time.perf_counter()
+        self._vec_s += now - self._last
+        self._last = now
+        self._vec_steps += 1
+
+        slowest = 0
+        for i, info in enumerate(self.locals["infos"]):
+            tel = info.get("telemetry")
+            if tel is None: continue
+            step_ns, resets, reset_ns = tel
+            self._worker_ns[i] += step_ns
+            self._worker_n[i] += 1
+            self._resets[i], self._reset_ns[i] = resets, reset_ns
+            if step_ns > slowest: slowest = step_ns
+        self._slowest_ns += slowest
+        return True
+
+    def _on_rollout_end(self):
+        self._rollout_end = now = time.perf_counter()
+        rollout_s = now - self._t0
+        log = self.logger.record
+        steps = self._vec_steps * self.training_env.num_envs
+        log("telemetry/env_steps_per_s", steps / rollout_s if rollout_s > 0 else 0.0)
+        log("telemetry/rollout_s", rollout_s)
+        if self._update_s is not None:
+            log("telemetry/update_s", self._update_s)
+            log("telemetry/rollout_fraction", rollout_s / (rollout_s + self._update_s))
+
+        if self._vec_steps == 0: return
+        vec_ms = self._vec_s / self._vec_steps * 1000.0
+        log("telemetry/vec_step_ms", vec_ms)
+        active = self._worker_n > 0
+        if active.any():
+            per_worker_ms = self._worker_ns[active] / self._worker_n[active] / 1e6
+            log("telemetry/worker_step_ms", float(per_worker_ms.mean()))
+            log("telemetry/worker_step_ms_max", float(per_worker_ms.max()))
+            log("telemetry/overhead_ms", vec_ms - self._slowest_ns / self._vec_steps / 1e6)
+
+            resets = self._resets - self._start_resets
+            reset_ns = self._reset_ns - self._start_reset_ns
+            log("telemetry/resets", int(resets.sum()))
+            if resets.sum() > 0:
+                log("telemetry/reset_ms", float(reset_ns.sum() / resets.sum() / 1e6))
+            if self.per_worker:
+                for i in np.flatnonzero(active):
+                    log(f"telemetry/worker_{i}_step_ms", float(self._worker_ns[i] / self._worker_n[i] / 1e6))
+                    log(f"telemetry/worker_{i}_resets", int(resets[i]))
+
+        if self.profile:
+            self._log_profile(self.training_env.env_method("profile_stats"))
+        if hasattr(self.training_env, "worker_stats"):
+            self._log_remote(self.training_env.worker_stats())
+
+    def _log_profile(self, per_worker):
+        # Remote envs whose worker just left report None
+        per_worker = [s for s in per_worker if s]
+        names = set()
+        for stats in per_worker: names.update(stats)
+        for name in sorted(names):
+            rows = [s[name] for s in per_worker if name in s]
+            self.logger.record(f"profile/{name}_mean_us", float(np.mean([r["mean_us"] for r in rows])))
+            self.logger.record(f"profile/{name}_p95_us", float(np.mean([r["p95_us"] for r in rows])))
+
+    def _log_remote(self, workers):
+        # RemoteVecEnv: throughput and traffic of each rollout worker
+        self.logger.record("remote/workers", len(workers))
+        for w in workers:
+            self.logger.record(f"remote/{w['name']}_steps_per_s", w["steps_per_s"])
+            if w["bytes_per_step"] is not None:
+                self.logger.record(f"remote/{w['name']}_bytes_per_step", w["bytes_per_step"])
+            if w["round_trip_ms"] is not None:
+                self.logger.record(f"remote/{w['name']}_round_trip_ms", w["round_trip_ms"])
@@ -0,0 +1,178 @@
+import os
+import json
+import multiprocessing as mp
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv, DummyVecEnv, SubprocVecEnv
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper
+from config import *
+
+# Used when there is no train_layout.json (the old hardcoded setup)
+DEFAULT_LAYOUT = {"vec_env": "subproc", "num_envs": 8, "envs_per_worker": 1, "torch_threads": None}
+
+def _batched_worker(remote, parent_remote, env_fns_wrapper):
+    parent_remote.close()
+    venv = DummyVecEnv(env_fns_wrapper.var)
+    while True:
+        try:
+            cmd, data = remote.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if cmd == "step":
+            venv.step_async(data)
+            obs, rews, dones, infos = venv.step_wait()
+            remote.send((obs, rews, dones, infos, venv.reset_infos))
+        elif cmd == "reset":
+            venv._seeds, venv._options = data
+            obs = venv.reset()
+            remote.send((obs, venv.reset_infos))
+        elif cmd == "get_spaces":
+            remote.send((venv.observation_space, venv.action_space))
+        elif cmd == "env_method":
+            name, args, kwargs, indices = data
+            remote.send(venv.env_method(name, *args, indices=indices, **kwargs))
+        elif cmd == "get_attr":
+            remote.send(venv.get_attr(*data))
+        elif cmd == "set_attr":
+            venv.set_attr(*data)
+            remote.send([None] * len(data[2]))
+        elif cmd == "is_wrapped":
+            remote.send(venv.env_is_wrapped(*data))
+        elif cmd == "render":
+            remote.send(venv.get_images())
+        elif cmd == "close":
+            venv.close()
+            remote.close()
+            break
+        else:
+            raise NotImplementedError(f"`{cmd}` is not implemented in the batched worker")
+
+class BatchedSubprocVecEnv(VecEnv):
+    """
+    SubprocVecEnv with several envs per process: each worker steps its slice
+    of envs in a DummyVecEnv and answers with one message per step. Fewer
+    processes than envs means fewer context switches and pipe round trips,
+    which is what limits SubprocVecEnv once the env count exceeds the cores.
+    """
+    def __init__(self, env_fns, envs_per_worker=2, start_method=None):
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        ctx = mp.get_context(start_method)
+        self.waiting = False
+        self.closed = False
+
+        # Worker w owns envs [starts[w], starts[w+1])
+        chunks = [env_fns[i:i + envs_per_worker] for i in range(0, len(env_fns), envs_per_worker)]
+        self.starts = np.cumsum([0] + [len(c) for c in chunks])
+        self.remotes, self.processes = [], []
+        for chunk in chunks:
+            remote, work_remote = ctx.Pipe()
+            process = ctx.Process(target=_batched_worker, args=(work_remote, remote, CloudpickleWrapper(chunk)), daemon=True)
+            process.start()
+            work_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+        self.remotes[0].send(("get_spaces", None))
+        observation_space, action_space = self.remotes[0].recv()
+        super().__init__(len(env_fns), observation_space, action_space)
+
+    def step_async(self, actions):
+        for w, remote in enumerate(self.remotes):
+            remote.send(("step", actions[self.starts[w]:self.starts[w + 1]]))
+        self.waiting = True
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        obs, rews, dones, infos, reset_infos = zip(*results)
+        self.reset_infos = [i for chunk in reset_infos for i in chunk]
+        return (np.concatenate(obs), np.concatenate(rews), np.concatenate(dones),
+                [i for chunk in infos for i in chunk])
+
+    def reset(self):
+        for w, remote in enumerate(self.remotes):
+            lo, hi = self.starts[w], self.starts[w + 1]
+            remote.send(("reset", (self._seeds[lo:hi], self._options[lo:hi])))
+        results = [remote.recv() for remote in self.remotes]
+        obs, reset_infos = zip(*results)
+        self.reset_infos = [i for chunk in reset_infos for i in chunk]
+        self._reset_seeds()
+        self._reset_options()
+        return np.concatenate(obs)
+
+    def close(self):
+        if self.closed: return
+        if self.waiting:
+            for remote in self.remotes: remote.recv()
+        for remote in self.remotes: remote.send(("close", None))
+        for process in self.processes: process.join()
+        self.closed = True
+
+    def get_images(self):
+        for remote in self.remotes: remote.send(("render", None))
+        return [img for remote in self.remotes for img in remote.recv()]
+
+    # --- PER-ENV CALLS (routed to the owning worker) ---
+    def _call(self, cmd, indices, make_data):
+        """Sends cmd to every worker owning one of `indices`; results in env order."""
+        by_worker = {}
+        for i in self._get_indices(indices):
+            w = int(np.searchsorted(self.starts, i, side="right")) - 1
+            by_worker.setdefault(w, []).append(i - int(self.starts[w]))
+        for w, local in by_worker.items():
+            self.remotes[w].send((cmd, make_data(local)))
+        return [r for w in by_worker for r in self.remotes[w].recv()]
+
+    def get_attr(self, attr_name, indices=None):
+        return self._call("get_attr", indices, lambda local: (attr_name, local))
+
+    def set_attr(self, attr_name, value, indices=None):
+        self._call("set_attr", indices, lambda local: (attr_name, value, local))
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return self._call("env_method", indices, lambda local: (method_name, method_args, method_kwargs, local))
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return self._call("is_wrapped", indices, lambda local: (wrapper_class, local))
+
+# ===================================================================
+# TRAINING LAYOUT
+# ===================================================================
+def load_layout(path=TRAIN_LAYOUT_FILE):
+    """The layout written by autotune.py, or DEFAULT_LAYOUT if there is none."""
+    layout = dict(DEFAULT_LAYOUT)
+    if os.path.exists(path):
+        with open(path) as f:
+            layout.update(json.load(f))
+    return layout
+
+def save_layout(layout, path=TRAIN_LAYOUT_FILE):
+    with open(path + ".tmp", "w") as f:
+        json.dump(layout, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def make_layout_vec_env(env_fn, layout, seed=None):
+    """Builds the VecEnv a layout describes ('dummy', 'subproc', 'batched' or 'remote')."""
+    n = layout["num_envs"]
+    env_fns = [env_fn] * n
+    kind = layout["vec_env"]
+    if kind == "remote":
+        # Envs come from rollout_worker.py processes; spaces from a local instance.
+        # Local workers only unless the layout's "bind" names another interface:
+        # anyone who can connect can feed trajectories into the update. (Its
+        # "host" is autotune.py's record of the machine it measured.)
+        from core.remote_vec_env import RemoteVecEnv
+        probe = env_fn()
+        venv = RemoteVecEnv(n, probe.observation_space, probe.action_space,
+                            host=layout.get("bind", REMOTE_HOST), port=layout.get("port", REMOTE_PORT))
+        probe.close()
+    elif kind == "dummy":
+        venv = DummyVecEnv(env_fns)
+    elif kind == "subproc":
+        venv = SubprocVecEnv(env_fns)
+    elif kind == "batched":
+        venv = BatchedSubprocVecEnv(env_fns, layout["envs_per_worker"])
+    else:
+        raise ValueError(f"Unknown vec_env kind: {kind}")
+    if seed is not None: venv.seed(seed)
+    return venv
@@ -0,0 +1,80 @@
+import os
+import random
+import numpy as np
+import pygame
+from config import *
+from core.world_gen import generate_world
+
+MAX_RECTS = 64      # walls + obstacles per world
+
+# One record per world; np.save/np.load(mmap_mode="r") keep it as a flat file
+# that every process maps read-only instead of holding its own copy
+WORLD_DTYPE = np.dtype([
+    ("n_rects", np.int32),
+    ("rects", np.int32, (MAX_RECTS, 4)),
+    ("dock", np.int32, (4,)),
+    ("side", np.int32),
+    ("start", np.float64, (3,)),        # x, y, angle
+])
+
+def build_world_bank(path, count, difficulty=DIFF_MEDIUM, seed=0):
+    """Generates `count` worlds with generate_world() and saves them to `path` (.npy)."""
+    bank = np.zeros(count, dtype=WORLD_DTYPE)
+    state = random.getstate()
+    random.seed(seed)
+    for i in range(count):
+        rects, dock_rect, side, start_pos, start_angle = generate_world(False, difficulty)
+        rec = bank[i]
+        rec["n_rects"] = len(rects)
+        rec["rects"][:len(rects)] = [tuple(r) for r in rects]
+        rec["dock"] = tuple(dock_rect)
+        rec["side"] = side
+        rec["start"] = (start_pos[0], start_pos[1], start_angle)
+    random.setstate(state)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.save(path + ".tmp.npy", bank)
+    os.replace(path + ".tmp.npy", path)
+    # The difficulty only matters for the docking tolerances; keep it alongside
+    with open(path + ".difficulty", "w") as f:
+        f.write(difficulty["name"])
+    return path
+
+class WorldBank:
+    """
+    Read-only, memory-mapped set of pre-generated worlds. RoverEnv(world_bank=...)
+    draws its worlds from here instead of calling generate_world(), so runs
+    that share a bank train and evaluate on exactly the same maps.
+    `start`/`stop` select a slice (e.g. train vs eval worlds).
+    """
+    def __init__(self, path, start=0, stop=None):
+        self.path = path
+        self.data = np.load(path, mmap_mode="r")
+        self.start = start
+        self.stop = len(self.data) if stop is None else stop
+        with open(path + ".difficulty") as f:
+            name = f.read().strip()
+        self.difficulty = next(d for d in (DIFF_EASY, DIFF_MEDIUM, DIFF_HARD, DIFF_DOCKING) if d["name"] == name)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def subset(self, start, stop):
+        """A bank over worlds [start, stop) of this one (same file mapping)."""
+        return WorldBank(self.path, self.start + start, self.start + stop)
+
+    def sample(self, rng):
+        return int(rng.integers(len(self)))
+
+    def world(self, i):
+        """World i of this slice, in generate_world()'s return format."""
+        rec = self.data[self.start + i]
+        rects = [pygame.Rect(*map(int, r)) for r in rec["rects"][:rec["n_rects"]]]
+        x, y, angle = rec["start"]
+        return rects, pygame.Rect(*map(int, rec["dock"])), int(rec["side"]), (float(x), float(y)), float(angle)
+
+    def __getstate__(self):
+        # Pickled into pool workers as a path; each maps the file itself
+        return {"path": self.path, "start": self.start, "stop": self.stop}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["start"], state["stop"])
@@ -47,8 +47,9 @@ class DockingStation:
         else: return pygame.Rect(r.right, r.top, depth, r.height)
 
     def draw(self, surface):
+        from ui.overlays import get_overlay
         pygame.draw.rect(surface, COLOR_DOCK_BODY, self.rect)
-        s = pygame.Surface((self.zone_rect.width, self.zone_rect.height), pygame.SRCALPHA)
+        s = get_overlay("dock_zone", self.zone_rect.size, clear=False)
         s.fill(COLOR_DOCK_ZONE)
         surface.blit(s, self.zone_rect.topleft)
         pygame.draw.line(surface, (255, 200, 0, 100), self.line_start, self.line_end, 1)
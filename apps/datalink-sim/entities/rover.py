@@ -3,10 +3,16 @@ import math
 from config import *
 
 class Rover:
+    # Shared sprite atlas: the sprite pre-rotated every ROVER_SPRITE_STEP_DEG.
+    # Built lazily on the first draw, once per process (headless envs never pay).
+    _atlas = None
+    _atlas_step = None
+
     def __init__(self, x, y, angle_deg):
-        self.x = x
-        self.y = y
-        self.angle = angle_deg 
+        # Plain floats throughout: pygame drawing rejects NumPy scalars
+        self.x = float(x)
+        self.y = float(y)
+        self.angle = float(angle_deg)
         
         # Physics State
         self.vx = 0.0 
@@ -16,13 +22,13 @@ class Rover:
         self.pwm_l = 0
         self.pwm_r = 0
 
-        self.original_image = self._create_rover_surface()
-
     def update(self, pwm_action):
         """
         pwm_action: [pwm_left, pwm_right] values from -255 to 255
         """
-        self.pwm_l, self.pwm_r = pwm_action
+        # float(): policy actions arrive as np.float32, which would otherwise
+        # spread into x/y/angle
+        self.pwm_l, self.pwm_r = float(pwm_action[0]), float(pwm_action[1])
         
         # Normalize PWM to -1.0 to 1.0
         tl = max(-1.0, min(1.0, self.pwm_l / 255.0))
@@ -58,7 +64,8 @@ class Rover:
         self.x += math.cos(rad) * self.vx * DT
         self.y += math.sin(rad) * self.vx * DT
 
-    def _create_rover_surface(self):
+    @staticmethod
+    def _create_rover_surface():
         w_px = ROVER_RADIUS * 2.4
         h_px = ROVER_RADIUS * 2
         surf = pygame.Surface((int(w_px), int(h_px)), pygame.SRCALPHA)
@@ -86,7 +93,29 @@ class Rover:
         return pygame.Rect(self.x - ROVER_RADIUS, self.y - ROVER_RADIUS, 
                            ROVER_RADIUS*2, ROVER_RADIUS*2)
 
+    @classmethod
+    def build_atlas(cls, step_deg=ROVER_SPRITE_STEP_DEG):
+        base = cls._create_rover_surface()
+        # Match the display format when there is one (faster per-pixel alpha blits)
+        convert = pygame.display.get_surface() is not None
+        
+        atlas = []
+        for i in range(int(round(360 / step_deg))):
+            img = pygame.transform.rotate(base, -i * step_deg)
+            if convert: img = img.convert_alpha()
+            atlas.append((img, img.get_width() / 2, img.get_height() / 2))
+        cls._atlas = atlas
+        cls._atlas_step = step_deg
+        return atlas
+
     def draw(self, surface):
-        rotated_image = pygame.transform.rotate(self.original_image, -self.angle)
-        new_rect = rotated_image.get_rect(center=(self.x, self.y))
-        surface.blit(rotated_image, new_rect)
\ No newline at end of file
+        if not (math.isfinite(self.x) and math.isfinite(self.y) and math.isfinite(self.angle)):
+            return None
+        
+        atlas = Rover._atlas
+        if atlas is None:
+            atlas = Rover.build_atlas()
+        
+        # Quantize heading to the nearest pre-rotated frame
+        img, hw, hh = atlas[int(round(self.angle / Rover._atlas_step)) % len(atlas)]
+        return surface.blit(img, (self.x - hw, self.y - hh))
\ No newline at end of file
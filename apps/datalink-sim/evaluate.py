@@ -0,0 +1,150 @@
+"""
+Headless evaluation of PPO checkpoints on a fixed, seeded scenario set.
+
+Every checkpoint runs the same episodes (same worlds, spawns and sensor noise)
+for each difficulty preset. The scenario bank is generated once and handed
+to each pool worker at startup. Results are printed as a table and written
+as JSON.
+
+    python evaluate.py                                   # all of models/PPO
+    python evaluate.py models/PPO/ppo_rover_800000.zip --episodes 20 --workers 8
+    python evaluate.py --difficulties EASY HARD --numpy --json eval.json
+"""
+import os
+import glob
+import json
+import time
+import random
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config import *
+from core.environment import RoverEnv
+from core.model_watcher import checkpoint_step
+
+# Short IDs for the command line (DIFF_DOCKING's display name has a space)
+DIFFICULTIES = {"EASY": DIFF_EASY, "MEDIUM": DIFF_MEDIUM, "HARD": DIFF_HARD, "DOCKING": DIFF_DOCKING}
+
+def build_scenarios(difficulties, episodes, seed=0):
+    """{difficulty ID: [EnvState]} - start snapshots, seeded per episode."""
+    env = RoverEnv()
+    bank = {}
+    for name in difficulties:
+        env.current_difficulty = DIFFICULTIES[name]
+        states = []
+        for ep in range(episodes):
+            random.seed(seed * 100003 + ep)
+            env.reset(seed=seed * 100003 + ep)
+            states.append(env.get_state())
+        bank[name] = states
+    return bank
+
+# ===================================================================
+# POOL WORKER
+# ===================================================================
+_scenarios = None
+_policies = {}
+
+def _init_worker(scenarios):
+    global _scenarios
+    _scenarios = scenarios
+    try:
+        import torch
+        torch.set_num_threads(1)    # one process per core already
+    except ImportError:
+        pass
+
+def _load_policy(path, use_numpy):
+    key = (path, use_numpy)
+    if key not in _policies:
+        if use_numpy:
+            import tempfile
+            from core.numpy_policy import NumpyPolicy, export_policy
+            out = os.path.join(tempfile.mkdtemp(), "policy.npz")
+            export_policy(path, out)
+            _policies[key] = NumpyPolicy(out)
+        else:
+            from stable_baselines3 import PPO
+            _policies[key] = PPO.load(path, device="cpu").policy
+    return _policies[key]
+
+def run_episode(env, policy, state):
+    obs = env.set_state(state)
+    stage_steps = dict.fromkeys(STAGE_NAMES.values(), 0)
+    while True:
+        stage = env.current_stage
+        action, _ = policy.predict(obs, deterministic=True)
+        obs, _, done, _, _ = env.step(action)
+        stage_steps[STAGE_NAMES[stage]] += 1
+        if done: break
+    outcome = "success" if env.success else "collision" if env.collided else "timeout"
+    return outcome, env.step_count, stage_steps
+
+def evaluate(path, difficulty, use_numpy=False):
+    """Runs every scenario of one difficulty with one checkpoint."""
+    policy = _load_policy(path, use_numpy)
+    env = RoverEnv()
+    t0 = time.perf_counter()
+    episodes = [run_episode(env, policy, s) for s in _scenarios[difficulty]]
+    n = len(episodes)
+    dock_steps = [steps for outcome, steps, _ in episodes if outcome == "success"]
+    stage_s = {}
+    for name in STAGE_NAMES.values():
+        # Mean time spent in a stage, over the episodes that reached it
+        spent = [st[name] for _, _, st in episodes if st[name] > 0]
+        stage_s[name] = float(np.mean(spent)) * DT if spent else None
+    return {
+        "checkpoint": path,
+        "step": checkpoint_step(path),
+        "difficulty": difficulty,
+        "episodes": n,
+        "success_rate": len(dock_steps) / n,
+        "collision_rate": sum(o == "collision" for o, _, _ in episodes) / n,
+        "timeout_rate": sum(o == "timeout" for o, _, _ in episodes) / n,
+        "mean_steps_to_dock": float(np.mean(dock_steps)) if dock_steps else None,
+        "stage_seconds": stage_s,
+        "wall_s": time.perf_counter() - t0,
+    }
+
+# ===================================================================
+# CLI
+# ===================================================================
+def print_table(results):
+    fmt = lambda v, spec: "-" if v is None else format(v, spec)
+    print(f"{'checkpoint':>10s} {'diff':<9s}{'success':>8s}{'collide':>8s}{'timeout':>8s}{'steps':>7s}"
+          + "".join(f"{n[:5]:>7s}" for n in STAGE_NAMES.values()))
+    for r in results:
+        print(f"{r['step'] // 1000:>9d}k {r['difficulty']:<9s}{r['success_rate']:>8.0%}{r['collision_rate']:>8.0%}"
+              f"{r['timeout_rate']:>8.0%}{fmt(r['mean_steps_to_dock'], '7.0f'):>7s}"
+              + "".join(f"{fmt(r['stage_seconds'][n], '.1f') + ('s' if r['stage_seconds'][n] is not None else ' '):>7s}" for n in STAGE_NAMES.values()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("checkpoints", nargs="*", help=f"default: every {MODELS_DIR}/*.zip")
+    parser.add_argument("--difficulties", nargs="+", choices=list(DIFFICULTIES), default=list(DIFFICULTIES))
+    parser.add_argument("--episodes", type=int, default=10, help="scenarios per difficulty")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--numpy", action="store_true", help="run the policies through core.numpy_policy")
+    parser.add_argument("--json", default="eval_results.json", help="output file")
+    args = parser.parse_args()
+
+    paths = args.checkpoints or sorted(glob.glob(f"{MODELS_DIR}/*.zip"), key=checkpoint_step)
+    if not paths: raise SystemExit(f"No checkpoints in {MODELS_DIR}")
+
+    t0 = time.perf_counter()
+    bank = build_scenarios(args.difficulties, args.episodes, args.seed)
+    jobs = [(p, d) for p in paths for d in args.difficulties]
+    print(f"EVALUATING {len(paths)} checkpoints x {len(args.difficulties)} difficulties x "
+          f"{args.episodes} episodes on {args.workers} workers")
+
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=mp.get_context("spawn"),
+                             initializer=_init_worker, initargs=(bank,)) as pool:
+        futures = [pool.submit(evaluate, p, d, args.numpy) for p, d in jobs]
+        results = [f.result() for f in futures]
+
+    print_table(results)
+    with open(args.json, "w") as f:
+        json.dump({"seed": args.seed, "episodes": args.episodes, "results": results}, f, indent=2)
+    print(f"--- SAVED: {args.json} ({time.perf_counter() - t0:.1f} s) ---")
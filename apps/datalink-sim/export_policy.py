@@ -0,0 +1,57 @@
+"""
+Exports a PPO checkpoint to a torch-free NumPy policy (.npz) and checks
+that its actions match SB3's deterministic predict().
+
+    python export_policy.py models/PPO/ppo_rover_800000.zip
+    python export_policy.py models/PPO/ppo_rover_800000.zip --dtype int8 -o rover_int8.npz
+"""
+import os
+import argparse
+import numpy as np
+from core.numpy_policy import WEIGHT_DTYPES, NumpyPolicy, export_policy
+
+# Max |action difference| accepted per weight format
+PARITY_TOL = {"float32": 1e-5, "float16": 5e-3, "int8": 5e-2}
+
+def parity_observations(n, seed=0):
+    """Observations from random-action rollouts, plus uniform samples of the obs space."""
+    from core.environment import RoverEnv
+    env = RoverEnv()
+    rng = np.random.default_rng(seed)
+    obs, _ = env.reset(seed=seed)
+    rows = []
+    for _ in range(n // 2):
+        rows.append(obs)
+        obs, _, done, _, _ = env.step(rng.uniform(-1.0, 1.0, size=2))
+        if done: obs, _ = env.reset()
+    space = env.observation_space
+    rows.extend(rng.uniform(space.low, space.high, size=(n - len(rows), space.shape[0])).astype(np.float32))
+    return np.array(rows, dtype=np.float32)
+
+def check_parity(zip_path, npz_path, n=1000, seed=0):
+    from stable_baselines3 import PPO
+    model = PPO.load(zip_path, device="cpu")
+    policy = NumpyPolicy(npz_path)
+    obs = parity_observations(n, seed)
+    ref, _ = model.predict(obs, deterministic=True)
+    out, _ = policy.predict(obs)
+    return float(np.abs(ref - out).max())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("checkpoint", help="SB3 PPO .zip")
+    parser.add_argument("-o", "--output", help="output .npz (default: next to the checkpoint)")
+    parser.add_argument("--dtype", choices=WEIGHT_DTYPES, default="float32", help="weight storage format")
+    parser.add_argument("--samples", type=int, default=1000, help="observations for the parity check")
+    parser.add_argument("--no-check", action="store_true", help="skip the SB3 parity check")
+    args = parser.parse_args()
+
+    out = args.output or os.path.splitext(args.checkpoint)[0] + f"_{args.dtype}.npz"
+    export_policy(args.checkpoint, out, args.dtype)
+    print(f"EXPORTED: {out} ({os.path.getsize(out) / 1024:.1f} KiB, {args.dtype})")
+
+    if not args.no_check:
+        err = check_parity(args.checkpoint, out, args.samples)
+        ok = err <= PARITY_TOL[args.dtype]
+        print(f"PARITY: max |a_sb3 - a_numpy| = {err:.2e} (tol {PARITY_TOL[args.dtype]:.0e}) {'OK' if ok else 'FAIL'}")
+        if not ok: raise SystemExit(1)
@@ -2,24 +2,43 @@ import pygame
 import sys
 import math
 import numpy as np
-import os
-import glob
-from stable_baselines3 import PPO 
+import time
+import argparse
 from config import *
-from core.environment import RoverEnv
+from core.sim_loop import SimLoop
 from core.raycast import ray_segment_intersection
 from ui.parkpilot import draw_park_pilot
 from ui.hud import HUD
+from ui.text_cache import render_text, text_cache
+from ui.overlays import get_overlay
+from ui.dirty_rects import DirtyRects
+from ui.world_view import StaticWorldLayer, draw_lidar_rays
 from ui.buttons import Button
 
-def main():
+def main(split=False, preload_model=False):
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption(TITLE)
     clock = pygame.time.Clock()
     
-    env = RoverEnv()
-    hud = HUD()
+    # The sim runs in this process, or (split) in its own process that
+    # publishes state through shared memory while this one only draws
+    if split:
+        from core.sim_process import SimClient
+        sim = SimClient(preload_model=preload_model)
+    else:
+        sim = SimLoop()
+        # SB3/torch are only imported once a model is wanted: at startup with
+        # --preload-model, otherwise on the first AI button press
+        if preload_model: sim.watch_models()
+    env = sim.env
+    last_world_id = sim.world_id
+    
+    dirty = DirtyRects()
+    hud = HUD(dirty)
+    bg_layer = StaticWorldLayer()
+    beam_world = None   # (obstacles, dock) the pooled IR beam overlay was cast for
+    beam_box = None
     
     STATE_RUNNING = 0
     STATE_MENU = 1
@@ -33,45 +52,14 @@ def main():
     
     setting_spawn_on_dock = False
     show_sensors = False 
-    dock_timer = 0
-    has_left_dock = False
     
-    ai_train_active = False
-    ai_model = None
-
-    # --- HELPER: FIND LATEST MODEL ---
-    def load_latest_model():
-        nonlocal ai_model
-        models_dir = "models/PPO"
-        
-        if not os.path.exists(models_dir):
-            print(f"Waiting for training... Directory {models_dir} not found yet.")
-            return False
-
-        # Get list of all .zip files
-        list_of_files = glob.glob(f'{models_dir}/*.zip') 
-        
-        if not list_of_files:
-            print("Waiting for training... No models found in folder yet.")
-            return False
-
-        # Find the one with the most recent modification time
-        latest_file = max(list_of_files, key=os.path.getmtime)
-        
-        print(f"LOADING LATEST AI MODEL: {latest_file}")
-        try:
-            ai_model = PPO.load(latest_file)
-            print("Model loaded successfully!")
-            return True
-        except Exception as e:
-            print(f"Error loading model: {e}")
-            return False
-
-    # Attempt load at startup
-    load_latest_model()
+    # --- FRAME TIMING (turbo budget) ---
+    frame_start = time.perf_counter()
+    frame_dt = 0.0
+    render_time = 0.0
+    
+    ai_train_active = False     # UI copy of sim.ai_active
 
-    # Initialize environment
-    obs, _ = env.reset()
     font_menu = pygame.font.SysFont("Arial", 24)
     
     # State Switchers
@@ -79,57 +67,52 @@ def main():
         nonlocal current_state
         if current_state == STATE_RUNNING: current_state = STATE_MENU
         else: current_state = STATE_RUNNING
+        dirty.invalidate()
         
     def open_diff_menu():
         nonlocal current_state
         current_state = STATE_DIFF_MENU
+        dirty.invalidate()
 
     def set_difficulty(diff_preset):
-        nonlocal current_state, obs
-        env.current_difficulty = diff_preset
-        obs, _ = env.reset()
+        nonlocal current_state
+        sim.set_difficulty(diff_preset)
+        bg_layer.invalidate()
+        dirty.invalidate()
         current_state = STATE_RUNNING
         
     def close_diff_menu():
         nonlocal current_state
         current_state = STATE_RUNNING
+        dirty.invalidate()
 
     def set_mode(mode):
-        nonlocal current_mode, has_left_dock, obs
+        nonlocal current_mode
         current_mode = mode
-        if mode == MODE_PATH: env.spawn_on_dock_setting = True
-        else: env.spawn_on_dock_setting = setting_spawn_on_dock
-        obs, _ = env.reset()
-        has_left_dock = False
+        if mode == MODE_PATH: sim.set_spawn_on_dock(True)
+        else: sim.set_spawn_on_dock(setting_spawn_on_dock)
+        sim.reset()
+        dirty.invalidate()
         if current_state == STATE_MENU: toggle_menu()
 
     def toggle_spawn_setting():
         nonlocal setting_spawn_on_dock
         setting_spawn_on_dock = not setting_spawn_on_dock
-        env.spawn_on_dock_setting = setting_spawn_on_dock
+        sim.set_spawn_on_dock(setting_spawn_on_dock)
         
     def toggle_sensor_view():
         nonlocal show_sensors
         show_sensors = not show_sensors
+        dirty.invalidate()
 
     def toggle_ai_train():
-        nonlocal ai_train_active, current_mode, ai_model
-        
-        if ai_model is None:
-            print("AI Button Pressed: Searching for new models...")
-            success = load_latest_model()
-            if not success:
-                return 
-
-        ai_train_active = not ai_train_active
-        if ai_train_active:
-            current_mode = MODE_RTH
-            current_state = STATE_RUNNING
+        # The sim loads a model if needed; the UI follows sim.ai_active
+        sim.toggle_ai()
 
     def reset_sim():
-        nonlocal has_left_dock, obs
-        obs, _ = env.reset()
-        has_left_dock = False
+        sim.reset()
+        bg_layer.invalidate()
+        dirty.invalidate()
 
     def draw_blocked_beam(surface, start_pos, start_angle, end_angle, color, obstacles):
         points = [start_pos]
@@ -152,7 +135,8 @@ def main():
             end_y = start_pos[1] + ray_dir[1] * closest_dist
             points.append((end_x, end_y))
         if len(points) > 2:
-            pygame.draw.polygon(surface, color, points)
+            return pygame.draw.polygon(surface, color, points)
+        return pygame.Rect(int(start_pos[0]), int(start_pos[1]), 0, 0)
 
     # --- BUTTONS ---
     btn_ai        = Button(VIEWPORT_WIDTH + 20, SCREEN_HEIGHT - 220, 160, 50, "AI TRAIN: OFF", toggle_ai_train)
@@ -177,13 +161,21 @@ def main():
     ]
 
     while True:
+        now = time.perf_counter()
+        frame_dt = now - frame_start
+        frame_start = now
         events = pygame.event.get()
         
         for event in events:
             if event.type == pygame.QUIT:
+                sim.close()
                 pygame.quit(); sys.exit()
             
             if event.type == pygame.KEYDOWN and event.key == pygame.K_r: reset_sim()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_t: sim.cycle_speed()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                dirty.enabled = not dirty.enabled
+                dirty.invalidate()
 
             if current_state == STATE_RUNNING:
                 btn_ai.handle_event(event)
@@ -201,84 +193,58 @@ def main():
                 for b in diff_btns: b.handle_event(event)
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE: close_diff_menu()
 
-        if current_state == STATE_RUNNING:
-            
-            # --- AI CONTROL LOGIC ---
-            if ai_train_active and ai_model is not None:
-                # Predict action
-                action, _states = ai_model.predict(obs, deterministic=True)
-                
-                # Sanitize Output
-                if not np.isfinite(action).all():
-                    print("WARNING: AI output NaN/Inf! Resetting env.")
-                    action = np.zeros_like(action)
-                    obs, _ = env.reset()
-                
-                # Step
-                obs, reward, terminated, truncated, info = env.step(action)
-                
-                # Back-calculate PWM for UI text
-                env.rover.pwm_l = action[0] * 255
-                env.rover.pwm_r = action[1] * 255
-                
-            else:
-                # --- MANUAL CONTROL LOGIC ---
-                keys = pygame.key.get_pressed()
-                pwm_l, pwm_r = 0, 0
-                MANUAL_POWER = 255 
-                
-                if keys[pygame.K_w]: pwm_l += MANUAL_POWER; pwm_r += MANUAL_POWER
-                if keys[pygame.K_s]: pwm_l -= MANUAL_POWER; pwm_r -= MANUAL_POWER
-                if keys[pygame.K_a]: pwm_l -= MANUAL_POWER; pwm_r += MANUAL_POWER
-                if keys[pygame.K_d]: pwm_l += MANUAL_POWER; pwm_r -= MANUAL_POWER
-                if keys[pygame.K_SPACE]: pwm_l, pwm_r = 0, 0; env.rover.vx = 0
+        # AI switched on or off by the sim: follow it in the UI
+        if sim.ai_active != ai_train_active:
+            ai_train_active = sim.ai_active
+            dirty.invalidate()
+            if ai_train_active: current_mode = MODE_RTH
 
-                # Safety Assist
-                if current_mode == MODE_MANUAL:
-                    readings = env.sensors.prox.get_data()
-                    min_front = np.min(readings[0:3])
-                    min_rear = np.min(readings[3:5])
-                    THRESH_CRITICAL = 0.30
-                    FACTOR_RED = 0.2    
+        manual_action = None
+        if current_state == STATE_RUNNING and not ai_train_active:
+            # --- MANUAL CONTROL LOGIC ---
+            keys = pygame.key.get_pressed()
+            pwm_l, pwm_r = 0, 0
+            MANUAL_POWER = 255 
+            
+            if keys[pygame.K_w]: pwm_l += MANUAL_POWER; pwm_r += MANUAL_POWER
+            if keys[pygame.K_s]: pwm_l -= MANUAL_POWER; pwm_r -= MANUAL_POWER
+            if keys[pygame.K_a]: pwm_l -= MANUAL_POWER; pwm_r += MANUAL_POWER
+            if keys[pygame.K_d]: pwm_l += MANUAL_POWER; pwm_r -= MANUAL_POWER
+            brake = bool(keys[pygame.K_SPACE])
+            if brake: pwm_l, pwm_r = 0, 0
 
-                    if pwm_l > 0 or pwm_r > 0:
-                        if min_front < THRESH_CRITICAL: pwm_l, pwm_r = 0, 0
-                        elif min_front < 0.5: pwm_l *= FACTOR_RED; pwm_r *= FACTOR_RED
+            # Safety Assist
+            if current_mode == MODE_MANUAL:
+                readings = env.sensors.prox.get_data()
+                min_front = np.min(readings[0:3])
+                min_rear = np.min(readings[3:5])
+                THRESH_CRITICAL = 0.30
+                FACTOR_RED = 0.2    
 
-                    if pwm_l < 0 or pwm_r < 0:
-                        if min_rear < THRESH_CRITICAL: pwm_l, pwm_r = 0, 0
-                        elif min_rear < 0.5: pwm_l *= FACTOR_RED; pwm_r *= FACTOR_RED
-                
-                # Normalize
-                action_l = max(-1.0, min(1.0, pwm_l / 255.0))
-                action_r = max(-1.0, min(1.0, pwm_r / 255.0))
-                
-                obs, reward, terminated, truncated, info = env.step([action_l, action_r])
+                if pwm_l > 0 or pwm_r > 0:
+                    if min_front < THRESH_CRITICAL: pwm_l, pwm_r = 0, 0
+                    elif min_front < 0.5: pwm_l *= FACTOR_RED; pwm_r *= FACTOR_RED
 
-            # Check collisions/Success
-            done = terminated or truncated
-            if env.collided:
-                if current_mode == MODE_RTH: reset_sim()
-                else: reset_sim()
+                if pwm_l < 0 or pwm_r < 0:
+                    if min_rear < THRESH_CRITICAL: pwm_l, pwm_r = 0, 0
+                    elif min_rear < 0.5: pwm_l *= FACTOR_RED; pwm_r *= FACTOR_RED
             
-            if not env.success: has_left_dock = True
+            # Normalize
+            action_l = max(-1.0, min(1.0, pwm_l / 255.0))
+            action_r = max(-1.0, min(1.0, pwm_r / 255.0))
             
-            if env.success and has_left_dock:
-                dock_timer += 1
-                if dock_timer > FPS * 1: 
-                    reset_sim()
-                    dock_timer = 0
-            else: dock_timer = 0
+            manual_action = (action_l, action_r, brake)
+
+        # In split mode this only hands input over and picks up the latest state
+        sim.set_paused(current_state != STATE_RUNNING)
+        sim.tick(frame_dt, frame_start + max(0.0, 1.0 / FPS - render_time), manual_action)
+        if sim.world_id != last_world_id:
+            last_world_id = sim.world_id
+            dirty.invalidate()
 
         # Drawing
-        screen.fill(COLOR_BG)
-        for x in range(0, VIEWPORT_WIDTH, 50): pygame.draw.line(screen, COLOR_GRID, (x, 0), (x, VIEWPORT_HEIGHT))
-        for y in range(0, VIEWPORT_HEIGHT, 50): pygame.draw.line(screen, COLOR_GRID, (0, y), (VIEWPORT_WIDTH, y))
-        
-        pygame.draw.rect(screen, COLOR_WALL, (0,0, VIEWPORT_WIDTH, VIEWPORT_HEIGHT), 10)
-        for obs_rect in env.obstacles: pygame.draw.rect(screen, COLOR_OBSTACLE, obs_rect)
-        env.dock.draw(screen)
-        env.rover.draw(screen)
+        render_start = time.perf_counter()
+        screen.blit(bg_layer.get(env.obstacles, env.dock, screen), (0, 0))
         
         # --- GLOBAL PHYSICS SAFETY CHECK ---
         # If the rover has teleported to Infinity/NaN, skip ALL sensor drawing
@@ -286,37 +252,38 @@ def main():
         is_rover_valid = math.isfinite(rx) and math.isfinite(ry)
 
         if is_rover_valid:
-            draw_park_pilot(screen, env.rover, env.sensors.prox, show_sensors)
+            dirty.add_moving(env.rover.draw(screen))
+            dirty.add_moving(draw_park_pilot(screen, env.rover, env.sensors.prox, show_sensors))
+        else:
+            dirty.invalidate()
         
         if show_sensors and is_rover_valid:
-            emit_pos = env.dock.emit_pos
-            face_ang = env.dock.facing_angle
-            s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            
-            r_start = math.radians(face_ang - IR_CONE_OUTER)
-            r_end = math.radians(face_ang + IR_CONE_INNER)
-            draw_blocked_beam(s, emit_pos, r_start, r_end, (255, 0, 0, 30), env.obstacles)
-            
-            g_start = math.radians(face_ang - IR_CONE_INNER)
-            g_end = math.radians(face_ang + IR_CONE_OUTER)
-            draw_blocked_beam(s, emit_pos, g_start, g_end, (0, 255, 0, 30), env.obstacles)
+            # IR beams depend only on the world: re-cast them when it changes,
+            # then blend just their bounding box every frame
+            s = get_overlay("ir_beams", (VIEWPORT_WIDTH, VIEWPORT_HEIGHT), clear=False)
+            if beam_world is None or beam_world[0] is not env.obstacles or beam_world[1] is not env.dock:
+                emit_pos = env.dock.emit_pos
+                face_ang = env.dock.facing_angle
+                s.fill((0, 0, 0, 0))
+                
+                r_start = math.radians(face_ang - IR_CONE_OUTER)
+                r_end = math.radians(face_ang + IR_CONE_INNER)
+                r_box = draw_blocked_beam(s, emit_pos, r_start, r_end, (255, 0, 0, 30), env.obstacles)
+                
+                g_start = math.radians(face_ang - IR_CONE_INNER)
+                g_end = math.radians(face_ang + IR_CONE_OUTER)
+                g_box = draw_blocked_beam(s, emit_pos, g_start, g_end, (0, 255, 0, 30), env.obstacles)
+                
+                beam_box = r_box.union(g_box)
+                beam_world = (env.obstacles, env.dock)
             
-            screen.blit(s, (0,0))
+            screen.blit(s, beam_box.topleft, area=beam_box)
             
             # --- THE FIXED LINE ---
             # This line caused the crash. Now protected by 'is_rover_valid'.
-            pygame.draw.line(screen, (0, 255, 255, 80), (rx, ry), env.dock.emit_pos, 2)
+            dirty.add_moving(pygame.draw.line(screen, (0, 255, 255, 80), (rx, ry), env.dock.emit_pos, 2))
             
-            lidar_data = env.sensors.lidar.get_data()
-            for i, dist_norm in enumerate(lidar_data):
-                dist_px = dist_norm * LIDAR_MAX_RANGE_PX
-                angle = math.radians(env.rover.angle + env.sensors.lidar.ray_angles[i])
-                ex = rx + math.cos(angle) * dist_px; ey = ry + math.sin(angle) * dist_px
-                color = (int(255*(1.0-dist_norm)), 50, 50) if dist_norm < 1.0 else (30, 30, 30)
-                
-                # Extra check for Lidar endpoints
-                if math.isfinite(ex) and math.isfinite(ey):
-                    pygame.draw.line(screen, color, (rx, ry), (ex, ey), 1)
+            dirty.add_moving(draw_lidar_rays(screen, env.rover, env.sensors.lidar))
 
             ir_data = env.sensors.ir.get_data()
             if ir_data[0] > 0 or ir_data[1] > 0:
@@ -325,27 +292,42 @@ def main():
                 fy = ry + math.sin(f_angle) * IR_MAX_RANGE_PX
                 col = (0,255,255) if (ir_data[0] > 0 and ir_data[1] > 0) else (255,0,0) if ir_data[0]>0 else (0,255,0)
                 if math.isfinite(fx) and math.isfinite(fy):
-                    pygame.draw.line(screen, col, (rx, ry), (fx, fy), 2)
+                    dirty.add_moving(pygame.draw.line(screen, col, (rx, ry), (fx, fy), 2))
 
             if ir_data[5] > 0:
-                pygame.draw.circle(screen, (255, 0, 255), (int(rx), int(ry)), ROVER_RADIUS + 10, 2)
+                dirty.add_moving(pygame.draw.circle(screen, (255, 0, 255), (int(rx), int(ry)), ROVER_RADIUS + 10, 2))
 
             l_ray, r_ray = env.sensors.rear.get_visualization_data()
             if np.isfinite(l_ray).all():
-                pygame.draw.line(screen, (0, 255, 255), l_ray[0], l_ray[1], 2)
+                dirty.add_moving(pygame.draw.line(screen, (0, 255, 255), l_ray[0], l_ray[1], 2))
             if np.isfinite(r_ray).all():
-                pygame.draw.line(screen, (0, 255, 255), r_ray[0], r_ray[1], 2)
+                dirty.add_moving(pygame.draw.line(screen, (0, 255, 255), r_ray[0], r_ray[1], 2))
             
             rear_data = env.sensors.rear.get_data()
             if rear_data[2] > 0.5: 
-                pygame.draw.circle(screen, (0, 255, 0), (int(rx - 10), int(ry)), 4)
+                dirty.add_moving(pygame.draw.circle(screen, (0, 255, 0), (int(rx - 10), int(ry)), 4))
             if rear_data[3] > 0.5: 
-                pygame.draw.circle(screen, (0, 255, 0), (int(rx + 10), int(ry)), 4)
+                dirty.add_moving(pygame.draw.circle(screen, (0, 255, 0), (int(rx + 10), int(ry)), 4))
 
         hud.draw(screen, env, current_mode, ai_train_active)
         
-        diff_txt = hud.font_sm.render(f"DIFF: {env.current_difficulty['name']}", True, (255, 200, 50))
-        screen.blit(diff_txt, (VIEWPORT_WIDTH + 20, SCREEN_HEIGHT - 250))
+        diff_txt = render_text(hud.font_sm, f"DIFF: {env.current_difficulty['name']}", (255, 200, 50))
+        diff_rect = screen.blit(diff_txt, (VIEWPORT_WIDTH + 20, SCREEN_HEIGHT - 250))
+        dirty.watch("diff", env.current_difficulty["name"], diff_rect)
+        
+        speed = sim.speed
+        speed_txt = f"SIM [T]: {'MAX' if speed == 0 else f'{speed}x'}  {sim.sim_rate:.0f} steps/s"
+        speed_rect = screen.blit(render_text(hud.font_sm, speed_txt, COLOR_TEXT_DIM), (VIEWPORT_WIDTH + 20, SCREEN_HEIGHT - 270))
+        dirty.watch("sim_speed", speed_txt, speed_rect)
+        
+        # Hot-reloaded checkpoint: training step and how long its load took
+        if sim.model_step is not None:
+            model_txt = f"MODEL: {sim.model_step // 1000}k  ({sim.model_load_ms:.0f} ms)"
+        else: model_txt = "MODEL: NONE"
+        if sim.model_loading: model_txt += "  LOADING..."
+        elif sim.ai_pending: model_txt += "  WAITING..."
+        model_rect = screen.blit(render_text(hud.font_sm, model_txt, COLOR_TEXT_DIM), (VIEWPORT_WIDTH + 20, SCREEN_HEIGHT - 290))
+        dirty.watch("model", model_txt, model_rect)
         
         flags = [current_mode == MODE_MANUAL, current_mode == MODE_PATH, current_mode == MODE_RTH]
         hud.draw_status_panel(screen, flags)
@@ -365,36 +347,44 @@ def main():
             btn_settings.bg_color = COLOR_BTN_IDLE; btn_settings.text_color = COLOR_TEXT
             btn_toggle_view.bg_color = COLOR_BTN_IDLE; btn_toggle_view.text_color = COLOR_TEXT
 
-        btn_ai.draw(screen)
-        btn_diff.draw(screen)
-        btn_settings.draw(screen)
-        btn_toggle_view.draw(screen)
+        for b in (btn_ai, btn_diff, btn_settings, btn_toggle_view):
+            b.draw(screen)
+            dirty.watch(b, (b.text, b.hover, b.bg_color, b.hover_color, b.text_color), b.rect)
         
         if current_state == STATE_MENU:
-            s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            s = get_overlay("menu_dim", (SCREEN_WIDTH, SCREEN_HEIGHT), clear=False)
             s.fill((0, 0, 0, 180))
             screen.blit(s, (0,0))
             menu_rect = pygame.Rect(SCREEN_WIDTH//2 - 150, 100, 300, 400)
             pygame.draw.rect(screen, COLOR_UI_BG, menu_rect, border_radius=10)
             pygame.draw.rect(screen, COLOR_ACCENT, menu_rect, 2, border_radius=10)
-            title = font_menu.render("SYSTEM MENU", True, COLOR_ACCENT)
+            title = render_text(font_menu, "SYSTEM MENU", COLOR_ACCENT)
             screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 120))
             menu_btns[3].text = f"Spawn Dock: {'ON' if setting_spawn_on_dock else 'OFF'}"
             for b in menu_btns: b.draw(screen)
             
         elif current_state == STATE_DIFF_MENU:
-            s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            s = get_overlay("menu_dim", (SCREEN_WIDTH, SCREEN_HEIGHT), clear=False)
             s.fill((0, 0, 0, 180))
             screen.blit(s, (0,0))
             menu_rect = pygame.Rect(SCREEN_WIDTH//2 - 150, 100, 300, 400)
             pygame.draw.rect(screen, COLOR_UI_BG, menu_rect, border_radius=10)
             pygame.draw.rect(screen, COLOR_ACCENT, menu_rect, 2, border_radius=10)
-            title = font_menu.render("SELECT DIFFICULTY", True, COLOR_ACCENT)
+            title = render_text(font_menu, "SELECT DIFFICULTY", COLOR_ACCENT)
             screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 120))
             for b in diff_btns: b.draw(screen)
 
-        pygame.display.flip()
+        # Menus are redrawn in full every frame
+        if current_state != STATE_RUNNING: dirty.invalidate()
+        dirty.present()
+        render_time = time.perf_counter() - render_start
         clock.tick(FPS)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--split", action="store_true",
+                        help="run the sim/policy loop in its own process (shared-memory state)")
+    parser.add_argument("--preload-model", action="store_true",
+                        help="start loading the latest checkpoint at startup instead of on first AI use")
+    args = parser.parse_args()
+    main(split=args.split, preload_model=args.preload_model)
\ No newline at end of file
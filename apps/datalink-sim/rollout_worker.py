@@ -0,0 +1,27 @@
+"""
+Rollout worker for RemoteVecEnv: runs a batch of RoverEnvs and steps them for
+a learner over TCP. Start as many as you like, on any machine that can reach
+the learner; they can join and leave while training runs.
+
+    python rollout_worker.py --learner 192.168.1.20:5555 --envs 8
+    python rollout_worker.py --envs 2 --name laptop --once
+"""
+import argparse
+from config import *
+from core.remote_vec_env import run_rollout_worker
+from train_ai import make_env
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner", default=f"127.0.0.1:{REMOTE_PORT}", help="host:port of the learner")
+    parser.add_argument("--envs", type=int, default=4, help="envs this worker can run")
+    parser.add_argument("--name", default=None)
+    parser.add_argument("--retry", type=float, default=5.0, help="seconds between connection attempts")
+    parser.add_argument("--once", action="store_true", help="exit when the learner closes the session")
+    args = parser.parse_args()
+
+    host, port = args.learner.rsplit(":", 1)
+    try:
+        run_rollout_worker(host, int(port), make_env, args.envs, args.name, args.retry, args.once)
+    except KeyboardInterrupt:
+        pass
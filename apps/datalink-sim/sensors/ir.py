@@ -8,6 +8,10 @@ class IRSensor:
         self.rover = rover
         # Data: [Red, Green, unused, unused, unused, ReadyTurn]
         self.data = np.zeros(6, dtype=float) 
+        # Line of sight to the dock is re-checked only after the rover moved
+        # los_px (0: every update); obstacles don't move within an episode
+        self.los_px = 0.0
+        self._los = None    # (x, y, dock, visible)
         
     def _is_in_beam(self, dock_rel_angle, center_offset):
         if center_offset == "RED":
@@ -33,6 +37,15 @@ class IRSensor:
                     return False
         return True
 
+    def _dock_visible(self, dock, obstacles):
+        x, y = self.rover.x, self.rover.y
+        c = self._los
+        if c is not None and c[2] is dock and math.hypot(x - c[0], y - c[1]) < self.los_px:
+            return c[3]
+        visible = self._check_line_of_sight((x, y), dock.emit_pos, obstacles)
+        self._los = (x, y, dock, visible) if self.los_px > 0 else None
+        return visible
+
     def update(self, dock, obstacles):
         self.data.fill(0.0)
         
@@ -49,7 +62,7 @@ class IRSensor:
         # --- FRONT SENSOR (Approach) ---
         if dist_px < IR_MAX_RANGE_PX:
             if abs(rover_front_rel) < IR_FRONT_CONE:
-                 if self._check_line_of_sight((self.rover.x, self.rover.y), dock.emit_pos, obstacles):
+                 if self._dock_visible(dock, obstacles):
                     in_red = self._is_in_beam(dock_rel_angle, "RED")
                     in_green = self._is_in_beam(dock_rel_angle, "GREEN")
                     if in_red: self.data[0] = 1.0
@@ -12,23 +12,49 @@ class Lidar:
         # Create rays covering ONLY the front FOV (e.g., -90 to +90)
         half_fov = LIDAR_FOV / 2.0
         self.ray_angles = np.linspace(-half_fov, half_fov, LIDAR_NUM_RAYS)
+        self.noise = True
+        self.set_resolution(LIDAR_NUM_RAYS)
+        
+    def set_resolution(self, rays):
+        """
+        Rays actually cast per scan. The output stays LIDAR_NUM_RAYS beams:
+        fewer rays are interpolated across the FOV, more are spread over each
+        beam's width (rays // LIDAR_NUM_RAYS per beam) and the nearest hit kept.
+        """
+        if rays < LIDAR_NUM_RAYS:
+            half_fov = LIDAR_FOV / 2.0
+            self.cast_angles = np.linspace(-half_fov, half_fov, rays)
+            self.per_beam = 0
+        else:
+            k = rays // LIDAR_NUM_RAYS
+            width = LIDAR_FOV / (LIDAR_NUM_RAYS - 1)
+            offsets = (np.arange(k) - (k - 1) / 2.0) * width / k
+            self.cast_angles = (self.ray_angles[:, None] + offsets).ravel()
+            self.per_beam = k
         
     def update(self, obstacles):
-        for i, angle_offset in enumerate(self.ray_angles):
+        raw = np.empty(len(self.cast_angles))
+        for i, angle_offset in enumerate(self.cast_angles):
             # Calculate global angle
             global_angle = (self.rover.angle + angle_offset) % 360
             
             # True distance
-            true_dist_px = get_ray_intersection_dist(
+            raw[i] = get_ray_intersection_dist(
                 (self.rover.x, self.rover.y), 
                 global_angle, 
                 obstacles, 
                 LIDAR_MAX_RANGE_PX
             )
-            
+        
+        if self.per_beam:
+            beams = raw.reshape(LIDAR_NUM_RAYS, self.per_beam).min(axis=1)
+        else:
+            beams = np.interp(self.ray_angles, self.cast_angles, raw)
+        
+        for i, true_dist_px in enumerate(beams):
             # Add Gaussian Noise
-            noise = random.gauss(0, LIDAR_NOISE_STD_PX)
-            dist_px = true_dist_px + noise
+            dist_px = true_dist_px
+            if self.noise: dist_px += random.gauss(0, LIDAR_NOISE_STD_PX)
             
             # Clamp
             dist_px = max(0.0, min(dist_px, LIDAR_MAX_RANGE_PX))
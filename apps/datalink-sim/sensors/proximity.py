@@ -8,6 +8,7 @@ class ProximitySensor:
         self.rover = rover
         # 5 Sensors: [FrontLeft, FrontCenter, FrontRight, RearLeft, RearRight]
         self.readings = np.array([1.0]*5, dtype=float)
+        self.steps = 5      # rays per arc
         
     def update(self, obstacles):
         # Scan 3 Front Zones
@@ -22,9 +23,8 @@ class ProximitySensor:
     def _scan_arc(self, start_deg, end_deg, obstacles):
         # We raycast in Pixels
         min_d_px = PROX_MAX_RANGE_PX
-        steps = 5 
         
-        for angle in np.linspace(start_deg, end_deg, steps):
+        for angle in np.linspace(start_deg, end_deg, self.steps):
             global_angle = (self.rover.angle + angle) % 360
             d_px = get_ray_intersection_dist(
                 (self.rover.x, self.rover.y),
@@ -9,6 +9,7 @@ class RearDockingSystem:
         self.rover = rover
         # Data: [Laser_L, Laser_R, IR_L, IR_R]
         self.data = np.zeros(4, dtype=float)
+        self.noise = True
 
     def update(self, obstacles, dock):
         # Default: All Zero (System Off)
@@ -17,7 +18,13 @@ class RearDockingSystem:
         # --- 1. ACTIVATION CHECK ---
         if not self._check_activation_conditions(dock):
             return
+        self.measure(obstacles, dock)
 
+    def is_active(self, dock):
+        return self._check_activation_conditions(dock)
+
+    def measure(self, obstacles, dock):
+        """Lasers and IR receivers, without the activation check (see update())."""
         # --- PRE-CALCULATIONS ---
         rear_angle = math.radians(self.rover.angle + 180)
         dir_vec = np.array([math.cos(rear_angle), math.sin(rear_angle)])
@@ -88,7 +95,7 @@ class RearDockingSystem:
                 if dist is not None and dist < min_dist:
                     min_dist = dist
         
-        if min_dist < TOF_MAX_RANGE_PX:
+        if self.noise and min_dist < TOF_MAX_RANGE_PX:
             min_dist += random.gauss(0, TOF_NOISE_STD_PX)
         
         return max(0.0, min(1.0, min_dist / TOF_MAX_RANGE_PX))
@@ -1,24 +1,119 @@
 import numpy as np
+from collections import deque
+from time import perf_counter_ns
+from config import *
 from sensors.lidar import Lidar
 from sensors.proximity import ProximitySensor
 from sensors.uwb_ble import UWBBeacon
 from sensors.ir import IRSensor
 from sensors.rear_docking import RearDockingSystem
 
+SENSORS = ("lidar", "prox", "uwb", "ir", "rear")
+
 class SensorSuite:
-    def __init__(self, rover):
+    """
+    All rover sensors, updated once per physics step by update().
+
+    rates:   {sensor: Hz} (e.g. config.SENSOR_RATES_HZ); a sensor is only
+             measured every round(FPS / Hz) steps and holds its last reading
+             in between. None: every sensor every step.
+    latency: {sensor: s} (e.g. config.SENSOR_LATENCY_S); a measurement only
+             shows up in the readings that long after it was taken.
+    The rear docking system is only measured while its activation check
+    passes; otherwise it reads all zeros without any ray casts.
+    """
+    def __init__(self, rover, profiler=None, fidelity=SENSOR_FIDELITY, rates=None, latency=None):
+        self.profiler = profiler    # optional core.profiler.StepProfiler
         self.lidar = Lidar(rover)
         self.prox = ProximitySensor(rover)
         self.uwb = UWBBeacon(rover)
         self.ir = IRSensor(rover)
         self.rear = RearDockingSystem(rover)
+        self.set_fidelity(fidelity)
+        
+        # --- SCHEDULE (in physics steps) ---
+        rates, latency = rates or {}, latency or {}
+        self.periods = {n: max(1, round(FPS / rates[n])) if n in rates else 1 for n in SENSORS}
+        self.delays = {n: round(latency.get(n, 0.0) * FPS) for n in SENSORS}
+        self.tick = 0
+        self._next = dict.fromkeys(SENSORS, 0)
+        self._pending = {n: deque() for n in SENSORS}     # (tick due, reading)
+        
+    def set_fidelity(self, level):
+        """
+        Switches the sensor models to a SENSOR_FIDELITY_LEVELS entry (coarse,
+        standard, high). The observation layout stays the same; only the rays
+        cast, the noise and how often the IR line of sight is checked change.
+        """
+        if level not in SENSOR_FIDELITY_LEVELS:
+            raise ValueError(f"fidelity must be one of {list(SENSOR_FIDELITY_LEVELS)}")
+        f = SENSOR_FIDELITY_LEVELS[level]
+        self.fidelity = level
+        self.lidar.set_resolution(f["lidar_rays"])
+        self.prox.steps = f["prox_rays"]
+        self.lidar.noise = self.uwb.noise = self.rear.noise = f["noise"]
+        self.ir.los_px = f["los_px"]
+        self.ir._los = None
         
     def update(self, obstacles, dock):
-        self.lidar.update(obstacles)
-        self.prox.update(obstacles)
-        self.uwb.update(obstacles, dock)
-        self.ir.update(dock, obstacles)
-        self.rear.update(obstacles, dock)
+        prof = self.profiler
+        if prof: t = perf_counter_ns()
+        if self._due("lidar"): self._measure("lidar", self.lidar.update, obstacles)
+        if prof: t = prof.lap("sensor.lidar", t)
+        if self._due("prox"): self._measure("prox", self.prox.update, obstacles)
+        if prof: t = prof.lap("sensor.prox", t)
+        if self._due("uwb"): self._measure("uwb", self.uwb.update, obstacles, dock)
+        if prof: t = prof.lap("sensor.uwb", t)
+        if self._due("ir"): self._measure("ir", self.ir.update, dock, obstacles)
+        if prof: t = prof.lap("sensor.ir", t)
+        if self.rear.is_active(dock):
+            if self._due("rear"): self._measure("rear", self.rear.measure, obstacles, dock)
+        else:
+            # System off: zeros straight away, nothing in flight
+            self.rear.data.fill(0.0)
+            self._pending["rear"].clear()
+            self._next["rear"] = self.tick
+        self._publish()
+        self.tick += 1
+        if prof: prof.lap("sensor.rear", t)
+        
+    # --- SCHEDULING ---
+    def _due(self, name):
+        if self.tick < self._next[name]: return False
+        self._next[name] = self.tick + self.periods[name]
+        return True
+
+    def _measure(self, name, update, *args):
+        # With latency the fresh reading is queued and the one on show kept;
+        # the very first update (reset) is published at once
+        if not self.delays[name] or self.tick == 0:
+            update(*args)
+            return
+        shown = self._read(name)
+        update(*args)
+        self._pending[name].append((self.tick + self.delays[name], self._read(name)))
+        self._write(name, shown)
+
+    def _publish(self):
+        for name, queue in self._pending.items():
+            while queue and queue[0][0] <= self.tick:
+                self._write(name, queue.popleft()[1])
+
+    def _read(self, name):
+        # Raw readings (not normalized) so a restore reproduces get_data() exactly
+        if name == "uwb": return (self.uwb.range, self.uwb.bearing, self.uwb.confidence)
+        return self._array(name).copy()
+
+    def _write(self, name, value):
+        # Copy in place so arrays already handed out by get_data() see the change
+        if name == "uwb": self.uwb.range, self.uwb.bearing, self.uwb.confidence = value
+        else: self._array(name)[:] = value
+
+    def _array(self, name):
+        if name == "lidar": return self.lidar.distances
+        if name == "prox": return self.prox.readings
+        if name == "ir": return self.ir.data
+        return self.rear.data
         
     def get_normalized_array(self):
         l_data = self.lidar.get_data()
@@ -27,4 +122,19 @@ class SensorSuite:
         i_data = self.ir.get_data()
         r_data = self.rear.get_data()
         
-        return np.concatenate([l_data, p_data, u_data, i_data, r_data])
\ No newline at end of file
+        return np.concatenate([l_data, p_data, u_data, i_data, r_data])
+
+    def get_state(self):
+        """(lidar, prox, uwb, ir, rear, schedule): readings on show plus the scheduler's position."""
+        schedule = (self.tick, dict(self._next), {n: tuple(q) for n, q in self._pending.items()})
+        return tuple(self._read(n) for n in SENSORS) + (schedule,)
+
+    def set_state(self, state):
+        # The schedule may be left out (readings only, e.g. core.sim_process)
+        for name, value in zip(SENSORS, state):
+            self._write(name, value)
+        self.ir._los = None         # may be another world now
+        if len(state) > len(SENSORS):
+            self.tick, next_due, pending = state[len(SENSORS)]
+            self._next = dict(next_due)
+            self._pending = {n: deque(q) for n, q in pending.items()}
\ No newline at end of file
@@ -9,6 +9,7 @@ class UWBBeacon:
         self.range = 0.0
         self.bearing = 0.0
         self.confidence = 1.0
+        self.noise = True
         
     def update(self, obstacles, dock):
         # 1. Ground Truth (Pixels)
@@ -17,8 +18,8 @@ class UWBBeacon:
         true_dist_px = math.hypot(dx, dy)
         
         # 2. Add Noise (Pixels)
-        noise = random.gauss(0, UWB_NOISE_STD_PX)
-        measured_dist_px = true_dist_px + noise
+        measured_dist_px = true_dist_px
+        if self.noise: measured_dist_px += random.gauss(0, UWB_NOISE_STD_PX)
         
         # Clamp
         self.range = max(0.0, min(measured_dist_px, UWB_MAX_RANGE_PX))
@@ -0,0 +1,205 @@
+"""
+Parallel hyperparameter sweep over PPO settings and RoverEnv stage rewards.
+
+Trials are sampled at random from SPACE and run on a process pool, one CPU
+each (DummyVecEnv, one torch thread), until they use up --cpu-budget seconds
+of CPU time. All trials train and evaluate on the same memory-mapped world
+bank (training worlds and a disjoint eval set), with the same seeds, so the
+only difference between them is the sampled configuration.
+
+After every --eval-every timesteps a trial measures its eval success rate.
+A trial whose rate is below the --prune-quantile of the other trials at the
+same evaluation (median rule) is stopped early and its CPU goes to the next.
+
+    python sweep.py --trials 16 --workers 8 --cpu-budget 1800
+    python sweep.py --trials 4 --cpu-budget 120 --eval-every 2048 --eval-episodes 5
+"""
+import os
+import json
+import math
+import time
+import random
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from config import *
+from core.world_bank import WorldBank, build_world_bank
+
+# name: ("log", lo, hi) | ("choice", [values])
+SPACE = {
+    "learning_rate": ("log", 1e-4, 1e-3),
+    "ent_coef": ("log", 1e-3, 3e-2),
+    "gamma": ("choice", [0.98, 0.99, 0.995]),
+    "batch_size": ("choice", [64, 128, 256]),
+    "n_epochs": ("choice", [5, 10]),
+    "clip_range": ("choice", [0.1, 0.2, 0.3]),
+    "reward.found_beam": ("choice", [5.0, 10.0, 20.0]),
+    "reward.reached_turn": ("choice", [10.0, 20.0, 40.0]),
+    "reward.aligned": ("choice", [10.0, 20.0, 40.0]),
+    "reward.docked": ("choice", [50.0, 100.0, 200.0]),
+}
+
+def sample_params(rng):
+    params = {}
+    for name, spec in SPACE.items():
+        if spec[0] == "log":
+            params[name] = float(math.exp(rng.uniform(math.log(spec[1]), math.log(spec[2]))))
+        else:
+            params[name] = spec[1][rng.integers(len(spec[1]))]
+    return params
+
+def split_params(params):
+    """(PPO kwargs, RoverEnv reward overrides) from a flat trial config."""
+    from train_ai import PPO_KWARGS
+    ppo = dict(PPO_KWARGS)
+    rewards = {}
+    for name, value in params.items():
+        if name.startswith("reward."): rewards[name[len("reward."):]] = value
+        else: ppo[name] = value
+    return ppo, rewards
+
+# ===================================================================
+# TRIAL (pool worker)
+# ===================================================================
+def evaluate_success(policy, bank, episodes, seed):
+    """Success rate of the deterministic policy on eval worlds 0..episodes-1."""
+    from core.environment import RoverEnv
+    env = RoverEnv(world_bank=bank)
+    successes = 0
+    for i in range(episodes):
+        random.seed(seed * 100003 + i)       # sensor noise
+        obs, _ = env.reset(seed=seed * 100003 + i, options={"world": i})
+        done = False
+        while not done:
+            action, _ = policy.predict(obs, deterministic=True)
+            obs, _, done, _, _ = env.step(action)
+        successes += env.success
+    return successes / episodes
+
+def should_prune(board, lock, rung, score, args):
+    """Median rule: report `score` at `rung`; True if it is below the peers' quantile."""
+    with lock:
+        peers = list(board.get(rung, []))
+        board[rung] = peers + [score]
+    if rung < args["grace"] or len(peers) < args["min_peers"]: return False
+    return score < float(np.quantile(peers, args["prune_quantile"]))
+
+def run_trial(trial, params, args, board, lock):
+    import torch
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.monitor import Monitor
+    from stable_baselines3.common.vec_env import DummyVecEnv
+    from core.environment import RoverEnv
+    torch.set_num_threads(1)
+
+    bank = WorldBank(args["bank"])
+    eval_bank = bank.subset(0, args["eval_episodes"])
+    train_bank = bank.subset(args["eval_episodes"], len(bank))
+    ppo_kwargs, rewards = split_params(params)
+
+    random.seed(args["seed"])
+    venv = DummyVecEnv([lambda: Monitor(RoverEnv(world_bank=train_bank, rewards=rewards))] * args["n_envs"])
+    venv.seed(args["seed"])
+    model = PPO("MlpPolicy", venv, n_steps=max(ROLLOUT_STEPS // args["n_envs"], 1), seed=args["seed"], **ppo_kwargs)
+
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    history = []
+    status = "done"
+    while True:
+        model.learn(args["eval_every"], reset_num_timesteps=False)
+        success = evaluate_success(model.policy, eval_bank, args["eval_episodes"], args["seed"])
+        cpu_s = time.process_time() - cpu0
+        history.append({"timesteps": model.num_timesteps, "cpu_s": cpu_s, "success": success})
+        print(f"[trial {trial}] {model.num_timesteps} steps, {cpu_s:.0f} cpu s: success {success:.0%}", flush=True)
+        if cpu_s >= args["cpu_budget"]: break
+        if should_prune(board, lock, len(history) - 1, success, args):
+            status = "pruned"
+            break
+    venv.close()
+    return {
+        "trial": trial,
+        "params": params,
+        "status": status,
+        "best_success": max(h["success"] for h in history),
+        "final_success": history[-1]["success"],
+        "timesteps": model.num_timesteps,
+        "cpu_s": time.process_time() - cpu0,
+        "wall_s": time.perf_counter() - t0,
+        "history": history,
+    }
+
+def _init_worker():
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl+C is handled by the parent
+
+# ===================================================================
+# CLI
+# ===================================================================
+def print_summary(results, budget_cpu_s, wall_s):
+    print(f"\n{'trial':>5s} {'status':<8s}{'best':>6s}{'final':>7s}{'steps':>9s}{'cpu s':>8s}  params")
+    for r in sorted(results, key=lambda r: (-r["best_success"], r["trial"])):
+        p = " ".join(f"{k.replace('reward.', 'r.')}={v:.3g}" for k, v in r["params"].items())
+        print(f"{r['trial']:>5d} {r['status']:<8s}{r['best_success']:>6.0%}{r['final_success']:>7.0%}"
+              f"{r['timesteps']:>9d}{r['cpu_s']:>8.0f}  {p}")
+    cpu_h = sum(r["cpu_s"] for r in results) / 3600.0
+    pruned = sum(r["status"] == "pruned" for r in results)
+    # Without pruning every trial would cost what a completed one did (budget
+    # plus the overshoot of its last evaluation round)
+    done = [r["cpu_s"] for r in results if r["status"] == "done"]
+    full_s = float(np.mean(done)) if done else budget_cpu_s
+    print(f"\n{len(results)} trials ({pruned} pruned) in {cpu_h:.2f} CPU-hours, {wall_s / 3600.0:.2f} h wall: "
+          f"{len(results) / cpu_h if cpu_h else 0.0:.1f} trials per CPU-hour "
+          f"(vs {3600.0 / full_s:.1f} without pruning)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cpu-budget", type=float, default=1800.0, help="CPU seconds per trial")
+    parser.add_argument("--n-envs", type=int, default=4, help="DummyVecEnv envs per trial")
+    parser.add_argument("--eval-every", type=int, default=20480, help="timesteps between evaluations")
+    parser.add_argument("--eval-episodes", type=int, default=20, help="eval worlds (held out of training)")
+    parser.add_argument("--prune-quantile", type=float, default=0.5)
+    parser.add_argument("--min-peers", type=int, default=3, help="peer results needed before pruning")
+    parser.add_argument("--grace", type=int, default=1, help="evaluations before a trial can be pruned")
+    parser.add_argument("--bank-size", type=int, default=2000)
+    parser.add_argument("--difficulty", choices=["EASY", "MEDIUM", "HARD"], default="MEDIUM")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help=f"default: {SWEEP_DIR}/<time>.json")
+    args = parser.parse_args()
+
+    difficulty = {"EASY": DIFF_EASY, "MEDIUM": DIFF_MEDIUM, "HARD": DIFF_HARD}[args.difficulty]
+    bank_path = os.path.join(WORLD_BANK_DIR, f"{args.difficulty.lower()}_s{args.seed}_n{args.bank_size}.npy")
+    if not os.path.exists(bank_path):
+        print(f"BUILDING WORLD BANK: {bank_path}")
+        build_world_bank(bank_path, args.bank_size, difficulty, args.seed)
+
+    trial_args = {
+        "bank": bank_path, "seed": args.seed, "n_envs": args.n_envs, "cpu_budget": args.cpu_budget,
+        "eval_every": args.eval_every, "eval_episodes": args.eval_episodes,
+        "prune_quantile": args.prune_quantile, "min_peers": args.min_peers, "grace": args.grace,
+    }
+    rng = np.random.default_rng(args.seed)
+    configs = [sample_params(rng) for _ in range(args.trials)]
+    out = args.out or os.path.join(SWEEP_DIR, time.strftime("%Y%m%d_%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    print(f"SWEEP: {args.trials} trials on {args.workers} workers, {args.cpu_budget:.0f} CPU s each -> {out}")
+
+    t0 = time.perf_counter()
+    results = []
+    ctx = mp.get_context("spawn")
+    with ctx.Manager() as manager:
+        board, lock = manager.dict(), manager.Lock()
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx, initializer=_init_worker) as pool:
+            futures = [pool.submit(run_trial, i, p, trial_args, board, lock) for i, p in enumerate(configs)]
+            for f in as_completed(futures):
+                r = f.result()
+                results.append(r)
+                print(f"--- TRIAL {r['trial']} {r['status'].upper()}: best success {r['best_success']:.0%} ---")
+                with open(out, "w") as fh:
+                    json.dump({"args": vars(args), "bank": bank_path, "results": results}, fh, indent=2)
+
+    print_summary(results, args.cpu_budget, time.perf_counter() - t0)
+    print(f"--- SAVED: {out} ---")
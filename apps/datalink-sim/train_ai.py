@@ -1,12 +1,31 @@
 import gymnasium as gym
+import torch
 from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import SubprocVecEnv
 from stable_baselines3.common.monitor import Monitor # <--- Tracks success rate
-from stable_baselines3.common.env_util import make_vec_env
+from functools import partial
+from config import ROLLOUT_STEPS, STAGE_STARTS, CURRICULUM, SENSOR_FIDELITY_SCHEDULE
 from core.environment import RoverEnv
+from core.checkpoints import AsyncCheckpointer, checkpoint_files, checkpoint_state
+from core.telemetry import TelemetryWrapper, TelemetryCallback
+from core.callbacks import StageStartCallback, CurriculumCallback
+from core.curriculum import CurriculumBlock, CurriculumManager
+from core.fidelity import FidelityCallback
+from core.vec_env import load_layout, make_layout_vec_env
 import os
-import glob
-import re
+
+# PPO settings shared with autotune.py (n_steps comes from the layout)
+PPO_KWARGS = dict(
+    learning_rate=0.0003,
+    batch_size=64,
+    gamma=0.99,
+    ent_coef=0.01,
+    device="cpu",
+)
+
+# Wrap env in Monitor to enable "rollout/success_rate" logging
+# TelemetryWrapper times steps/resets inside the worker for TelemetryCallback
+def make_env(curriculum=None):
+    return TelemetryWrapper(Monitor(RoverEnv(stage_starts=STAGE_STARTS, curriculum=curriculum)))
 
 if __name__ == '__main__':
     # 1. SETUP
@@ -15,44 +34,54 @@ if __name__ == '__main__':
     if not os.path.exists(models_dir): os.makedirs(models_dir)
     if not os.path.exists(log_dir): os.makedirs(log_dir)
 
-    # 2. HARDWARE: 8 Instances for Core Ultra 7
-    NUM_ENVS = 8 
-    
-    # Wrap env in Monitor to enable "rollout/success_rate" logging
-    def make_env():
-        return Monitor(RoverEnv())
+    # 2. HARDWARE: layout picked by `python autotune.py` for this host
+    # (falls back to 8 SubprocVecEnv workers without train_layout.json)
+    layout = load_layout()
+    NUM_ENVS = layout["num_envs"]
+    N_STEPS = max(ROLLOUT_STEPS // NUM_ENVS, 1)
+    if layout["torch_threads"]: torch.set_num_threads(layout["torch_threads"])
+    print(f"LAYOUT: {NUM_ENVS} envs, {layout['vec_env']} x{layout['envs_per_worker']}, "
+          f"torch threads {torch.get_num_threads()}, n_steps {N_STEPS}")
 
-    env = make_vec_env(make_env, n_envs=NUM_ENVS, vec_env_cls=SubprocVecEnv)
+    # Adaptive difficulty: envs read the mix from this block at every reset
+    curriculum = CurriculumBlock() if CURRICULUM else None
+    manager = CurriculumManager(curriculum) if CURRICULUM else None
+    env = make_layout_vec_env(partial(make_env, curriculum=curriculum), layout)
 
     # 3. AUTO-RESUME LOGIC
-    files = glob.glob(f"{models_dir}/ppo_rover_*.zip")
-    latest_file = None
+    # Checkpoints are renamed into place once complete, so any .zip is whole;
+    # still fall back to an older one if the newest doesn't load
+    checkpointer = AsyncCheckpointer(models_dir)
+    files = checkpoint_files(models_dir)
+    model = None
     steps_done = 0
 
-    if files:
-        def get_step(name):
-            m = re.search(r"ppo_rover_(\d+).zip", name)
-            return int(m.group(1)) if m else 0
-        latest_file = max(files, key=get_step)
-        steps_done = get_step(latest_file)
-
     # 4. INITIALIZE
-    if latest_file:
-        print(f"RESUMING: {latest_file} (Steps: {steps_done})")
-        model = PPO.load(latest_file, env=env, device="cpu")
-    else:
+    for step in sorted(files, reverse=True):
+        try:
+            # n_steps follows the current layout, not the one it was saved with
+            model = PPO.load(files[step], env=env, device="cpu", custom_objects={"n_steps": N_STEPS})
+        except Exception as e:
+            print(f"SKIPPING: {files[step]} ({e})")
+            continue
+        steps_done = step
+        print(f"RESUMING: {files[step]} (Steps: {steps_done})")
+        # Pick the curriculum up where this checkpoint left it, not at EASY
+        saved = checkpoint_state(files[step]).get("curriculum")
+        if manager is not None and saved:
+            manager.load_state(saved)
+            print(f"RESUMING CURRICULUM: level {manager.level}")
+        break
+
+    if model is None:
         print("STARTING FRESH (Monitoring Enabled, Random Spawn)")
         model = PPO(
             "MlpPolicy", 
             env, 
             verbose=1, 
             tensorboard_log=log_dir,
-            learning_rate=0.0003,
-            n_steps=2048 // NUM_ENVS, 
-            batch_size=64,
-            gamma=0.99,
-            ent_coef=0.01,
-            device="cpu" 
+            n_steps=N_STEPS,
+            **PPO_KWARGS
         )
 
     # 5. TRAIN LOOP
@@ -61,12 +90,21 @@ if __name__ == '__main__':
     
     start_round = (steps_done // CHECKPOINT) + 1
     
+    # Throughput telemetry (steps/s, rollout vs update, per-worker latency, env profiler)
+    telemetry = TelemetryCallback()
+    callbacks = [telemetry]
+    if STAGE_STARTS: callbacks.append(StageStartCallback())
+    if CURRICULUM: callbacks.append(CurriculumCallback(manager))
+    if SENSOR_FIDELITY_SCHEDULE: callbacks.append(FidelityCallback(SENSOR_FIDELITY_SCHEDULE))
+    
     for i in range(start_round, TOTAL_ROUNDS + 1):
-        model.learn(total_timesteps=CHECKPOINT, reset_num_timesteps=False)
+        model.learn(total_timesteps=CHECKPOINT, reset_num_timesteps=False, callback=callbacks)
         
         current = i * CHECKPOINT
-        path = f"{models_dir}/ppo_rover_{current}"
-        model.save(path)
-        print(f"--- SAVED: {path} ---")
+        # Snapshot now, write (and score, in an evaluator process) in the
+        # background while the next round trains
+        checkpointer.save(model, current, {"curriculum": manager.state()} if manager else None)
 
-    env.close()
\ No newline at end of file
+    checkpointer.close()
+    env.close()
+    if curriculum is not None: curriculum.close(unlink=True)
\ No newline at end of file
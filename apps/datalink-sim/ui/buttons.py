@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from ui.text_cache import render_text
 
 class Button:
     def __init__(self, x, y, w, h, text, callback):
@@ -28,6 +29,6 @@ class Button:
         pygame.draw.rect(surface, current_bg, self.rect, border_radius=5)
         pygame.draw.rect(surface, (150,150,150), self.rect, 2, border_radius=5)
         
-        txt_surf = self.font.render(self.text, True, self.text_color)
+        txt_surf = render_text(self.font, self.text, self.text_color)
         txt_rect = txt_surf.get_rect(center=self.rect.center)
         surface.blit(txt_surf, txt_rect)
\ No newline at end of file
@@ -0,0 +1,51 @@
+import pygame
+from config import *
+
+class DirtyRects:
+    """
+    Collects the screen regions that changed this frame and presents only
+    those with pygame.display.update(rects). Falls back to a full flip after
+    invalidate() (reset, menu / view changes) or when disabled.
+    """
+    def __init__(self, enabled=RENDER_DIRTY_RECTS):
+        self.enabled = enabled
+        self.full = True
+        self._rects = []
+        self._moving = []
+        self._prev_moving = []
+        self._values = {}
+
+    def invalidate(self):
+        self.full = True
+
+    def add(self, rect):
+        if rect is not None: self._rects.append(rect)
+
+    def add_moving(self, rect):
+        # Also refreshed next frame, so the old position gets erased
+        if rect is not None: self._moving.append(rect)
+
+    def watch(self, key, value, rect):
+        # Dirty only when the displayed value differs from last frame; the
+        # last frame's rect is pushed too, so shorter text erases the longer
+        rect = pygame.Rect(rect)
+        last = self._values.get(key)
+        if last is None or last[0] != value:
+            self._rects.append(rect.union(last[1]) if last else rect)
+        self._values[key] = (value, rect)
+
+    def present(self):
+        rects = self._rects + self._moving + self._prev_moving
+        if not self.full and self.enabled:
+            # Overlapping rects are pushed twice; past ~half the screen a flip is cheaper
+            area = sum(pygame.Rect(r).width * pygame.Rect(r).height for r in rects)
+            self.full = area > SCREEN_WIDTH * SCREEN_HEIGHT // 2
+        
+        if self.full or not self.enabled:
+            pygame.display.flip()
+            self.full = False
+        else:
+            pygame.display.update(rects)
+        self._prev_moving = self._moving
+        self._moving = []
+        self._rects = []
@@ -1,9 +1,11 @@
 import pygame
 import numpy as np
 from config import *
+from ui.text_cache import render_text
+from ui.overlays import get_overlay
 
 class HUD:
-    def __init__(self):
+    def __init__(self, dirty=None):
         self.font_sm = pygame.font.SysFont("Consolas", 12)
         self.font_md = pygame.font.SysFont("Consolas", 14, bold=True)
         self.font_lg = pygame.font.SysFont("Arial", 20, bold=True)
@@ -18,20 +20,28 @@ class HUD:
         self.last_valid_center = 0.0
         self.last_valid_angle = 0.0
         self.last_active_time = 0
+        
+        # Optional ui.dirty_rects.DirtyRects: fields report their rect when they change
+        self.dirty = dirty
+
+    def _watch(self, key, value, rect):
+        if self.dirty is not None:
+            self.dirty.watch(key, value, rect)
 
     def draw_status_panel(self, surface, flags):
         x, y = 20, 20
         w, h = 200, 140
-        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        s = get_overlay("status_panel", (w, h), clear=False)
         s.fill((20, 24, 28, 200)) 
         surface.blit(s, (x, y))
         pygame.draw.rect(surface, COLOR_UI_BORDER, (x, y, w, h), 2)
-        title = self.font_md.render("SYSTEM MODES", True, COLOR_ACCENT)
+        self._watch("status_panel", tuple(flags), (x, y, w, h))
+        title = render_text(self.font_md, "SYSTEM MODES", COLOR_ACCENT)
         surface.blit(title, (x + 10, y + 10))
         labels = ["MANUAL MODE", "PATHFINDING", "RTH (AI)"]
         curr_y = y + 40
         for i, is_active in enumerate(flags):
-            lbl = self.font_sm.render(labels[i], True, COLOR_TEXT_MAIN)
+            lbl = render_text(self.font_sm, labels[i], COLOR_TEXT_MAIN)
             surface.blit(lbl, (x + 10, curr_y + 5))
             switch_w, switch_h = 40, 20
             switch_x = x + w - 50
@@ -51,13 +61,14 @@ class HUD:
         y = 20
         
         # Header
-        title = self.font_lg.render("DATALINK OS", True, COLOR_ACCENT)
+        title = render_text(self.font_lg, "DATALINK OS", COLOR_ACCENT)
         surface.blit(title, (x_pad, y))
         y += 40
-        lbl = self.font_sm.render("ACTIVE MODE:", True, COLOR_TEXT_DIM)
+        lbl = render_text(self.font_sm, "ACTIVE MODE:", COLOR_TEXT_DIM)
         surface.blit(lbl, (x_pad, y))
-        mode_txt = self.font_md.render(return_mode_name, True, (255, 200, 50))
+        mode_txt = render_text(self.font_md, return_mode_name, (255, 200, 50))
         surface.blit(mode_txt, (x_pad + 90, y))
+        self._watch("mode", return_mode_name, (x_pad + 90, y, UI_PANEL_WIDTH - 110, 20))
         y += 40
         
         status_color = (100, 255, 100) if not env.collided else (255, 50, 50)
@@ -65,24 +76,27 @@ class HUD:
         if env.success: status_txt = "DOCKED"; status_color = COLOR_ACCENT
         pygame.draw.rect(surface, (30, 35, 40), (x_pad, y, 160, 30), border_radius=4)
         pygame.draw.rect(surface, status_color, (x_pad + 5, y + 5, 20, 20), border_radius=2)
-        lbl = self.font_md.render(status_txt, True, COLOR_TEXT_MAIN)
+        lbl = render_text(self.font_md, status_txt, COLOR_TEXT_MAIN)
         surface.blit(lbl, (x_pad + 35, y + 7))
+        self._watch("status", (status_txt, status_color), (x_pad, y, 160, 30))
         y += 50
         
         # Telemetry
         def draw_label_value(label, value, unit=""):
             nonlocal y
-            l_surf = self.font_sm.render(label, True, COLOR_TEXT_DIM)
-            v_surf = self.font_md.render(f"{value}{unit}", True, COLOR_TEXT_MAIN)
+            l_surf = render_text(self.font_sm, label, COLOR_TEXT_DIM)
+            v_surf = render_text(self.font_md, f"{value}{unit}", COLOR_TEXT_MAIN)
             surface.blit(l_surf, (x_pad, y))
             surface.blit(v_surf, (x_pad + 80, y))
+            self._watch(label, f"{value}{unit}", (x_pad + 80, y, UI_PANEL_WIDTH - 100, 20))
             y += 20
         draw_label_value("SPEED", f"{env.rover.vx:.2f}", " m/s")
         draw_label_value("PWM L/R", f"{int(env.rover.pwm_l)} | {int(env.rover.pwm_r)}")
         draw_label_value("HEADING", f"{int(env.rover.angle)}", "°")
         y += 20
-        lbl = self.font_sm.render(f"DIST: {env.last_dist:.1f}m", True, COLOR_TEXT_DIM)
-        surface.blit(lbl, (x_pad, y))
+        dist_txt = f"DIST: {env.last_dist:.1f}m"
+        lbl = render_text(self.font_sm, dist_txt, COLOR_TEXT_DIM)
+        self._watch("dist", dist_txt, surface.blit(lbl, (x_pad, y)))
         y += 30
 
         # --- ILS DISPLAY ---
@@ -107,9 +121,10 @@ class HUD:
         elif ir_data[1] > 0:
             msg = "<< FLY LEFT"
             msg_col = (100, 255, 100)
-        txt = self.font_md.render(msg, True, msg_col)
+        txt = render_text(self.font_md, msg, msg_col)
         rect = txt.get_rect(center=(x_pad + 80, y + 15))
         surface.blit(txt, rect)
+        self._watch("ils", (msg, r_col, g_col), (x_pad, y, 160, 30))
         y += 40
         
         # --- DOCKING GUIDANCE (Rear) ---
@@ -181,7 +196,7 @@ class HUD:
         self.smooth_angle += (target_angle - self.smooth_angle) * 0.05
 
         y += 10
-        lbl = self.font_sm.render("REAR GUIDANCE", True, COLOR_TEXT_DIM)
+        lbl = render_text(self.font_sm, "REAR GUIDANCE", COLOR_TEXT_DIM)
         surface.blit(lbl, (x_pad, y))
         y += 20
         
@@ -199,13 +214,14 @@ class HUD:
             if color != (80, 80, 80): 
                 pygame.draw.rect(surface, color, (cursor_x - 3, y, 6, 15))
             
-            lbl_surf = self.font_sm.render(label, True, (180, 180, 180))
-            stat_surf = self.font_sm.render(status_txt, True, color)
+            lbl_surf = render_text(self.font_sm, label, (180, 180, 180))
+            stat_surf = render_text(self.font_sm, status_txt, color)
             
             surface.blit(lbl_surf, (x_pad, y - 12))
             # Fixed text position to align right
             txt_w = stat_surf.get_width()
             surface.blit(stat_surf, (x_pad + bar_w - txt_w, y - 12))
+            self._watch(label, (int(cursor_x), status_txt, color), (x_pad, y - 12, bar_w, 27))
 
         draw_guidance_bar("CENTER", self.smooth_center, center_status, center_col, is_active)
         y += 35
@@ -214,10 +230,11 @@ class HUD:
 
         # Warning
         prox_data = env.sensors.prox.get_data()
-        if np.any(prox_data < 0.3):
-            if (pygame.time.get_ticks() // 250) % 2 == 0:
-                warn_rect = pygame.Rect(VIEWPORT_WIDTH - 160, 20, 140, 40)
-                pygame.draw.rect(surface, (255, 50, 50, 100), warn_rect, border_radius=4)
-                pygame.draw.rect(surface, (255, 255, 255), warn_rect, 2, border_radius=4)
-                w_txt = self.font_md.render("PROXIMITY ALERT", True, (255, 255, 255))
-                surface.blit(w_txt, (warn_rect.x + 10, warn_rect.y + 12))
\ No newline at end of file
+        warn_rect = pygame.Rect(VIEWPORT_WIDTH - 160, 20, 140, 40)
+        warn_on = bool(np.any(prox_data < 0.3)) and (pygame.time.get_ticks() // 250) % 2 == 0
+        self._watch("prox_warn", warn_on, warn_rect)
+        if warn_on:
+            pygame.draw.rect(surface, (255, 50, 50, 100), warn_rect, border_radius=4)
+            pygame.draw.rect(surface, (255, 255, 255), warn_rect, 2, border_radius=4)
+            w_txt = render_text(self.font_md, "PROXIMITY ALERT", (255, 255, 255))
+            surface.blit(w_txt, (warn_rect.x + 10, warn_rect.y + 12))
\ No newline at end of file
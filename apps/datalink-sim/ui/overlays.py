@@ -0,0 +1,18 @@
+import pygame
+
+# Persistent SRCALPHA surfaces, one per overlay name. Reused every frame
+# instead of allocating (and blending) a fresh full-screen surface.
+_surfaces = {}
+
+def get_overlay(name, size, clear=True):
+    """
+    Returns the pooled transparent surface for `name`.
+    It is reallocated only when `size` changes and cleared unless clear=False.
+    """
+    surf = _surfaces.get(name)
+    if surf is None or surf.get_size() != size:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        _surfaces[name] = surf
+    elif clear:
+        surf.fill((0, 0, 0, 0))
+    return surf
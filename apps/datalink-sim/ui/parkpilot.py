@@ -2,6 +2,7 @@ import pygame
 import math
 import numpy as np
 from config import *
+from ui.overlays import get_overlay
 
 def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
     # SAFETY CHECK 1: If the rover itself is "broken" (NaN position), stop immediately.
@@ -11,8 +12,14 @@ def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
     center = (rover.x, rover.y)
     readings = prox_sensor.get_data() 
 
-    # Create a temporary surface for transparency
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    outer_r = ROVER_RADIUS + 40
+    inner_r = ROVER_RADIUS + 10
+
+    # Pooled transparent surface covering only the arcs around the rover
+    half = outer_r + 2
+    overlay = get_overlay("park_pilot", (half * 2, half * 2))
+    ox = int(center[0]) - half
+    oy = int(center[1]) - half
 
     def draw_digital_arc(start_angle_rel, end_angle_rel, reading, num_segments=4):
         # SAFETY CHECK 2: If sensor reading is invalid, skip this arc
@@ -34,9 +41,6 @@ def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
             elif reading < 0.8: base_color = COLOR_PP_SAFE
             else: return # Don't draw
             
-        outer_r = ROVER_RADIUS + 40
-        inner_r = ROVER_RADIUS + 10
-        
         total_span = end_angle_rel - start_angle_rel
         seg_span = total_span / num_segments
         gap = 2
@@ -62,7 +66,7 @@ def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
                     # SAFETY CHECK 3: Check every single point
                     if not (math.isfinite(px) and math.isfinite(py)):
                         return 
-                    points.append((px, py))
+                    points.append((px - ox, py - oy))
                 
                 # Inner Arc
                 for s in range(steps + 1):
@@ -74,7 +78,7 @@ def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
                     
                     if not (math.isfinite(px) and math.isfinite(py)):
                         return
-                    points.append((px, py))
+                    points.append((px - ox, py - oy))
                 
                 if len(points) > 2:
                     pygame.draw.polygon(overlay, base_color, points)
@@ -93,4 +97,4 @@ def draw_park_pilot(surface, rover, prox_sensor, show_all_sensors):
     draw_digital_arc(*PP_ANGLES_REAR[0], readings[3], 3) 
     draw_digital_arc(*PP_ANGLES_REAR[1], readings[4], 3) 
     
-    surface.blit(overlay, (0,0))
\ No newline at end of file
+    return surface.blit(overlay, (ox, oy))
\ No newline at end of file
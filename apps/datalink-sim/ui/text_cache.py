@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from config import *
+
+class TextCache:
+    """
+    Bounded LRU of rendered text surfaces keyed by (font, text, color).
+    Static labels are rendered once; values are re-rendered only when they change.
+    """
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        
+        self.misses += 1
+        surf = font.render(text, True, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Shared by HUD, buttons and menus. Returned surfaces must not be drawn on.
+text_cache = TextCache()
+
+def render_text(font, text, color):
+    return text_cache.render(font, text, tuple(color))
@@ -0,0 +1,55 @@
+import pygame
+import math
+from config import *
+
+def draw_static_world(surface, obstacles, dock):
+    """
+    Everything in the viewport that only changes on reset:
+    background, grid, wall border, obstacles and dock.
+    """
+    surface.fill(COLOR_BG)
+    for x in range(0, VIEWPORT_WIDTH, 50): pygame.draw.line(surface, COLOR_GRID, (x, 0), (x, VIEWPORT_HEIGHT))
+    for y in range(0, VIEWPORT_HEIGHT, 50): pygame.draw.line(surface, COLOR_GRID, (0, y), (VIEWPORT_WIDTH, y))
+    
+    pygame.draw.rect(surface, COLOR_WALL, (0,0, VIEWPORT_WIDTH, VIEWPORT_HEIGHT), 10)
+    for obs_rect in obstacles: pygame.draw.rect(surface, COLOR_OBSTACLE, obs_rect)
+    dock.draw(surface)
+
+class StaticWorldLayer:
+    """
+    Cached draw_static_world() surface. Rebuilt only when the world objects
+    change (env.reset() creates new ones), so a frame starts with one blit.
+    """
+    def __init__(self, size=(VIEWPORT_WIDTH, VIEWPORT_HEIGHT)):
+        self.size = size
+        self.surface = None
+        self._world = None
+
+    def invalidate(self):
+        self._world = None
+
+    def get(self, obstacles, dock, target):
+        if self.surface is None:
+            # Same pixel format as the target so the blit is a plain copy
+            self.surface = pygame.Surface(self.size, 0, target)
+            self._world = None
+        
+        world = self._world
+        if world is None or world[0] is not obstacles or world[1] is not dock:
+            draw_static_world(self.surface, obstacles, dock)
+            self._world = (obstacles, dock)
+        return self.surface
+
+def draw_lidar_rays(surface, rover, lidar):
+    rx, ry = rover.x, rover.y
+    box = pygame.Rect(int(rx), int(ry), 0, 0)
+    for i, dist_norm in enumerate(lidar.get_data()):
+        dist_px = dist_norm * LIDAR_MAX_RANGE_PX
+        angle = math.radians(rover.angle + lidar.ray_angles[i])
+        ex = rx + math.cos(angle) * dist_px; ey = ry + math.sin(angle) * dist_px
+        color = (int(255*(1.0-dist_norm)), 50, 50) if dist_norm < 1.0 else (30, 30, 30)
+        
+        # Extra check for Lidar endpoints
+        if math.isfinite(ex) and math.isfinite(ey):
+            box.union_ip(pygame.draw.line(surface, color, (rx, ry), (ex, ey), 1))
+    return box